@@ -4,7 +4,6 @@ from doespy.etl.steps.transformers import Transformer
 
 import pandas as pd
 from typing import Dict, List
-import matplotlib.pyplot as plt
 
 
 class MyTransformer(Transformer):
@@ -2,12 +2,14 @@ import typing
 from doespy.etl.steps.colcross.colcross import BaseColumnCrossPlotLoader, SubplotConfig
 from doespy.etl.steps.colcross.hooks import CcpHooks
 
-from typing import Dict, List, Union
+from typing import Dict, List, Union, TYPE_CHECKING
 
 import gossip
-from matplotlib import pyplot as plt
 import pandas as pd
 
+if TYPE_CHECKING:
+    from matplotlib import pyplot as plt
+
 
 class MyCustomSubplotConfig(SubplotConfig):
 
@@ -39,7 +41,7 @@ class MyCustomColumnCrossPlotLoader(BaseColumnCrossPlotLoader):
 
 @MyCustomColumnCrossPlotLoader.blueprint().register(CcpHooks.SubplotPostChart)
 def apply_watermark(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     plot_config,
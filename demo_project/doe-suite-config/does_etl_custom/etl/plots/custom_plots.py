@@ -1,6 +1,5 @@
 from typing import Dict
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from doespy.etl.steps.loaders import PlotLoader
 
@@ -14,6 +13,8 @@ class DemoLatencyPlotLoader(PlotLoader):
             self.save_plot(fig, filename="test", output_dir=output_dir)
 
     def plot(self, df):
+        # (matplotlib is imported when plotting and not when the ETL steps are loaded)
+        import matplotlib.pyplot as plt
 
         # for a single entry the std is NaN
         df["latency_std"].fillna(0, inplace=True)
@@ -72,6 +73,8 @@ class CoordinateLoader(PlotLoader):
             )
 
     def plot(self, df):
+        import matplotlib.pyplot as plt
+
         fig = self.default_fig()
         plt.scatter(df["x"], df["y"], c=df["color"], alpha=0.3)
         return fig
@@ -43,4 +43,33 @@ def include_vars(base, vars):
         else:
             skipped.append(info_str)
 
-    return skipped, included
\ No newline at end of file
+    return skipped, included
+
+
+def merge_hash(x, y, recursive=True):
+    """Returns a new dict with the entries of `y` merged into `x` (`y` takes precedence, lists are replaced).
+
+    Same semantics as `ansible.utils.vars.merge_hash` (with list_merge="replace")
+    without importing ansible (i.e., fast startup of the design commands).
+    """
+
+    assert isinstance(x, abc.MutableMapping) and isinstance(y, abc.MutableMapping), \
+        f"merge_hash requires two dicts: {type(x).__name__} and {type(y).__name__}"
+
+    if x == {} or x == y:
+        return y.copy()
+    if y == {}:
+        return x
+
+    x = x.copy()
+    if not recursive:
+        x.update(y)
+        return x
+
+    for key, y_value in y.items():
+        x_value = x.get(key)
+        if isinstance(x_value, abc.MutableMapping) and isinstance(y_value, abc.MutableMapping):
+            x[key] = merge_hash(x_value, y_value, recursive=True)
+        else:
+            x[key] = y_value
+    return x
@@ -19,7 +19,7 @@ import pandas as pd
 
 from doespy import util
 from doespy import info
-from doespy.etl.etl_base import _load_available_processes
+from doespy.etl.etl_base import _load_available_processes, _parse_memory_budget
 
 
 
@@ -284,6 +284,18 @@ class ETLPipelineBase(MyETLBaseModel):
     loaders: Dict[LoaderId, Annotated[Union[Annotated[List[IncludeEtlSource], Tag("include")], Annotated[LoaderDesign, Tag("loader")], Annotated[Any, Tag("EXTERNAL")]], Discriminator(get_loader_disc_value), ]] = {}
     model_config = ConfigDict(extra="forbid", use_enum_values=False)
 
+    memory_budget: Optional[Union[int, str]] = None
+    """Executes the pipeline in a streaming fashion with bounded memory, e.g., 4GB.
+    The results are extracted in chunks and chunk-safe transformers
+    (e.g., ``df.query``, ``df.filter``, or ``GroupByAggTransformer``) are applied on each chunk.
+    """
+
+    @field_validator("memory_budget")
+    @classmethod
+    def check_memory_budget(cls, v):
+        _parse_memory_budget(v)
+        return v
+
 
 
     @model_validator(mode="after")
@@ -4,9 +4,9 @@ import collections
 import jinja2
 import json
 import subprocess
-from ansible.utils.vars import merge_hash
 
 from doespy import util
+from doespy.design.dutil import merge_hash
 
 from typing import List
 from typing import Dict
@@ -1,7 +1,5 @@
 import argparse
-from doespy.etl import etl_base
-
-from doespy import util
+from doespy.etl import etl_base, etl_stats, etl_watch
 
 
 def main():
@@ -10,6 +8,12 @@ def main():
     parser.add_argument("--suite", type=str, required=False)
     parser.add_argument("--id", type=str, required=False)
     parser.add_argument("--all", action="store_true", required=False)
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        required=False,
+        help="Run as a service that runs the ETL of a suite whenever new results arrive (or on a request from the playbook)",
+    )
 
     # by setting the --load_from_design flag, we can make the etl pipeline be run using
     # # the etl definition in `doe-suite-config/designs`
@@ -22,8 +26,72 @@ def main():
 
     parser.add_argument("--output_path", type=str, required=False)
 
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Parse all result files again instead of reusing the extraction cache of unchanged files",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to extract the results (default: 1, i.e., no parallelism)",
+    )
+
+    parser.add_argument(
+        "--pipeline_jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes that run the pipelines concurrently (default: 1, i.e., one pipeline after another); the --jobs are split across them",
+    )
+
+    parser.add_argument(
+        "--suite_jobs",
+        type=int,
+        default=1,
+        help="With --all: number of worker processes that run the ETL of the suites concurrently (default: 1)",
+    )
+
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=5.0,
+        help="With --watch: seconds without new results of a suite before its ETL runs (default: 5)",
+    )
+
+    parser.add_argument(
+        "--poll_interval",
+        type=float,
+        default=1.0,
+        help="With --watch: seconds between two checks for new results and requests (default: 1)",
+    )
+
+    parser.add_argument(
+        "--stats_json",
+        type=str,
+        required=False,
+        help="Write the time, bytes, files, and rows per extractor and experiment to this json file (the summary is always printed)",
+    )
+
     args = parser.parse_args()
 
+    if args.watch:
+        if args.all or args.suite is not None or args.id is not None:
+            parser.error("--watch processes all suites with new results and cannot be combined with --all, --suite, or --id")
+        if args.output_path is not None:
+            parser.error("--watch writes the etl results of each suite into its results directory (no --output_path)")
+
+        etl_watch.watch(
+            etl_from_design=args.load_from_design,
+            n_workers=args.jobs,
+            n_pipeline_workers=args.pipeline_jobs,
+            use_cache=not args.no_cache,
+            poll_interval=args.poll_interval,
+            debounce=args.debounce,
+        )
+        return
+
     # ensure that exactly one of --all or (--suite and --id) are set
     if not (
         (args.all and args.id is None and args.suite is None)
@@ -33,28 +101,42 @@ def main():
             "either --all or --suite and --id are required but both are not possible"
         )
 
+    # time, bytes, files, and rows per extractor (of all suites)
+    extract_stats = {}
+
     if args.suite is not None and args.id is not None:
 
         etl_base.run_single_suite(
             suite=args.suite,
             suite_id=args.id,
             etl_output_dir=args.output_path,
-            etl_from_design=args.load_from_design
+            etl_from_design=args.load_from_design,
+            n_workers=args.jobs,
+            n_pipeline_workers=args.pipeline_jobs,
+            use_cache=not args.no_cache,
+            extract_stats=extract_stats,
         )
 
     elif args.all:
-        for x in util.get_does_results():
-            etl_base.run_single_suite(
-                suite=x["suite"],
-                suite_id=x["suite_id"],
-                etl_output_dir=args.output_path,
-                etl_from_design=args.load_from_design
-            )
+        # (skips suites that are unchanged since the last run)
+        etl_base.run_all_suites(
+            etl_output_dir=args.output_path,
+            etl_from_design=args.load_from_design,
+            n_workers=args.jobs,
+            n_pipeline_workers=args.pipeline_jobs,
+            n_suite_workers=args.suite_jobs,
+            use_cache=not args.no_cache,
+            extract_stats=extract_stats,
+        )
     else:
         raise ValueError(
             "the xor between the options should ensure that this cannot be the case"
         )
 
+    print(etl_stats.summary(extract_stats))
+    if args.stats_json is not None:
+        etl_stats.dump_json(extract_stats, args.stats_json)
+
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,22 @@
+import copy
+import fcntl
 import importlib
+import io
 import json
 import os
 import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from functools import lru_cache, partial
 from inspect import getmembers
-from typing import Dict, List
+from itertools import chain, groupby
+from typing import Dict, Iterator, List, Set, Tuple, Union
 import warnings
 
+import numpy as np
 import pandas as pd
 import ruamel.yaml
 from pydantic import ValidationError
@@ -15,7 +26,11 @@ from tqdm import tqdm
 from doespy import util
 from doespy import status
 from doespy.design import validate_extend
-from doespy.etl.steps.extractors import Extractor
+from doespy.etl import etl_cache
+from doespy.etl import etl_stats
+from doespy.etl import etl_util
+from doespy.etl.steps import extractors as etl_extractors
+from doespy.etl.steps.extractors import ERROR_FILE_WARNING, Extractor, strip_compression_suffix
 from doespy.etl.steps.loaders import Loader
 from doespy.etl.steps.transformers import Transformer
 
@@ -28,12 +43,20 @@ def run_single_suite(
     etl_output_dir: str = None,
     etl_from_design: bool = False,
     return_df: bool = False,
+    n_workers: int = 1,
+    use_cache: bool = True,
+    design_cache: Dict = None,
+    extract_stats: Dict = None,
+    n_pipeline_workers: int = 1,
 ):
 
+    if design_cache is None:
+        design_cache = {}
+
     # load a suite design and convert the $ETL$ part into a pipeline design
     # (as also used in super etl)
-    suite_design = _load_suite_design(suite, suite_id, etl_from_design)
-    pipeline_design = _etl_to_super_etl(suite, suite_id, suite_design)
+    suite_design = _load_suite_design(suite, suite_id, etl_from_design, design_cache)
+    pipeline_design = _etl_to_super_etl(suite, suite_id, copy.deepcopy(suite_design))
 
     if etl_output_dir is None:
         etl_output_dir = util.get_etl_results_dir(suite=suite, id=suite_id)
@@ -52,6 +75,11 @@ def run_single_suite(
         etl_output_pipeline_name=True,
         etl_from_design=etl_from_design,
         return_df=return_df,
+        n_workers=n_workers,
+        use_cache=use_cache,
+        design_cache=design_cache,
+        extract_stats=extract_stats,
+        n_pipeline_workers=n_pipeline_workers,
     )
 
 
@@ -66,6 +94,11 @@ def run_multi_suite(
     overwrite_suite_id_map: Dict[str, str] = None,
     return_df: bool = False,
     return_df_until_transformer_step: str = None,
+    n_workers: int = 1,
+    use_cache: bool = True,
+    design_cache: Dict = None,
+    extract_stats: Dict = None,
+    n_pipeline_workers: int = 1,
 ):
     pipeline_design = _load_super_etl_design(name=super_etl, overwrite_suite_id_map=overwrite_suite_id_map)
 
@@ -93,9 +126,116 @@ def run_multi_suite(
         etl_from_design=etl_from_design,
         return_df=return_df,
         return_df_until_transformer_step=return_df_until_transformer_step,
+        n_workers=n_workers,
+        use_cache=use_cache,
+        design_cache=design_cache,
+        extract_stats=extract_stats,
+        n_pipeline_workers=n_pipeline_workers,
     )
 
 
+def run_all_suites(
+    etl_output_dir: str = None,
+    etl_from_design: bool = False,
+    n_workers: int = 1,
+    use_cache: bool = True,
+    extract_stats: Dict = None,
+    n_pipeline_workers: int = 1,
+    n_suite_workers: int = 1,
+    suite_runs: List[Dict] = None,
+):
+    """Runs the ETL pipelines of all suite results (see `run_single_suite`),
+    or only of the `suite_runs` ([{"suite": .., "suite_id": ..}]).
+
+    With `use_cache`, a suite is skipped if its results, its suite design, and the code of the ETL steps
+    are unchanged since the last successful run (recorded in a stamp file in the etl results of the suite).
+    With ``n_suite_workers > 1``, the suites are processed concurrently in worker processes:
+    the output is printed per suite, and a failing suite does not abort the others.
+    """
+
+    # (the python files of doespy and of the custom etl steps)
+    code_key = etl_cache.code_fingerprint(_etl_steps_paths()) if use_cache and not etl_from_design else None
+
+    if suite_runs is None:
+        suite_runs = util.get_does_results()
+
+    selected = []
+    for x in suite_runs:
+        fingerprint = None
+        if code_key is not None:
+            try:
+                fingerprint = etl_cache.suite_fingerprint(x["suite"], x["suite_id"], extra=[code_key, etl_output_dir])
+            except FileNotFoundError:
+                # e.g., no suite design
+                fingerprint = None
+
+            if fingerprint is not None and etl_cache.is_stamp_current(util.get_etl_results_dir(suite=x["suite"], id=x["suite_id"]), fingerprint):
+                print(f"skip suite={x['suite']} id={x['suite_id']}: results and etl pipelines unchanged since the last run")
+                continue
+        selected.append((x, fingerprint))
+    suite_runs = selected
+
+    kwargs = {
+        "etl_output_dir": etl_output_dir,
+        "etl_from_design": etl_from_design,
+        "n_workers": n_workers,
+        "use_cache": use_cache,
+        "n_pipeline_workers": n_pipeline_workers,
+    }
+
+    if n_suite_workers is None or n_suite_workers <= 1 or len(suite_runs) <= 1:
+        # the suite designs are shared across suites
+        design_cache = {}
+        for x, fingerprint in suite_runs:
+            run_single_suite(suite=x["suite"], suite_id=x["suite_id"], design_cache=design_cache, extract_stats=extract_stats, **kwargs)
+            if fingerprint is not None:
+                etl_cache.save_stamp(util.get_etl_results_dir(suite=x["suite"], id=x["suite_id"]), fingerprint)
+        return
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=n_suite_workers) as executor:
+        futures = {
+            executor.submit(_run_suite_worker, fingerprint=fingerprint, suite=x["suite"], suite_id=x["suite_id"], **kwargs): x
+            for x, fingerprint in suite_runs
+        }
+        for future in as_completed(futures):
+            x = futures[future]
+            try:
+                log, error, suite_stats = future.result()
+            except Exception as e:
+                # e.g., the worker process died
+                log, error, suite_stats = "", f"{type(e).__name__}: {e}\n", {}
+
+            outcome = "done" if error is None else "FAILED"
+            print(f"========== suite={x['suite']} id={x['suite_id']} ({outcome}) ==========")
+            print(log, end="")
+            if error is not None:
+                print(error, end="")
+                failed.append(f"{x['suite']}_{x['suite_id']}")
+
+            if extract_stats is not None:
+                etl_stats.merge_exps(extract_stats, suite_stats)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(suite_runs)} suites failed: {failed}")
+
+
+def _run_suite_worker(fingerprint: str, **kwargs) -> Tuple[str, str, Dict]:
+    """Runs the ETL pipelines of a suite in a worker process (see `run_all_suites`).
+
+    Returns:
+        Tuple[str, str, Dict]: the output, the traceback if the suite failed (otherwise None), and the extraction stats
+    """
+
+    suite_stats = {}
+    log, error, _ = _run_captured(run_single_suite, **kwargs, extract_stats=suite_stats)
+
+    if error is None and fingerprint is not None:
+        etl_cache.save_stamp(util.get_etl_results_dir(suite=kwargs["suite"], id=kwargs["suite_id"]), fingerprint)
+
+    return log, error, suite_stats
+
+
 def run_etl(
     config_name,
     pipeline_design,
@@ -105,58 +245,182 @@ def run_etl(
     etl_from_design: bool = False,
     return_df: bool = False,
     return_df_until_transformer_step: str = None,
+    n_workers: int = 1,
+    use_cache: bool = True,
+    design_cache: Dict = None,
+    extract_stats: Dict = None,
+    n_pipeline_workers: int = 1,
 ):
 
     etl_config = pipeline_design["$ETL$"]
 
+    # the suite designs are loaded once per (suite, suite_id) for all pipelines
+    # (and the caller can share the cache across invocations, e.g., for all suites)
+    if design_cache is None:
+        design_cache = {}
+
     suite_id_map = pipeline_design["$SUITE_ID$"]
 
     output_dfs = {}
 
-    # go over pipelines and run them
-    for pipeline_name, pipeline in etl_config.items():
+    # plan the extraction: pipelines that apply the same extractors to the same experiment share the extracted df
+    plan, n_uses = _plan_pipelines(etl_config, suite_id_map)
+    shared_dfs = {}
+
+    if n_pipeline_workers is not None and n_pipeline_workers > 1 and not return_df and len(etl_config) > 1:
+        # the pipelines are independent -> run them concurrently in worker processes
+        _run_pipelines_parallel(
+            plan=plan,
+            n_uses=n_uses,
+            n_pipeline_workers=n_pipeline_workers,
+            n_workers=n_workers,
+            etl_config=etl_config,
+            suite_id_map=suite_id_map,
+            config_name=config_name,
+            etl_output_dir=etl_output_dir,
+            etl_output_config_name=etl_output_config_name,
+            etl_output_pipeline_name=etl_output_pipeline_name,
+            etl_from_design=etl_from_design,
+            use_cache=use_cache,
+            design_cache=design_cache,
+            extract_stats=extract_stats,
+        )
+        return
+
+    # with n_workers > 1, the extraction of the runs is distributed over a pool of worker processes
+    # (shared across all pipelines and experiments)
+    with _extraction_pool(n_workers) as executor:
+
+        # go over pipelines and run them
+        for pipeline_name, pipeline in etl_config.items():
+            _run_pipeline(
+                pipeline_name=pipeline_name,
+                pipeline=pipeline,
+                pipeline_plan=plan[pipeline_name],
+                suite_id_map=suite_id_map,
+                config_name=config_name,
+                etl_output_dir=etl_output_dir,
+                etl_output_config_name=etl_output_config_name,
+                etl_output_pipeline_name=etl_output_pipeline_name,
+                etl_from_design=etl_from_design,
+                return_df=return_df,
+                return_df_until_transformer_step=return_df_until_transformer_step,
+                use_cache=use_cache,
+                design_cache=design_cache,
+                extract_stats=extract_stats,
+                executor=executor,
+                shared_dfs=shared_dfs,
+                n_uses=n_uses,
+                output_dfs=output_dfs,
+            )
+
+    if return_df:
+        # for use in jupyter notebooks
+        return output_dfs
 
-        experiments = pipeline["experiments"]
 
-        extractors, transformers, loaders = load_selected_processes(
-            pipeline["extractors"], pipeline["transformers"], pipeline["loaders"]
-        )
+def _run_pipeline(
+    pipeline_name: str,
+    pipeline: Dict,
+    pipeline_plan: Dict,
+    suite_id_map: Dict,
+    config_name: str,
+    etl_output_dir: str,
+    etl_output_config_name: bool,
+    etl_output_pipeline_name: bool,
+    etl_from_design: bool,
+    return_df: bool,
+    return_df_until_transformer_step: str,
+    use_cache: bool,
+    design_cache: Dict,
+    extract_stats: Dict,
+    executor: ProcessPoolExecutor,
+    shared_dfs: Dict,
+    n_uses: Counter,
+    output_dfs: Dict,
+):
+    """Runs a single pipeline: extracts the results of its experiments, applies the transformers, and the loaders
+    (or stores the df in `output_dfs` with `return_df`).
 
-        experiments_df = []
-        etl_infos = []
+    The extracted df of an experiment is shared with later pipelines via `shared_dfs` (see `_plan_pipelines`).
+    """
 
-        # only want to run pipelines where results already exist
-        has_exp_result = False
+    experiments = pipeline["experiments"]
 
-        for suite, experiments in experiments.items():
+    extractors, transformers, loaders = pipeline_plan["steps"]
 
-            experiment_suite_id_map = _extract_experiments_suite(
-                suite, experiments, suite_id_map
-            )
-            for experiment, suite_id in experiment_suite_id_map.items():
+    # with a memory budget, the pipeline is executed in a streaming fashion (chunk by chunk)
+    memory_budget = pipeline_plan["memory_budget"]
 
-                if not has_exp_result:
-                    res_dir = util.get_suite_results_dir(suite=suite, id=suite_id)
+    experiments_df = []
+    etl_infos = []
+    pipeline_exps = []
 
-                    # check that results from at least one run are present
-                    for x in os.listdir(os.path.join(res_dir, experiment)):
-                        if x.startswith("run_"):
-                            has_exp_result = True
-                            break
+    # only want to run pipelines where results already exist
+    has_exp_result = False
 
+    for suite, experiments in experiments.items():
 
-                suite_design = _load_suite_design(suite, suite_id, etl_from_design)
+        experiment_suite_id_map = _extract_experiments_suite(
+            suite, experiments, suite_id_map
+        )
+        for experiment, suite_id in experiment_suite_id_map.items():
 
-                etl_info = {
-                    "suite": suite,
-                    "suite_id": suite_id,
-                    "pipeline": pipeline_name,
-                    "experiments": [experiment],
-                    "etl_output_dir": etl_output_dir,
-                }
-                etl_infos.append(etl_info)
+            if not has_exp_result:
+                res_dir = util.get_suite_results_dir(suite=suite, id=suite_id)
 
-                try:
+                # check that results from at least one run are present
+                for x in os.listdir(os.path.join(res_dir, experiment)):
+                    if x.startswith("run_"):
+                        has_exp_result = True
+                        break
+
+
+            suite_design = _load_suite_design(suite, suite_id, etl_from_design, design_cache)
+
+            etl_info = {
+                "suite": suite,
+                "suite_id": suite_id,
+                "pipeline": pipeline_name,
+                "experiments": [experiment],
+                "etl_output_dir": etl_output_dir,
+            }
+            etl_infos.append(etl_info)
+            pipeline_exps.append((suite, suite_id, experiment, suite_design, etl_info))
+
+    if not has_exp_result:
+        warnings.warn(f"skip executing pipeline={pipeline_name} because no experiment data available")
+        return
+
+    # the df after each transformer step is cached
+    #   -> resume from the deepest cached step (e.g., if only a loader changed)
+    step_cache_dir, step_keys, resume_df, n_steps_done = None, [], None, 0
+    if use_cache and memory_budget is None and etl_output_dir is not None and return_df_until_transformer_step is None and transformers:
+        step_cache_dir = etl_cache.get_step_cache_dir(etl_output_dir)
+        step_keys = etl_cache.transformer_keys(_pipeline_input_key(pipeline_exps, pipeline_plan["extractors_key"]), transformers)
+        for i in reversed(range(len(step_keys))):
+            cached = etl_cache.load_frame_cache(step_cache_dir, pipeline_name, step_keys[i], step_keys[i])
+            if cached is not None:
+                resume_df, _ = cached
+                n_steps_done = i + 1
+                break
+
+    for suite, suite_id, experiment, suite_design, etl_info in pipeline_exps:
+
+        if resume_df is not None:
+            # no extraction required
+            #  (but a df shared with later pipelines is only kept as long as needed)
+            extract_key = (suite, suite_id, experiment, pipeline_plan["extractors_key"])
+            n_uses[extract_key] -= 1
+            if n_uses[extract_key] <= 0:
+                shared_dfs.pop(extract_key, None)
+            continue
+
+        try:
+            if memory_budget is None:
+                extract_key = (suite, suite_id, experiment, pipeline_plan["extractors_key"])
+                df = shared_dfs.pop(extract_key, None)
+                if df is None:
                     # extract data from
                     df = extract(
                         suite=suite,
@@ -164,80 +428,426 @@ def run_etl(
                         experiments=[experiment],
                         base_experiments=suite_design,
                         extractors=extractors,
+                        executor=executor,
+                        use_cache=use_cache,
+                        extract_stats=extract_stats,
+                        pipeline=pipeline_name,
                     )
 
-                    experiments_df.append(df)
-                except Exception:
-                    print(
-                        f"An error occurred in extractor from pipeline \
-                            {pipeline_name}!",
-                        etl_info,
-                    )
-                    raise
+                n_uses[extract_key] -= 1
+                if n_uses[extract_key] > 0:
+                    # a later pipeline uses the same df
+                    #  -> keep it and pass a copy (transformers can modify the df in place)
+                    shared_dfs[extract_key] = df
+                    df = df.copy()
+            else:
+                # the chunks are only extracted when the transformers consume them
+                df = extract_chunks(
+                    suite=suite,
+                    suite_id=suite_id,
+                    experiments=[experiment],
+                    base_experiments=suite_design,
+                    extractors=extractors,
+                    executor=executor,
+                    use_cache=use_cache,
+                    chunk_bytes=memory_budget // _CHUNKS_PER_BUDGET,
+                    extract_stats=extract_stats,
+                    pipeline=pipeline_name,
+                )
 
+            experiments_df.append(df)
+        except Exception:
+            print(
+                f"An error occurred in extractor from pipeline \
+                    {pipeline_name}!",
+                etl_info,
+            )
+            raise
 
-        if not has_exp_result:
-            warnings.warn(f"skip executing pipeline={pipeline_name} because no experiment data available")
-            return
+    # ensure dir exists
+    config_post = config_name if etl_output_config_name else None
+    pipeline_post = pipeline_name if etl_output_pipeline_name else None
+
+    if etl_output_dir is None:
+        etl_output_dir_full = None
+    else:
+        etl_output_dir_full = _get_output_dir_name(
+            etl_output_dir, config_post, pipeline_post
+        )
+
+        if not os.path.exists(etl_output_dir):
+            os.makedirs(etl_output_dir)
 
-        # ensure dir exists
-        config_post = config_name if etl_output_config_name else None
-        pipeline_post = pipeline_name if etl_output_pipeline_name else None
+    etl_info = {
+        "suite": "_".join([x["suite"] for x in etl_infos]),
+        "suite_id": "_".join([str(x["suite_id"]) for x in etl_infos]),
+        "pipeline": pipeline_name,
+        "experiments": experiments,
+        "etl_output_dir": etl_output_dir_full,
+    }
 
-        if etl_output_dir is None:
-            etl_output_dir_full = None
+    try:
+        if resume_df is not None:
+            df = resume_df
+        elif memory_budget is None:
+            # (the experiments can have different categories of a category column)
+            df = etl_util.concat_frames(experiments_df)
         else:
-            etl_output_dir_full = _get_output_dir_name(
-                etl_output_dir, config_post, pipeline_post
+            # apply the chunk-safe transformers on each chunk (until the df is reduced)
+            df, transformers = _transform_chunks(
+                chain.from_iterable(experiments_df),
+                transformers,
+                memory_budget=memory_budget,
+                stop_at_step=return_df_until_transformer_step,
             )
 
-            if not os.path.exists(etl_output_dir):
-                os.makedirs(etl_output_dir)
+        # apply transformers sequentially
+        for i, x in enumerate(transformers[n_steps_done:], start=n_steps_done):
+
+            if isinstance(x["transformer"], str):
+                # possibility for df functions directly
+                df = _apply_pandas_df_transformer(
+                    df, func_name=x["transformer"], args=x["options"]
+                )
+
+            else:
+
+                if return_df_until_transformer_step is not None and x["transformer"].name == return_df_until_transformer_step:
+                    output_dfs[pipeline_name] = df.copy()
+
+                df = x["transformer"].transform(df, options=x["options"])
+
+            if step_cache_dir is not None:
+                etl_cache.save_frame_cache(step_cache_dir, pipeline_name, step_keys[i], step_keys[i], df, warning_msgs=[])
+
+        if step_cache_dir is not None:
+            # (the cached dfs of outdated steps)
+            etl_cache.prune_frame_cache(step_cache_dir, pipeline_name, keep_keys=step_keys)
+
+        if return_df and return_df_until_transformer_step is None:
+            output_dfs[pipeline_name] = df
+        else:
+            # execute all loaders on df
+            for x in loaders:
+                x["loader"].load(df, options=x["options"], etl_info=etl_info)
+
+    except Exception:
+        print(f"An error occurred in pipeline {pipeline_name}!", etl_info)
+        raise
+
+
+def _pipeline_input_key(pipeline_exps: List[Tuple], extractors_key: str) -> str:
+    """Computes a key for the extracted df of a pipeline from the fingerprints of the results of its experiments
+    (without extracting them)."""
+
+    keys = [extractors_key]
+    indexes = {}
+    for suite, suite_id, experiment, suite_design, _etl_info in pipeline_exps:
+        if (suite, suite_id) not in indexes:
+            indexes[(suite, suite_id)] = _results_index(util.get_suite_results_dir(suite=suite, id=suite_id), use_cache=True)
+        factor_columns = _parse_factors(suite_design[experiment])
+        rep_jobs = _rep_jobs(suite, suite_id, experiment, indexes[(suite, suite_id)], factor_columns)
+        keys.append(etl_cache.results_fingerprint(rep_jobs, extra=[suite, suite_id, experiment, factor_columns]))
+    return json.dumps(keys)
 
-        df = pd.concat(experiments_df)
 
-        etl_info = {
-            "suite": "_".join([x["suite"] for x in etl_infos]),
-            "suite_id": "_".join([str(x["suite_id"]) for x in etl_infos]),
-            "pipeline": pipeline_name,
-            "experiments": experiments,
-            "etl_output_dir": etl_output_dir_full,
+def _run_pipelines_parallel(plan: Dict, n_uses: Counter, n_pipeline_workers: int, n_workers: int, etl_config: Dict, **kwargs):
+    """Runs the pipelines concurrently in a pool of `n_pipeline_workers` processes.
+
+    The experiments that several pipelines extract with the same extractors are extracted once upfront
+    (with `n_workers` extraction processes) and passed to these pipelines.
+    The `n_workers` are split across the pipeline workers for their remaining extraction,
+    i.e., each pipeline worker extracts with ``n_workers // n_pipeline_workers`` processes (at least one, i.e., serial).
+
+    The output of each pipeline is buffered in the worker and printed as a block once the pipeline completes.
+    A failing pipeline does not abort the other pipelines: the failed pipelines are reported at the end.
+    """
+
+    shared_dfs = _extract_shared(
+        plan=plan,
+        n_uses=n_uses,
+        etl_config=etl_config,
+        suite_id_map=kwargs["suite_id_map"],
+        etl_from_design=kwargs["etl_from_design"],
+        use_cache=kwargs["use_cache"],
+        design_cache=kwargs["design_cache"],
+        extract_stats=kwargs["extract_stats"],
+        n_workers=n_workers,
+    )
+
+    n_workers_per_pipeline = max(1, (n_workers or 1) // n_pipeline_workers)
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=n_pipeline_workers) as executor:
+        futures = {
+            executor.submit(
+                _run_pipeline_worker,
+                pipeline_name=pipeline_name,
+                pipeline=pipeline,
+                pipeline_plan=plan[pipeline_name],
+                shared_dfs={key: df for (name, key), df in shared_dfs.items() if name == pipeline_name},
+                n_workers=n_workers_per_pipeline,
+                **kwargs,
+            ): pipeline_name
+            for pipeline_name, pipeline in etl_config.items()
         }
+        for future in as_completed(futures):
+            pipeline_name = futures[future]
+            try:
+                log, error, pipeline_stats = future.result()
+            except Exception as e:
+                # e.g., the worker process died
+                log, error, pipeline_stats = "", f"{type(e).__name__}: {e}\n", {}
+
+            outcome = "done" if error is None else "FAILED"
+            print(f"========== pipeline={pipeline_name} ({outcome}) ==========")
+            print(log, end="")
+            if error is not None:
+                print(error, end="")
+                failed.append(pipeline_name)
+
+            if kwargs["extract_stats"] is not None:
+                etl_stats.merge_exps(kwargs["extract_stats"], pipeline_stats)
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(etl_config)} pipelines failed: {failed}")
+
+
+def _extract_shared(
+    plan: Dict,
+    n_uses: Counter,
+    etl_config: Dict,
+    suite_id_map: Dict,
+    etl_from_design: bool,
+    use_cache: bool,
+    design_cache: Dict,
+    extract_stats: Dict,
+    n_workers: int,
+) -> Dict:
+    """Extracts the experiments that several pipelines extract with the same extractors (see `_plan_pipelines`).
+
+    Returns:
+        Dict: (pipeline_name, extract key) -> df (the same df for all pipelines of an extract key)
+    """
+
+    pipelines = {}
+    for pipeline_name, pipeline in etl_config.items():
+        if plan[pipeline_name]["memory_budget"] is not None:
+            continue
+        for suite, experiments in pipeline["experiments"].items():
+            for experiment, suite_id in _extract_experiments_suite(suite, experiments, suite_id_map).items():
+                extract_key = (suite, suite_id, experiment, plan[pipeline_name]["extractors_key"])
+                if n_uses[extract_key] > 1:
+                    pipelines.setdefault(extract_key, []).append(pipeline_name)
+
+    shared_dfs = {}
+    if not pipelines:
+        return shared_dfs
+
+    with _extraction_pool(n_workers) as executor:
+        for extract_key, pipeline_names in pipelines.items():
+            suite, suite_id, experiment, _ = extract_key
+            try:
+                df = extract(
+                    suite=suite,
+                    suite_id=suite_id,
+                    experiments=[experiment],
+                    base_experiments=_load_suite_design(suite, suite_id, etl_from_design, design_cache),
+                    extractors=plan[pipeline_names[0]]["steps"][0],
+                    executor=executor,
+                    use_cache=use_cache,
+                    extract_stats=extract_stats,
+                    pipeline=pipeline_names[0],
+                )
+            except Exception:
+                # the pipelines extract the experiment themselves (and report the error per pipeline)
+                continue
+            for pipeline_name in pipeline_names:
+                shared_dfs[(pipeline_name, extract_key)] = df
+
+    return shared_dfs
+
+
+def _run_pipeline_worker(n_workers: int, shared_dfs: Dict, **kwargs) -> Tuple[str, str, Dict]:
+    """Runs a single pipeline in a worker process (see `_run_pipelines_parallel`).
+
+    Returns:
+        Tuple[str, str, Dict]: the output of the pipeline, the traceback if the pipeline failed (otherwise None),
+            and the extraction stats
+    """
+
+    pipeline_stats = {} if kwargs.pop("extract_stats") is not None else None
+
+    with _extraction_pool(n_workers) as executor:
+        log, error, _ = _run_captured(
+            _run_pipeline,
+            **kwargs,
+            extract_stats=pipeline_stats,
+            executor=executor,
+            # (the dfs that were extracted upfront for several pipelines, each is used once in this pipeline)
+            shared_dfs=shared_dfs,
+            n_uses=Counter({key: 1 for key in shared_dfs}),
+            return_df=False,
+            return_df_until_transformer_step=None,
+            output_dfs={},
+        )
+
+    return log, error, pipeline_stats or {}
+
 
+def _run_captured(func, **kwargs) -> Tuple[str, str, object]:
+    """Calls `func` and captures its output (stdout, stderr, warnings, and progress bars) and a raised exception.
+
+    Returns:
+        Tuple[str, str, object]: the output, the traceback (None on success), and the return value of `func`
+    """
+
+    result, error = None, None
+
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
         try:
-            # apply transformers sequentially
-            for x in transformers:
+            result = func(**kwargs)
+        except Exception:
+            error = traceback.format_exc()
+
+    return buf.getvalue(), error, result
+
+
+def _plan_pipelines(etl_config: Dict, suite_id_map: Dict):
+    """Loads the steps of all pipelines and counts how many pipelines
+    extract each experiment with the same extractors.
+
+    Returns:
+        Tuple[Dict, Counter]: per pipeline the steps, the memory budget, and the key of the extractors,
+            and the number of pipelines per (suite, suite_id, experiment, extractors key)
+    """
+
+    plan = {}
+    n_uses = Counter()
+
+    for pipeline_name, pipeline in etl_config.items():
+
+        extractors, transformers, loaders = load_selected_processes(
+            pipeline["extractors"], pipeline["transformers"], pipeline["loaders"]
+        )
+
+        memory_budget = _parse_memory_budget(pipeline.get("memory_budget"))
+
+        plan[pipeline_name] = {
+            "steps": (extractors, transformers, loaders),
+            "memory_budget": memory_budget,
+            "extractors_key": etl_cache.extractors_key(extractors),
+        }
+
+        if memory_budget is not None:
+            # the streaming execution extracts lazily -> nothing to share
+            continue
+
+        for suite, experiments in pipeline["experiments"].items():
+            experiment_suite_id_map = _extract_experiments_suite(suite, experiments, suite_id_map)
+            for experiment, suite_id in experiment_suite_id_map.items():
+                n_uses[(suite, suite_id, experiment, plan[pipeline_name]["extractors_key"])] += 1
+
+    return plan, n_uses
 
-                if isinstance(x["transformer"], str):
-                    # possibility for df functions directly
-                    df = _apply_pandas_df_transformer(
-                        df, func_name=x["transformer"], args=x["options"]
-                    )
 
-                else:
+# the chunks of the extraction are a fraction of the memory budget
+# (leaves room for the copies within transformers and the reduced df)
+_CHUNKS_PER_BUDGET = 4
 
-                    if return_df_until_transformer_step is not None and x["transformer"].name == return_df_until_transformer_step:
-                        output_dfs[pipeline_name] = df.copy()
+# df functions that operate on each row (or on the columns) independently
+_CHUNK_SAFE_DF_FUNCTIONS = {"query", "filter", "rename", "astype", "replace", "round", "drop"}
 
-                    df = x["transformer"].transform(df, options=x["options"])
 
-            if return_df and return_df_until_transformer_step is None:
-                output_dfs[pipeline_name] = df
+def _parse_memory_budget(memory_budget) -> int:
+    """Converts a memory budget, e.g., 512MB or 4GB, into bytes."""
+
+    if memory_budget is None or isinstance(memory_budget, int):
+        return memory_budget
+
+    units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*", str(memory_budget), flags=re.IGNORECASE)
+    if m is None:
+        raise ValueError(f"invalid memory_budget={memory_budget}  (e.g., 512MB or 4GB)")
+    return int(float(m.group(1)) * units[m.group(2).upper()])
+
+
+def _is_chunk_safe(x: Dict) -> bool:
+    if isinstance(x["transformer"], str):
+        if x["transformer"] == "drop":
+            # dropping rows by the index is not local to a chunk
+            return "index" not in x["options"] and ("labels" not in x["options"] or x["options"].get("axis") in [1, "columns"])
+        return x["transformer"] in _CHUNK_SAFE_DF_FUNCTIONS
+    return x["transformer"].chunk_safe
+
+
+def _transform_chunks(chunks: Iterator[pd.DataFrame], transformers: List[Dict], memory_budget: int, stop_at_step: str = None):
+    """Streaming execution of the transformers:
+    Chunk-safe transformers are applied on each chunk and the first transformer that
+    reduces the chunks (see `Transformer.transform_chunks`) returns the reduced df.
+    Otherwise, the chunks are concatenated within the memory budget.
+
+    Returns:
+        Tuple[pd.DataFrame, List[Dict]]: the df and the transformers that remain to be applied on the df
+    """
+
+    for i, x in enumerate(transformers):
+
+        if not isinstance(x["transformer"], str) and x["transformer"].name == stop_at_step:
+            # the df before this step is returned
+            break
+
+        if _is_chunk_safe(x):
+            if isinstance(x["transformer"], str):
+                chunks = map(partial(_apply_pandas_df_transformer, func_name=x["transformer"], args=x["options"]), chunks)
             else:
-                # execute all loaders on df
-                for x in loaders:
-                    x["loader"].load(df, options=x["options"], etl_info=etl_info)
+                chunks = map(partial(x["transformer"].transform, options=x["options"]), chunks)
 
-        except Exception:
-            print(f"An error occurred in pipeline {pipeline_name}!", etl_info)
-            raise
+        elif not isinstance(x["transformer"], str):
+            df = x["transformer"].transform_chunks(chunks, options=x["options"])
+            if df is not None:
+                return df, transformers[i + 1:]
+            return _concat_chunks(chunks, memory_budget, step=x["transformer"].name), transformers[i:]
 
-    if return_df:
-        # for use in jupyter notebooks
-        return output_dfs
+        else:
+            return _concat_chunks(chunks, memory_budget, step=f"df.{x['transformer']}"), transformers[i:]
+
+    else:
+        i = len(transformers)
+
+    return _concat_chunks(chunks, memory_budget, step=None), transformers[i:]
 
 
-def _load_suite_design(suite, suite_id, etl_from_design):
+def _concat_chunks(chunks: Iterator[pd.DataFrame], memory_budget: int, step: str) -> pd.DataFrame:
+
+    dfs = []
+    nbytes = 0
+    for chunk in chunks:
+        nbytes += chunk.memory_usage(deep=True).sum()
+        if nbytes > memory_budget:
+            raise ValueError(
+                f"the df exceeds the memory_budget={memory_budget} bytes:  "
+                f"{'the loaders require' if step is None else f'transformer={step} requires'} the complete df "
+                f"(reduce the df with chunk-safe transformers, e.g., df.query, df.filter, or GroupByAggTransformer, or increase the budget)"
+            )
+        dfs.append(chunk)
+    return etl_util.concat_frames(dfs)
+
+
+def _load_suite_design(suite, suite_id, etl_from_design, design_cache=None):
+    """Loads the suite design (from the results or from the design with `etl_from_design`).
+
+    With a `design_cache`, the design is loaded once per (suite, suite_id, etl_from_design)
+    and the same object is returned on later calls (i.e., the caller must not modify it).
+    """
+
+    if design_cache is not None:
+        key = (suite, suite_id, etl_from_design)
+        if key not in design_cache:
+            design_cache[key] = _load_suite_design(suite, suite_id, etl_from_design)
+        return design_cache[key]
+
     if etl_from_design:
         suite_design, _ = validate_extend.main(
             suite=suite, only_validate_design=True, ignore_undefined_vars=True
@@ -347,6 +957,16 @@ def _get_output_dir_name(
     return output_path
 
 
+def _extraction_pool(n_workers: int):
+    """Returns a process pool for the extraction if ``n_workers > 1``,
+    otherwise a context that yields ``None`` (i.e., serial extraction)."""
+
+    if n_workers is None or n_workers <= 1:
+        return nullcontext(None)
+
+    return ProcessPoolExecutor(max_workers=n_workers)
+
+
 ############################################################################
 # Load Extractor, Transformer, and Loaders                                 #
 ############################################################################
@@ -362,9 +982,21 @@ def load_selected_processes(extractors_sel, transformers_sel, loaders_sel):
         if name not in extractors_avl:
             raise ValueError(f"extractor not found: {name}")
 
+        extractor = extractors_avl[name](**options)
+
+        patterns = extractor.file_regex
+        if not isinstance(patterns, list):
+            patterns = [patterns]
+
         d = {
-            "extractor": extractors_avl[name](**options),
+            "extractor": extractor,
             "options": options, # TODO: eventually this can be removed in a newer version
+            # the regex are compiled once per pipeline and the number of matching
+            # patterns is memoized per file name (e.g., stdout.log repeats in every job)
+            "file_regex": [re.compile(p) for p in patterns],
+            "n_matches": {},
+            # extractors with `extract_frame` return a table instead of a dict per result
+            "columnar": extractor.is_columnar(),
         }
 
         extractors.append(d)
@@ -414,14 +1046,7 @@ def load_selected_processes(extractors_sel, transformers_sel, loaders_sel):
     return extractors, transformers, loaders
 
 
-def _load_available_processes():
-
-    extractors = {}
-    transformers = {}
-    loaders = {}
-
-    import pkgutil
-    import warnings
+def _etl_steps_paths() -> List[str]:
 
     # Find location of doespy ETL classes
     import doespy
@@ -433,15 +1058,32 @@ def _load_available_processes():
     # doe-suite-config is fixed relative to DOES_PROJECT_DIR
     doe_suite_config_path = os.path.join(os.environ['DOES_PROJECT_DIR'], "doe-suite-config")
 
-    paths = [
+    return [
         doespy_parent_path,  # doe-suite provided etl steps
         doe_suite_config_path,  # custom steps
     ]
+
+
+@lru_cache(maxsize=1)
+def _load_available_processes():
+    # (memoized: the modules are imported once per process, e.g., for all pipelines of the ETL watch service)
+
+    extractors = {}
+    transformers = {}
+    loaders = {}
+
+    import pkgutil
+    import warnings
+
+    paths = _etl_steps_paths()
     with warnings.catch_warnings(record=True):
         for _importer, modname, _ispkg in pkgutil.walk_packages(
             path=paths, onerror=lambda _: None
         ):
             should_import = ETL_CUSTOM_PACKAGE in modname or "doespy" in modname
+            if modname.startswith("tests."):
+                # the tests next to the doespy package (e.g., test_does_results) do not define etl steps
+                should_import = False
             # print("Found submodule %s (is a pack/age: %s), will import %s" % (modname, _ispkg, should_import))
             if should_import:
                 _load_processes(modname, extractors, transformers, loaders)
@@ -508,110 +1150,544 @@ def extract(
     experiments: List[str],
     base_experiments: Dict,
     extractors: List[Dict],
+    executor: ProcessPoolExecutor = None,
+    use_cache: bool = True,
+    extract_stats: Dict = None,
+    pipeline: str = None,
 ) -> pd.DataFrame:
-    res_lst = []
+
+    # without a chunk size, all results are in a single chunk
+    df, = extract_chunks(
+        suite=suite,
+        suite_id=suite_id,
+        experiments=experiments,
+        base_experiments=base_experiments,
+        extractors=extractors,
+        executor=executor,
+        use_cache=use_cache,
+        extract_stats=extract_stats,
+        pipeline=pipeline,
+    )
+    return df
+
+
+def extract_chunks(
+    suite: str,
+    suite_id: str,
+    experiments: List[str],
+    base_experiments: Dict,
+    extractors: List[Dict],
+    executor: ProcessPoolExecutor = None,
+    use_cache: bool = True,
+    chunk_bytes: int = None,
+    extract_stats: Dict = None,
+    pipeline: str = None,
+) -> Iterator[pd.DataFrame]:
+    """Extracts the results of the experiments as a sequence of data frames
+    with an (estimated) size of at most ``chunk_bytes`` each.
+
+    The index of the chunks continues s.t. ``pd.concat(chunks)`` is identical to ``extract(..)``
+    (a single repetition of a run is never split across chunks).
+
+    If ``extract_stats`` is provided, the time, bytes, files, and rows per extractor
+    are added to it for each experiment (see `etl_stats`).
+
+    The error files found by an `ErrorExtractor` are reported per experiment under the name of the ``pipeline``
+    (see `_write_error_report`).
+    """
+
+    # the dtypes of the schema are applied while the columns are assembled
+    schema = _extractors_schema(extractors)
+
+    columns = _ColumnBuilder(schema)
+    n_yielded = 0
+
+    # (without an `ErrorExtractor`, the error report of other pipelines is kept)
+    #  note: the class is not imported into this module, the step registry would find it twice
+    has_error_extractor = any(isinstance(extractor_d["extractor"], etl_extractors.ErrorExtractor) for extractor_d in extractors)
 
     res_dir = util.get_suite_results_dir(suite=suite, id=suite_id)
-    existing_exps = util._list_dir_only(res_dir)
+    index = _results_index(res_dir, use_cache=use_cache)
+    existing_exps = list(index["dirs"].keys())
 
     exps_filtered = [exp for exp in existing_exps if exp in experiments]
 
-    for exp in exps_filtered:
+    if use_cache:
+        # persistent cache of the extracted results per file
+        #  -> only new or changed files need to be parsed again
+        cache_dir = etl_cache.get_cache_dir(suite=suite, suite_id=suite_id)
+        cache_key = etl_cache.extractors_key(extractors)
+
+        # persistent cache of the extracted df per experiment
+        # (not in the streaming execution which never holds the df of an experiment)
+        frame_cache_dir = etl_cache.get_frame_cache_dir(suite=suite, suite_id=suite_id) if chunk_bytes is None else None
 
-        exp_dir = util.get_suite_results_dir(suite=suite, id=suite_id, exp=exp)
+    for exp in exps_filtered:
 
-        runs = util._list_dir_only(exp_dir)
         factor_columns = _parse_factors(base_experiments[exp])
 
-        for run in tqdm(runs, desc=f"processing runs of experiment {exp}"):
-            run_dir = os.path.join(exp_dir, run)
-            reps = util._list_dir_only(run_dir)
+        exp_stats = {} if extract_stats is None else extract_stats.setdefault(f"{suite}_{suite_id}/{exp}", {})
+
+        rep_jobs = _rep_jobs(suite, suite_id, exp, index, factor_columns)
+
+        if use_cache and frame_cache_dir is not None:
+            start = time.perf_counter()
+            fingerprint = etl_cache.results_fingerprint(rep_jobs, extra=[cache_key, factor_columns])
+            cached = etl_cache.load_frame_cache(frame_cache_dir, exp, cache_key, fingerprint)
+            if cached is not None:
+                # unchanged results -> no need to look at the individual files
+                exp_df, exp_warnings = cached
+                etl_stats.record(exp_stats, etl_stats.FRAME_CACHE, rows=len(exp_df), time_s=time.perf_counter() - start)
+                error_files = _emit_warnings(exp_warnings)
+                if has_error_extractor:
+                    _write_error_report(suite, suite_id, exp, error_files, pipeline)
+                columns.add_frame(const={}, df=exp_df)
+                continue
 
-            for rep in reps:
-                rep_dir = os.path.join(run_dir, rep)
-                host_types = util._list_dir_only(rep_dir)
+        exp_cache = etl_cache.load_extract_cache(cache_dir, exp, cache_key) if use_cache else None
+        if exp_cache is not None:
+            for rep_job in rep_jobs:
+                rep_job["cache"] = exp_cache.get(rep_job["rep_path"], {})
 
-                try:
-                    config = util.load_config_yaml(path=rep_dir, file="config.json")
-                except FileNotFoundError:
-                    continue
-
-                # ignores the part of the config that shows what is varied
-                # # (if this is present)
-                if "$FACTOR_LEVEL" in config:
-                    del config["~FACTORS_LEVEL"]
-
-                config_flat = _flatten_d(config)
-
-                for host_type in host_types:
-                    host_type_dir = os.path.join(rep_dir, host_type)
-                    hosts = util._list_dir_only(host_type_dir)
-
-                    for host_idx, host in enumerate(hosts):
-                        host_dir = os.path.join(host_type_dir, host)
-                        files = util._list_files_only(host_dir)
-
-                        job_info = {
-                            "suite_name": suite,
-                            "suite_id": suite_id,
-                            "exp_name": exp,
-                            "run": int(run.split("_")[-1]),
-                            "rep": int(rep.split("_")[-1]),
-                            "host_type": host_type,
-                            "host_idx": host_idx,
-                            "factor_columns": factor_columns,
-                        }
-
-                        for file in files:
-                            d_lst = _parse_file(host_dir, file, extractors, config_flat)
-                            for d in d_lst:
-                                if d is None:
-                                    warnings.warn(f"SKIP EMPTY FILE={file} in {host_dir}")
-                                    continue
-                                d_flat = _flatten_d(d)
-                                res = {**job_info, "source_file": file, **config_flat, **d_flat}
-                                res_lst.append(res)
-
-    df = pd.DataFrame(res_lst)
-
-    res_lst.clear()
-    return df
+        # with the frame cache, the df of the experiment is assembled separately
+        exp_columns = _ColumnBuilder(schema) if use_cache and frame_cache_dir is not None else columns
+
+        extract_rep = partial(_extract_rep, extractors=extractors)
+
+        if executor is None:
+            results = map(extract_rep, rep_jobs)
+        else:
+            # executor.map preserves the order of the jobs
+            #  -> the resulting df is identical to the serial extraction
+            results = executor.map(extract_rep, rep_jobs)
+
+        updated_exp_cache = {}
+        # whether the cache must be written: a rep dir was removed or a rep reports a change
+        #  (the cached results are never compared, e.g., a df of a columnar extractor)
+        cache_changed = exp_cache is not None and exp_cache.keys() != {rep_job["rep_path"] for rep_job in rep_jobs}
+        error_files = []
+        for rep_job, (rep_columns, rep_cache, rep_changed, rep_warnings, rep_stats) in tqdm(zip(rep_jobs, results), total=len(rep_jobs), desc=f"processing runs of experiment {exp}"):
+            exp_columns.extend(rep_columns)
+            updated_exp_cache[rep_job["rep_path"]] = rep_cache
+            cache_changed = cache_changed or rep_changed
+            error_files += _emit_warnings(rep_warnings)
+            etl_stats.merge(exp_stats, rep_stats)
+
+            if chunk_bytes is not None and columns.nbytes() >= chunk_bytes:
+                yield _chunk_to_df(columns, offset=n_yielded)
+                n_yielded += columns.n_rows
+                columns = exp_columns = _ColumnBuilder(schema)
+
+        if use_cache and cache_changed:
+            etl_cache.save_extract_cache(cache_dir, exp, cache_key, updated_exp_cache)
+
+        if has_error_extractor:
+            _write_error_report(suite, suite_id, exp, error_files, pipeline)
+
+        if exp_columns is not columns:
+            exp_df = exp_columns.to_df()
+            exp_warnings = [msg for rep_cache in updated_exp_cache.values() for entry in rep_cache.values() for msg in entry["warnings"]]
+            etl_cache.save_frame_cache(frame_cache_dir, exp, cache_key, fingerprint, exp_df, exp_warnings)
+            columns.add_frame(const={}, df=exp_df)
+
+    if columns.n_rows > 0 or n_yielded == 0:
+        yield _chunk_to_df(columns, offset=n_yielded)
+
+
+def _results_index(res_dir: str, use_cache: bool) -> Dict:
+
+    # the manifest of collected results avoids listing the directory tree
+    index = util.get_suite_results_manifest_index(res_dir) if use_cache else None
+
+    if index is None:
+        # single pass over the directory tree with the results (persisted and updated incrementally)
+        index = util.get_suite_results_index(res_dir, persist=use_cache)
+    return index
+
+
+def _rep_jobs(suite: str, suite_id: str, exp: str, index: Dict, factor_columns: List[str]) -> List[Dict]:
+
+    exp_dir = util.get_suite_results_dir(suite=suite, id=suite_id, exp=exp)
+
+    # the unit of work is a single repetition of a run (rep_dir)
+    rep_jobs = []
+    rep_files = groupby(util.walk_suite_results(index, experiments=[exp]), key=lambda x: x[1:3])
+    for (run, rep), files in rep_files:
+        rep_jobs.append({
+            "rep_dir": os.path.join(exp_dir, run, rep),
+            "rep_path": os.path.join(run, rep),
+            "files": [x[3:] for x in files], # (host_type, host_idx, host, file)
+            "cache": None,
+            "suite_name": suite,
+            "suite_id": suite_id,
+            "exp_name": exp,
+            "run": int(run.split("_")[-1]),
+            "rep": int(rep.split("_")[-1]),
+            "factor_columns": factor_columns,
+        })
+    return rep_jobs
+
+
+def _emit_warnings(msgs: List[str]) -> List[str]:
+    """Emits the warnings of the extractors, except for the error files of the `ErrorExtractor`.
+
+    Returns:
+        List[str]: the warnings about error files (for the error report)
+    """
+
+    error_files = []
+    for msg in msgs:
+        if msg.startswith(ERROR_FILE_WARNING):
+            error_files.append(msg)
+        else:
+            warnings.warn(msg)
+    return error_files
+
+
+# the error report lists the paths of the first error files (overall and per message)
+_ERROR_REPORT_MAX_PATHS = 20
+
+
+def _write_error_report(suite: str, suite_id: str, exp: str, error_files: List[str], pipeline: str):
+    """Aggregates the warnings of the `ErrorExtractor` for the error files of an experiment
+    into a report in the etl results and emits a single warning.
+    The error files are grouped by a signature of their last line (with digits masked).
+
+    The report merges the error files found by all pipelines (with an `ErrorExtractor`) that extract the experiment,
+    each pipeline replaces its own error files (the report is removed once no pipeline has error files).
+    """
+
+    report_path = os.path.join(util.get_etl_results_dir(suite=suite, id=suite_id), f"error_report_{exp}.json")
+    exp_dir = util.get_suite_results_dir(suite=suite, id=suite_id, exp=exp)
+
+    # path -> signature
+    pipeline_files = {}
+    samples = {}
+    for msg in error_files:
+        path, _, sample = msg[len(ERROR_FILE_WARNING):].partition("\n")
+        path = os.path.relpath(path, exp_dir)
+
+        lines = [line.strip() for line in sample.splitlines() if line.strip()]
+        signature = re.sub(r"\d+", "#", lines[-1] if lines else "")[:200]
+
+        pipeline_files[path] = signature
+        samples.setdefault(signature, sample)
+
+    # (pipelines can run concurrently in separate processes -> read-modify-write under a lock)
+    lock_path = os.path.join(etl_cache.get_cache_dir(suite=suite, suite_id=suite_id), f"error_report_{exp}.lock")
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        sources = {}
+        if os.path.isfile(report_path):
+            try:
+                with open(report_path, "r") as f:
+                    old_report = json.load(f)
+                sources = old_report.get("sources", {})
+                for d in old_report["signatures"]:
+                    samples.setdefault(d["signature"], d["sample"])
+            except (ValueError, KeyError):
+                # (unreadable or outdated format -> replaced)
+                sources = {}
+
+        # (extracted outside of a pipeline -> empty name)
+        source = "" if pipeline is None else pipeline
+        if pipeline_files:
+            sources[source] = pipeline_files
+        else:
+            sources.pop(source, None)
+
+        if not sources:
+            if os.path.isfile(report_path):
+                # (outdated report)
+                os.remove(report_path)
+            return
+
+        files = {}
+        for source_files in sources.values():
+            files.update(source_files)
+
+        signatures = {}
+        for path, signature in files.items():
+            if signature not in signatures:
+                signatures[signature] = {"signature": signature, "n_files": 0, "paths": [], "sample": samples.get(signature, "")}
+            d = signatures[signature]
+            d["n_files"] += 1
+            if len(d["paths"]) < _ERROR_REPORT_MAX_PATHS:
+                d["paths"].append(path)
+
+        report = {
+            "suite": suite,
+            "suite_id": suite_id,
+            "exp_name": exp,
+            "n_error_files": len(files),
+            "n_signatures": len(signatures),
+            "paths": list(files.keys())[:_ERROR_REPORT_MAX_PATHS],
+            "signatures": sorted(signatures.values(), key=lambda d: -d["n_files"]),
+            # pipeline -> {path: signature}
+            "sources": sources,
+        }
+
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if pipeline_files:
+        top = report["signatures"][0]
+        warnings.warn(
+            f"found {len(files)} error files in exp={exp} with {len(signatures)} distinct messages"
+            f" (most frequent: {top['signature']!r} in {top['n_files']} files)  -> see {report_path}"
+        )
 
 
-def _parse_file(path: str, file: str, extractors: List[Dict], config_flat: Dict) -> List[Dict]:
-    has_match = False
+def _chunk_to_df(columns: "_ColumnBuilder", offset: int) -> pd.DataFrame:
+    # (the dtypes of the schema are applied by the column builder)
+    df = columns.to_df()
+    if offset > 0:
+        df.index = pd.RangeIndex(offset, offset + len(df))
+    return df
 
+
+def _extractors_schema(extractors: List[Dict]) -> Dict[str, str]:
+    # the results of all extractors end up in the same df -> combine the schemas
+    schema = {}
     for extractor_d in extractors:
-        patterns = extractor_d["extractor"].file_regex
-        if not isinstance(patterns, list):
-            patterns = [patterns]
+        for col, dtype in (extractor_d["extractor"].result_schema or {}).items():
+            if schema.get(col, dtype) != dtype:
+                raise ValueError(f"conflicting schema of extractors for column={col}: {schema[col]} and {dtype}")
+            schema[col] = dtype
+    return schema
 
-        for p in patterns:
-            regex = re.compile(p)
 
-            if regex.match(file):
+def _coerce_values(values, col: str, dtype: str):
+    """Converts the `values` of a column (list, array, or series) to the `dtype` of the schema.
 
-                # we want to assign one extractor per file
-                if has_match:
-                    raise ValueError(
-                        f"file={file} matches multiple extractors (p={path})"
-                    )
+    Returns:
+        a numpy array or a pandas extension array (e.g., category or a nullable integer type)
+    """
 
-                file_path = os.path.join(path, file)
+    values = pd.Series(values, copy=False)
+
+    try:
+        if dtype == "timestamp":
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                values = pd.to_datetime(values)
+        elif dtype == "category":
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype("category")
+        elif pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype)) and not pd.api.types.is_bool_dtype(dtype):
+            if values.dtype != dtype:
+                values = pd.to_numeric(values)
+                if pd.api.types.is_integer_dtype(dtype) and values.isna().any():
+                    # missing values require the nullable integer type (e.g., int32 -> Int32)
+                    dtype = pd.api.types.pandas_dtype(dtype).name.replace("uint", "UInt").replace("int", "Int")
+                values = values.astype(dtype)
+        elif values.dtype != dtype:
+            values = values.astype(dtype)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"schema: cannot convert column={col} to dtype={dtype}: {e}")
+
+    return values.array if isinstance(values.dtype, pd.api.extensions.ExtensionDtype) else values.to_numpy()
+
+
+def _extract_rep(rep_job: Dict, extractors: List[Dict]) -> Tuple["_ColumnBuilder", Dict, bool, List[str], Dict]:
+    """Extracts the result files of all hosts of a single repetition of a run.
+
+    Defined on module level such that it can be used in a worker process.
+
+    Returns:
+        Tuple[_ColumnBuilder, Dict, bool, List[str], Dict]: the extracted results, the updated cache entries of the rep,
+            whether the cache entries differ from ``rep_job["cache"]``, the warnings of the extractors (emitted by the caller), and the stats per extractor
+    """
+
+    columns = _ColumnBuilder()
+
+    rep_dir = rep_job["rep_dir"]
+
+    cache = rep_job["cache"]
+    rep_cache = {}
+    rep_warnings = []
+    rep_stats = {}
+
+    try:
+        config = util.load_config_yaml(path=rep_dir, file="config.json")
+    except FileNotFoundError:
+        return columns, rep_cache, bool(cache), rep_warnings, rep_stats
+
+    if cache is not None:
+        # extractors receive the config -> a changed config invalidates all files of the rep
+        config_stamp = etl_cache.file_stamp(os.path.join(rep_dir, "config.json"))
+
+    # ignores the part of the config that shows what is varied
+    # # (if this is present)
+    if "$FACTOR_LEVEL" in config:
+        del config["~FACTORS_LEVEL"]
+
+    config_flat = _flatten_d(config)
+
+    rep_files = {(host_type, host, file) for host_type, _, host, file in rep_job["files"]}
+
+    changed = False
+    for host_type, host_idx, host, file in rep_job["files"]:
+        host_dir = os.path.join(rep_dir, host_type, host)
+
+        if _has_uncompressed_twin(host_dir, host_type, host, file, rep_files, extractors):
+            # e.g., a retried fetch left both out.csv and out.csv.gz -> the results are extracted once (from out.csv)
+            rep_warnings.append(f"SKIP COMPRESSED FILE={file} in {host_dir} (the uncompressed file exists)")
+            continue
+
+        job_info = {
+            "suite_name": rep_job["suite_name"],
+            "suite_id": rep_job["suite_id"],
+            "exp_name": rep_job["exp_name"],
+            "run": rep_job["run"],
+            "rep": rep_job["rep"],
+            "host_type": host_type,
+            "host_idx": host_idx,
+            "factor_columns": rep_job["factor_columns"],
+        }
+
+        if cache is None:
+            d_lst, file_warnings = _parse_file_recorded(host_dir, file, extractors, config_flat, rep_stats)
+            rep_warnings += file_warnings
+        else:
+            file_key = os.path.join(host_type, host, file)
+            stamp = etl_cache.file_stamp(os.path.join(host_dir, file)) + config_stamp
+
+            entry = cache.get(file_key)
+            if entry is None or entry["stamp"] != stamp:
+                d_lst, file_warnings = _parse_file_recorded(host_dir, file, extractors, config_flat, rep_stats)
+                entry = {"stamp": stamp, "rows": d_lst, "warnings": file_warnings}
+                changed = True
+            else:
+                extractor_name = type(_find_extractor(host_dir, file, extractors)["extractor"]).__name__
+                etl_stats.record(rep_stats, extractor_name, cached_files=1, rows=len(entry["rows"]))
+
+            # (for an unchanged file, the warnings of the extractor are replayed e.g., ErrorExtractor)
+            rep_warnings += entry["warnings"]
+            rep_cache[file_key] = entry
+            d_lst = entry["rows"]
+
+        if isinstance(d_lst, pd.DataFrame):
+            # columnar results (see `Extractor.extract_frame`)
+            #  -> the job info and the config are added as constant columns
+            columns.add_frame(const={**job_info, "source_file": file, **config_flat}, df=d_lst)
+            continue
+
+        d_flat_lst = []
+        for d in d_lst:
+            if d is None:
+                warnings.warn(f"SKIP EMPTY FILE={file} in {host_dir}")
+                continue
+            d_flat_lst.append(_flatten_d(d))
+
+        # the job info and the config are the same for all results of the file
+        columns.add_rows(const={**job_info, "source_file": file, **config_flat}, rows=d_flat_lst)
+
+    if cache is not None:
+        # (e.g., a deleted file)
+        changed = changed or rep_cache.keys() != cache.keys()
+
+    return columns, rep_cache, changed, rep_warnings, rep_stats
 
-                options = extractor_d["options"]
-                options["$config_flat$"] = config_flat
-                d_lst = extractor_d["extractor"].extract(
-                    path=file_path, options=options
-                )
 
-                has_match = True
+def _parse_file_recorded(path: str, file: str, extractors: List[Dict], config_flat: Dict, stats: Dict = None) -> Tuple[Union[List[Dict], pd.DataFrame], List[str]]:
+    # the warnings of the extractor are recorded (for the cache and s.t. a worker process does not print them)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        d_lst = _parse_file(path, file, extractors, config_flat, stats)
+
+    msgs = []
+    for w in caught:
+        if issubclass(w.category, (DeprecationWarning, PendingDeprecationWarning)):
+            # about the code of the extractor (not the results) -> subject to the default warning filters
+            warnings.warn_explicit(w.message, w.category, w.filename, w.lineno)
+        else:
+            msgs.append(str(w.message))
+    return d_lst, msgs
+
+
+def _parse_file(path: str, file: str, extractors: List[Dict], config_flat: Dict, stats: Dict = None) -> Union[List[Dict], pd.DataFrame]:
+    """Extracts the results of a file with the (single) matching extractor.
+
+    If `stats` is provided, the time, the file size, and the number of results are recorded for the extractor.
+    """
+
+    matched_extractor_d = _find_extractor(path, file, extractors)
+
+    file_path = os.path.join(path, file)
+
+    options = matched_extractor_d["options"]
+    options["$config_flat$"] = config_flat
+
+    start = time.perf_counter()
+
+    if matched_extractor_d["columnar"]:
+        d_lst = matched_extractor_d["extractor"].extract_frame(
+            path=file_path, options=options
+        )
+        if not isinstance(d_lst, pd.DataFrame):
+            # e.g., pyarrow.Table
+            d_lst = d_lst.to_pandas()
+    else:
+        d_lst = matched_extractor_d["extractor"].extract(
+            path=file_path, options=options
+        )
+
+    if stats is not None:
+        etl_stats.record(stats, type(matched_extractor_d["extractor"]).__name__,
+                         files=1, bytes=os.stat(file_path).st_size, rows=len(d_lst), time_s=time.perf_counter() - start)
+
+    return d_lst
+
+
+def _has_uncompressed_twin(host_dir: str, host_type: str, host: str, file: str, rep_files: Set[Tuple], extractors: List[Dict]) -> bool:
+    # a compressed file that is matched as the original file, and the original file is also in the results
+    original = strip_compression_suffix(file)
+    return (
+        original != file
+        and (host_type, host, original) in rep_files
+        and _match_extractor(host_dir, file, extractors) is None
+    )
+
+
+def _find_extractor(path: str, file: str, extractors: List[Dict]) -> Dict:
+
+    matched_extractor_d = _match_extractor(path, file, extractors)
+
+    if matched_extractor_d is None and strip_compression_suffix(file) != file:
+        # a compressed result file (e.g., out.csv.gz) is matched as the original file (e.g., out.csv)
+        #   -> the extractor decompresses the file transparently
+        matched_extractor_d = _match_extractor(path, strip_compression_suffix(file), extractors)
 
     # if no extractor found
-    if not has_match:
+    if matched_extractor_d is None:
         raise ValueError(f"file={file} matches no extractor (path={path})")
 
-    return d_lst
+    return matched_extractor_d
+
+
+def _match_extractor(path: str, file: str, extractors: List[Dict]) -> Dict:
+
+    matched_extractor_d = None
+
+    for extractor_d in extractors:
+
+        n_matches = extractor_d["n_matches"].get(file)
+        if n_matches is None:
+            n_matches = sum(1 for regex in extractor_d["file_regex"] if regex.match(file))
+            extractor_d["n_matches"][file] = n_matches
+
+        # we want to assign one extractor per file
+        if n_matches > 1 or (n_matches == 1 and matched_extractor_d is not None):
+            raise ValueError(
+                f"file={file} matches multiple extractors (p={path})"
+            )
+        elif n_matches == 1:
+            matched_extractor_d = extractor_d
+
+    return matched_extractor_d
 
 
 def _parse_factors(experiment: Dict) -> list:
@@ -654,6 +1730,187 @@ def _parse_factors(experiment: Dict) -> list:
 
 def _flatten_d(d):
     if any(isinstance(i, dict) for i in d.values()):
-        return json.loads(pd.json_normalize(d, sep=".").iloc[0].to_json())
+        flat = {}
+        _flatten_into(flat, d, prefix="")
+        return flat
     else:
         return d
+
+
+def _flatten_into(flat: Dict, d: Dict, prefix: str):
+    # flattens nested dicts into `flat` with keys joined by "."
+    # (same key order as pd.json_normalize: values of nested dicts come after the other values)
+    nested = []
+    for k, v in d.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            nested.append((key, v))
+        else:
+            flat[key] = v
+
+    for key, v in nested:
+        _flatten_into(flat, v, prefix=f"{key}.")
+
+
+class _ColumnBuilder:
+    """Assembles the extracted results column by column.
+
+    Builds the same data frame as ``pd.DataFrame(rows)`` with
+    ``rows = [{**const, **row}, ...]`` (i.e., columns in order of appearance,
+    missing values are NaN) but without creating a merged dict per row.
+
+    Each column is a list of blocks: python lists (from rows) or
+    numpy arrays (from extractors that return a typed data frame).
+    The columns of the `schema` ({col: dtype}, see `Extractor.result_schema`) are typed:
+    their python lists are converted to typed blocks every ``_TYPED_BLOCK_VALUES`` values (and in `to_df`).
+    """
+
+    # (bounds the python objects of a typed column)
+    _TYPED_BLOCK_VALUES = 2**16
+
+    def __init__(self, schema: Dict[str, str] = None):
+        self.schema = schema or {}
+        self.columns = {}
+        # the number of values per column (s.t. padding does not need to count the blocks)
+        self.lengths = {}
+        self.n_rows = 0
+
+    def _column(self, name):
+        col = self.columns.get(name)
+        if col is None:
+            # new column -> fill previous rows with NaN
+            col = [[np.nan] * self.n_rows]
+            self.columns[name] = col
+            self.lengths[name] = self.n_rows
+        return col
+
+    def _append(self, name, values):
+        col = self._column(name)
+        dtype = self.schema.get(name)
+        if dtype is not None and not isinstance(values, list):
+            values = _coerce_values(values, name, dtype)
+
+        if isinstance(values, list) and isinstance(col[-1], list):
+            col[-1].extend(values)
+        else:
+            col.append(values)
+        self.lengths[name] += len(values)
+
+        if dtype is not None and isinstance(col[-1], list) and len(col[-1]) >= self._TYPED_BLOCK_VALUES:
+            col[-1] = _coerce_values(col[-1], name, dtype)
+
+    def add_rows(self, const: Dict, rows: List[Dict]):
+        """Adds `rows`, each extended by the `const` columns
+        (on a conflict, the value from the row has precedence)."""
+
+        n = len(rows)
+        if n == 0:
+            return
+
+        row_keys = {}
+        for row in rows:
+            for k in row:
+                row_keys[k] = None
+
+        for k, v in const.items():
+            if k in row_keys:
+                self._append(k, [row.get(k, v) for row in rows])
+            else:
+                # broadcast the constant value
+                self._append(k, [v] * n)
+
+        for k in row_keys:
+            if k not in const:
+                self._append(k, [row.get(k, np.nan) for row in rows])
+
+        self.n_rows += n
+        self._pad()
+
+    def add_frame(self, const: Dict, df: pd.DataFrame):
+        """Adds the rows of `df`, each extended by the `const` columns
+        (on a conflict, the column from `df` has precedence)."""
+
+        n = len(df)
+        if n == 0:
+            return
+
+        # (the columns of the schema are converted from the series, e.g., to keep a category dtype)
+        df_columns = {k: df[k] if k in self.schema else df[k].to_numpy() for k in df.columns}
+
+        for k, v in const.items():
+            if k in df_columns:
+                self._append(k, df_columns[k])
+            else:
+                self._append(k, [v] * n)
+
+        for k, values in df_columns.items():
+            if k not in const:
+                self._append(k, values)
+
+        self.n_rows += n
+        self._pad()
+
+    def extend(self, other: "_ColumnBuilder"):
+        """Appends the rows of `other`."""
+
+        if other.n_rows == 0:
+            return
+
+        for k, blocks in other.columns.items():
+            for values in blocks:
+                self._append(k, values)
+
+        self.n_rows += other.n_rows
+        self._pad()
+
+    def _pad(self):
+        # columns that are not present in the added rows -> NaN
+        for name, n in self.lengths.items():
+            if n < self.n_rows:
+                self._append(name, [np.nan] * (self.n_rows - n))
+
+    # rough size of a cell (pointer + python object) to estimate the memory of the extracted results
+    _CELL_BYTES = 64
+
+    def nbytes(self) -> int:
+        """Estimated memory of the assembled columns."""
+        return self.n_rows * len(self.columns) * self._CELL_BYTES
+
+    def to_df(self) -> pd.DataFrame:
+        return pd.DataFrame({name: _concat_blocks(col, name, self.schema.get(name)) for name, col in self.columns.items()})
+
+
+def _concat_blocks(col: List, name: str = None, dtype: str = None):
+
+    # (the first block is the (possibly empty) padding of a new column)
+    blocks = [values for values in col if len(values) > 0]
+
+    if dtype is not None:
+        # typed column of the schema
+        blocks = [_coerce_values(values, name, dtype) if isinstance(values, list) else values for values in blocks]
+        if len(blocks) == 0:
+            return _coerce_values([], name, dtype)
+        if len(blocks) == 1:
+            return blocks[0]
+        if all(isinstance(values.dtype, pd.CategoricalDtype) for values in blocks):
+            # (the blocks have different categories)
+            cat_dtype = etl_util.union_categories(blocks)
+            blocks = [values.set_categories(cat_dtype.categories) for values in blocks]
+        # (e.g., int32 and Int32 blocks -> Int32)
+        return pd.concat([pd.Series(values, copy=False) for values in blocks], ignore_index=True).array
+
+    if len(blocks) == 0:
+        return []
+
+    dtypes = {values.dtype if isinstance(values, np.ndarray) else None for values in blocks}
+    if len(dtypes) == 1 and None not in dtypes:
+        # typed columns remain typed
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+    if len(blocks) == 1:
+        return blocks[0]
+
+    lst = []
+    for values in blocks:
+        lst.extend(values.tolist() if isinstance(values, np.ndarray) else values)
+    return lst
@@ -0,0 +1,338 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import warnings
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from doespy import util
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    # without pyarrow, the extracted df is cached as pickle
+    pa = None
+
+# within the etl results of a suite
+FRAME_CACHE_DIR = ".cache"
+
+# within the etl results of a suite: the fingerprint of the inputs of the last successful etl run
+STAMP_FILE = ".etl_stamp.json"
+
+
+def get_cache_dir(suite: str, suite_id: str) -> str:
+    """Directory within the results of a suite that holds the persistent ETL cache."""
+    return os.path.join(util.get_suite_results_dir(suite=suite, id=suite_id), util.ETL_CACHE_DIR)
+
+
+def get_frame_cache_dir(suite: str, suite_id: str) -> str:
+    """Directory within the etl results of a suite that holds the cached extracted df per experiment."""
+    return os.path.join(util.get_etl_results_dir(suite=suite, id=suite_id), FRAME_CACHE_DIR)
+
+
+def get_step_cache_dir(etl_output_dir: str) -> str:
+    """Directory within the etl output dir that holds the cached df after each transformer step per pipeline."""
+    return os.path.join(etl_output_dir, FRAME_CACHE_DIR, "steps")
+
+
+def extractors_key(extractors: List[Dict]) -> str:
+    """Computes a hash over the configuration of the extractors of a pipeline.
+
+    The hash covers the options and the source code of each extractor class,
+    s.t., changing either invalidates the cached extraction results.
+    """
+
+    h = hashlib.sha1()
+    for extractor_d in extractors:
+        cls = type(extractor_d["extractor"])
+        h.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+        h.update(extractor_d["extractor"].model_dump_json().encode())
+        h.update(_source_hash(cls).encode())
+    return h.hexdigest()
+
+
+def transformer_keys(input_key: str, transformers: List[Dict]) -> List[str]:
+    """Computes the key of the df after each transformer step.
+
+    The key of a step covers the key of its input df (i.e., of the previous step),
+    the configuration, and the source code of the transformer class.
+    """
+
+    keys = []
+    key = input_key
+    for x in transformers:
+        h = hashlib.sha1(key.encode())
+        if isinstance(x["transformer"], str):
+            # df function, e.g., df.query
+            h.update(x["transformer"].encode())
+        else:
+            cls = type(x["transformer"])
+            h.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+            h.update(x["transformer"].model_dump_json().encode())
+            h.update(_source_hash(cls).encode())
+        h.update(json.dumps(x["options"], sort_keys=True, default=str).encode())
+        key = h.hexdigest()
+        keys.append(key)
+    return keys
+
+
+def _source_hash(cls) -> str:
+    try:
+        source = inspect.getsource(cls)
+    except (OSError, TypeError):
+        # e.g., class defined in a notebook -> only the config is part of the key
+        return ""
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+def file_stamp(path: str) -> tuple:
+    """Identifies the version of a file by its size and modification time."""
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _cache_file(cache_dir: str, exp: str, key: str) -> str:
+    return os.path.join(cache_dir, exp, f"extract_{key}.pkl")
+
+
+def load_extract_cache(cache_dir: str, exp: str, key: str) -> Dict:
+    """Loads the cached extraction results of an experiment.
+
+    Returns:
+        Dict: {rep_path: {file_path: {"stamp": .., "rows": .., "warnings": ..}}}
+            where `rep_path` (e.g., run_0/rep_1) is relative to the experiment
+            and `file_path` (e.g., server/host_0/results.json) relative to the rep.
+    """
+
+    path = _cache_file(cache_dir, exp, key)
+    if not os.path.isfile(path):
+        return {}
+
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        warnings.warn(f"ignoring unreadable etl cache: {path}  ({e})")
+        return {}
+
+
+def save_extract_cache(cache_dir: str, exp: str, key: str, cache: Dict):
+    """Stores the extraction results of an experiment (replaces the existing cache)."""
+
+    path = _cache_file(cache_dir, exp, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # write to a tmp file + rename s.t. concurrent etl runs never read a partial cache
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def results_fingerprint(rep_jobs: List[Dict], extra: List) -> str:
+    """Computes a hash over the result files of an experiment (path, size, and modification time)."""
+
+    h = hashlib.sha1(json.dumps(extra).encode())
+    for rep_job in rep_jobs:
+        rep_dir = rep_job["rep_dir"]
+        try:
+            config_stamp = file_stamp(os.path.join(rep_dir, "config.json"))
+        except FileNotFoundError:
+            config_stamp = None
+        h.update(f"{rep_job['rep_path']}:{config_stamp}".encode())
+        for host_type, host_idx, host, file in rep_job["files"]:
+            path = os.path.join(host_type, host, file)
+            h.update(f"{path}:{host_idx}:{file_stamp(os.path.join(rep_dir, path))}".encode())
+    return h.hexdigest()
+
+
+def _frame_file(cache_dir: str, exp: str, key: str, ext: str) -> str:
+    return os.path.join(cache_dir, exp, f"frame_{key}.{ext}")
+
+
+def load_frame_cache(cache_dir: str, exp: str, key: str, fingerprint: str) -> Tuple[pd.DataFrame, List[str]]:
+    """Loads the cached df of an experiment (memory mapped if stored in the arrow format).
+
+    Returns:
+        Tuple[pd.DataFrame, List[str]]: the df and the warnings of the extractors,
+            or None if there is no cached df for the `fingerprint` of the results.
+    """
+
+    arrow_path = _frame_file(cache_dir, exp, key, "arrow")
+    pkl_path = _frame_file(cache_dir, exp, key, "pkl")
+
+    try:
+        if pa is not None and os.path.isfile(arrow_path):
+            table = feather.read_table(arrow_path, memory_map=True)
+            meta = json.loads(table.schema.metadata[b"doespy"])
+            if meta["fingerprint"] != fingerprint:
+                return None
+            return _from_arrow(table, meta["kinds"]), meta["warnings"]
+
+        if os.path.isfile(pkl_path):
+            with open(pkl_path, "rb") as f:
+                d = pickle.load(f)
+            if d["fingerprint"] != fingerprint:
+                return None
+            return d["df"], d["warnings"]
+
+    except Exception as e:
+        warnings.warn(f"ignoring unreadable etl cache of exp={exp}: {e}")
+
+    return None
+
+
+def save_frame_cache(cache_dir: str, exp: str, key: str, fingerprint: str, df: pd.DataFrame, warning_msgs: List[str]):
+    """Stores the extracted df of an experiment (replaces the existing cache).
+
+    The df is stored in the arrow (feather) format if all columns can be restored exactly,
+    otherwise (or without pyarrow) as pickle.
+    """
+
+    arrow_path = _frame_file(cache_dir, exp, key, "arrow")
+    pkl_path = _frame_file(cache_dir, exp, key, "pkl")
+    os.makedirs(os.path.dirname(arrow_path), exist_ok=True)
+
+    path = None
+
+    kinds = _arrow_column_kinds(df) if pa is not None else None
+    if kinds is not None:
+        meta = {"fingerprint": fingerprint, "kinds": kinds, "warnings": warning_msgs}
+        try:
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata({**table.schema.metadata, b"doespy": json.dumps(meta).encode()})
+            tmp_path = f"{arrow_path}.{os.getpid()}.tmp"
+            # (uncompressed s.t. the columns can be memory mapped)
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+            path, other_path = arrow_path, pkl_path
+        except (pa.ArrowException, TypeError, ValueError):
+            path = None
+
+    if path is None:
+        tmp_path = f"{pkl_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"fingerprint": fingerprint, "df": df, "warnings": warning_msgs}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        path, other_path = pkl_path, arrow_path
+
+    os.replace(tmp_path, path)
+    if os.path.isfile(other_path):
+        os.remove(other_path)
+
+
+def prune_frame_cache(cache_dir: str, exp: str, keep_keys: List[str]):
+    """Removes the cached dfs of an experiment (or pipeline) except for the `keep_keys`."""
+
+    exp_dir = os.path.join(cache_dir, exp)
+    if not os.path.isdir(exp_dir):
+        return
+
+    keep = {os.path.basename(_frame_file(cache_dir, exp, key, ext)) for key in keep_keys for ext in ["arrow", "pkl"]}
+    for file in os.listdir(exp_dir):
+        # (not the tmp files of a concurrent writer)
+        if file.startswith("frame_") and file.endswith((".arrow", ".pkl")) and file not in keep:
+            os.remove(os.path.join(exp_dir, file))
+
+
+def _arrow_column_kinds(df: pd.DataFrame) -> Dict[str, str]:
+    """Checks whether the columns of the df survive the round trip through arrow.
+
+    Returns:
+        Dict[str, str]: {col: "str" | "list"} for object columns of strings or lists of strings
+            (missing values are restored as NaN), or None if a column cannot be restored exactly.
+    """
+
+    kinds = {}
+    for col in df.columns:
+        if not isinstance(col, str):
+            return None
+
+        if df[col].dtype != "object":
+            continue
+
+        kind = None
+        for v in df[col]:
+            if isinstance(v, str):
+                k = "str"
+            elif isinstance(v, list) and all(isinstance(x, str) for x in v):
+                k = "list"
+            elif isinstance(v, float) and np.isnan(v):
+                continue
+            else:
+                # e.g., None, dicts, or mixed types
+                return None
+
+            if kind is None:
+                kind = k
+            elif kind != k:
+                return None
+
+        kinds[col] = "str" if kind is None else kind
+    return kinds
+
+
+def _from_arrow(table, kinds: Dict[str, str]) -> pd.DataFrame:
+    df = table.to_pandas()
+    for col, kind in kinds.items():
+        if kind == "list":
+            df[col] = [np.nan if v is None else v for v in table.column(col).to_pylist()]
+        else:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def code_fingerprint(dirs: List[str]) -> str:
+    """Computes a hash over the python files in `dirs` (path, size, and modification time),
+    e.g., doespy and the custom ETL steps in doe-suite-config."""
+
+    h = hashlib.sha1()
+    for d in dirs:
+        for root, subdirs, files in os.walk(d):
+            subdirs.sort()
+            for file in sorted(files):
+                if file.endswith(".py"):
+                    path = os.path.join(root, file)
+                    h.update(f"{path}:{file_stamp(path)}".encode())
+    return h.hexdigest()
+
+
+def suite_fingerprint(suite: str, suite_id: str, extra: List) -> str:
+    """Computes a hash over the suite design and all result files of a suite (path, size, and modification time)."""
+
+    suite_dir = util.get_suite_results_dir(suite=suite, id=suite_id)
+
+    h = hashlib.sha1(json.dumps(extra).encode())
+    h.update(f"suite_design.yml:{file_stamp(os.path.join(suite_dir, 'suite_design.yml'))}".encode())
+
+    index = util.get_suite_results_index(suite_dir, persist=True)
+    experiments = util.get_does_result_experiments(suite=suite, suite_id=suite_id)
+
+    rep_dir = None
+    for exp, run, rep, host_type, _host_idx, host, file in util.walk_suite_results(index, experiments=experiments):
+        if rep_dir != (exp, run, rep):
+            rep_dir = (exp, run, rep)
+            config_path = os.path.join(suite_dir, exp, run, rep, "config.json")
+            config_stamp = file_stamp(config_path) if os.path.isfile(config_path) else None
+            h.update(f"{exp}/{run}/{rep}:{config_stamp}".encode())
+        path = os.path.join(exp, run, rep, host_type, host, file)
+        h.update(f"{path}:{file_stamp(os.path.join(suite_dir, path))}".encode())
+    return h.hexdigest()
+
+
+def is_stamp_current(etl_output_dir: str, fingerprint: str) -> bool:
+    """Checks whether the last successful etl run of a suite had the same inputs (see `suite_fingerprint`)."""
+    try:
+        with open(os.path.join(etl_output_dir, STAMP_FILE), "r") as f:
+            return json.load(f)["fingerprint"] == fingerprint
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def save_stamp(etl_output_dir: str, fingerprint: str):
+    os.makedirs(etl_output_dir, exist_ok=True)
+    with open(os.path.join(etl_output_dir, STAMP_FILE), "w") as f:
+        json.dump({"fingerprint": fingerprint}, f)
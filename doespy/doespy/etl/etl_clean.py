@@ -4,6 +4,7 @@ import shutil
 
 
 from doespy import util
+from doespy.etl import etl_cache
 
 
 def main():
@@ -46,6 +47,11 @@ def run(suite, suite_id, etl_output_dir):
     if os.path.isdir(etl_results_dir):
         shutil.rmtree(etl_results_dir, ignore_errors=False)
 
+    # also drop the extraction cache s.t. the results are regenerated from scratch
+    for cache_dir in [etl_cache.get_cache_dir(suite=suite, suite_id=suite_id), etl_cache.get_frame_cache_dir(suite=suite, suite_id=suite_id)]:
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir, ignore_errors=False)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,88 @@
+import json
+import os
+from typing import Dict
+
+import pandas as pd
+
+
+# counters per extractor (and experiment)
+_COUNTERS = ["files", "cached_files", "bytes", "rows", "time_s"]
+
+# pseudo extractor for experiments loaded from the cached df (see `etl_cache.load_frame_cache`)
+FRAME_CACHE = "(frame cache)"
+
+
+def record(stats: Dict, extractor: str, **counters):
+    """Adds the `counters` (e.g., files=1, rows=10) to the stats of the `extractor`.
+
+    Args:
+        stats (Dict): {extractor: {counter: value}}
+    """
+
+    d = stats.get(extractor)
+    if d is None:
+        d = stats[extractor] = {c: 0 for c in _COUNTERS}
+    for c, v in counters.items():
+        d[c] += v
+
+
+def merge(stats: Dict, other: Dict):
+    """Adds the stats per extractor `other` (e.g., of a rep) to `stats`."""
+    for extractor, counters in other.items():
+        record(stats, extractor, **counters)
+
+
+def merge_exps(extract_stats: Dict, other: Dict):
+    """Adds the stats of an ETL run `other` (e.g., of a worker process) to `extract_stats`."""
+    for exp, stats in other.items():
+        merge(extract_stats.setdefault(exp, {}), stats)
+
+
+def to_df(extract_stats: Dict) -> pd.DataFrame:
+    """Converts the stats of an ETL run into a table with a row per experiment and extractor.
+
+    Args:
+        extract_stats (Dict): {suite_exp: {extractor: {counter: value}}}
+    """
+
+    rows = [
+        {"experiment": exp, "extractor": extractor, **counters}
+        for exp, stats in extract_stats.items()
+        for extractor, counters in stats.items()
+    ]
+    return pd.DataFrame(rows, columns=["experiment", "extractor"] + _COUNTERS)
+
+
+def summary(extract_stats: Dict) -> str:
+    """Formats the stats of an ETL run as a table:
+    the extractors over all experiments (sorted by time) followed by the experiments with the most time."""
+
+    df = to_df(extract_stats)
+    if df.empty:
+        return "no results extracted"
+
+    def _fmt(df):
+        df = df.sort_values("time_s", ascending=False)
+        df["MB"] = df.pop("bytes") / 1024**2
+        df["MB/s"] = df["MB"] / df["time_s"].where(df["time_s"] > 0)
+        return df.to_string(index=False, float_format=lambda x: f"{x:.2f}")
+
+    per_extractor = df.drop(columns="experiment").groupby("extractor", as_index=False).sum()
+
+    lines = [
+        "ETL extraction stats per extractor:",
+        _fmt(per_extractor),
+        "",
+        "ETL extraction stats per experiment (top 10 by time):",
+        # (header + 10 rows)
+        "\n".join(_fmt(df).split("\n")[:11]),
+    ]
+    return "\n".join(lines)
+
+
+def dump_json(extract_stats: Dict, path: str):
+    """Writes the stats of an ETL run as json: {suite_exp: {extractor: {counter: value}}}."""
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(extract_stats, f, indent=2)
@@ -3,7 +3,6 @@ import json
 import pandas as pd
 
 from tqdm import tqdm
-import requests
 import time
 import os
 from typing import Dict
@@ -53,6 +52,59 @@ def expand_factors(df: pd.DataFrame, columns: list) -> list:
     return columns
 
 
+def to_numeric(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """
+    Converts the `columns` of the `df` to numbers.
+    Columns that already have a numeric dtype (e.g., due to the `schema` of an extractor) are not converted again.
+    """
+    convert = [col for col in columns if not pd.api.types.is_numeric_dtype(df[col])]
+    if len(convert) > 0:
+        df[convert] = df[convert].apply(pd.to_numeric)
+    return df
+
+
+def union_categories(categoricals: list) -> pd.CategoricalDtype:
+    """The categorical dtype with the categories of all `categoricals`
+    (sorted if possible, as `astype("category")` on the combined values)."""
+    categories = {}
+    for values in categoricals:
+        for category in values.categories:
+            categories[category] = None
+    categories = list(categories)
+    try:
+        categories = sorted(categories)
+    except TypeError:
+        # (e.g., mixed types) -> in the order of appearance
+        pass
+    return pd.CategoricalDtype(categories)
+
+
+def concat_frames(dfs: list, **kwargs) -> pd.DataFrame:
+    """`pd.concat` of data frames that keeps the `category` columns
+    (the frames can have different categories, e.g., the chunks of a streaming pipeline)."""
+
+    dfs = list(dfs)
+
+    cat_columns = {}
+    for df in dfs:
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                cat_columns[col] = None
+
+    for col in cat_columns:
+        if not all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in dfs if col in df.columns):
+            # (as pd.concat: a column with a mix of categories and other values has dtype object)
+            continue
+        dtype = union_categories([df[col].cat for df in dfs if col in df.columns])
+        for i, df in enumerate(dfs):
+            if col in df.columns and df[col].dtype != dtype:
+                df = df.copy(deep=False)
+                df[col] = df[col].cat.set_categories(dtype.categories)
+                dfs[i] = df
+
+    return pd.concat(dfs, **kwargs)
+
+
 def convert_group_name_to_str(name):
     if type(name) == str:
         return name
@@ -131,6 +183,8 @@ def escape_dict_str(d: Dict) -> str:
     return as_str
 
 def save_notion(filenames, etl_info, notion_dict):
+    import requests
+
     etl_output_dir = etl_info["etl_output_dir"]
     pipeline = etl_info["pipeline"]
     super_etl_name = etl_info["suite"]
@@ -183,6 +237,8 @@ def save_notion(filenames, etl_info, notion_dict):
             print(f"Response: {response.text}")
 
 def notion_remove_children(url, headers):
+    import requests
+
     # Send GET request to Notion API to retrieve child blocks
     response = requests.get(url, headers=headers)
 
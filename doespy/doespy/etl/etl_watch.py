@@ -0,0 +1,231 @@
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Set, Tuple
+
+from doespy import util
+from doespy.etl import etl_base, etl_cache
+
+
+# in the results dir: the service file (heartbeat) and the drop files of requested suites
+WATCH_DIR = ".etl_watch"
+SERVICE_FILE = "service.json"
+REQUEST_SUFFIX = ".req"
+
+# a service without a heartbeat for longer is considered dead
+#   (the timeout is part of the service file, i.e., the playbook uses the same value)
+SERVICE_TIMEOUT_S = 30
+
+
+def get_watch_dir() -> str:
+    return os.path.join(util.get_results_dir(), WATCH_DIR)
+
+
+def notify(suite: str, suite_id: str):
+    """Requests the ETL of a suite run from the watch service by placing a drop file in the watch dir."""
+
+    watch_dir = get_watch_dir()
+    os.makedirs(watch_dir, exist_ok=True)
+    path = os.path.join(watch_dir, util.get_folder(suite=suite, suite_id=suite_id) + REQUEST_SUFFIX)
+    with open(path, "a"):
+        pass
+
+
+def watch(
+    etl_from_design: bool = False,
+    n_workers: int = 1,
+    n_pipeline_workers: int = 1,
+    use_cache: bool = True,
+    poll_interval: float = 1.0,
+    debounce: float = 5.0,
+    watch_results: bool = True,
+):
+    """Runs the ETL of suite runs whenever their results change until interrupted.
+
+    In contrast to a new `etl.py` process per completed job, the service imports the libraries
+    and the ETL steps once and keeps the step registry in memory.
+    A suite run is processed on a request (drop file, see `notify`) and, with `watch_results`,
+    when polling detects new result directories (experiment, run, or rep).
+    The events of a suite are debounced, i.e., the ETL runs once no new event arrived for `debounce` seconds.
+    The ETL itself is incremental: unchanged suites are skipped (see `etl_base.run_all_suites`),
+    and the per-file, frame, and step caches limit the work to the affected experiments and pipeline steps.
+
+    A failing ETL is reported in `ETL_ERROR.log` of the suite results (as in the playbook) and the service continues.
+    If the code of doespy or of the custom ETL steps changes, the service restarts itself to load the new code.
+
+    The heartbeat (modification time of the service file) is updated by a background thread,
+    i.e., also while a long ETL run is in progress.
+    """
+
+    watch_dir = get_watch_dir()
+    os.makedirs(watch_dir, exist_ok=True)
+    service_path = os.path.join(watch_dir, SERVICE_FILE)
+
+    # (written atomically: the playbook reads the timeout)
+    tmp_path = f"{service_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"pid": os.getpid(), "host": socket.gethostname(), "started": time.time(), "timeout_s": SERVICE_TIMEOUT_S}, f)
+    os.replace(tmp_path, service_path)
+
+    stop_heartbeat = threading.Event()
+    threading.Thread(target=_heartbeat, args=(service_path, stop_heartbeat), daemon=True).start()
+
+    code_key = etl_cache.code_fingerprint(etl_base._etl_steps_paths())
+    signatures = _results_signatures({}) if watch_results else {}
+
+    # (suite, suite_id) -> time of the last event
+    pending = {}
+
+    # (e.g., stopped by a process manager -> remove the service file)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    print(f"watching {util.get_results_dir()} for new results (stop with Ctrl+C)")
+    try:
+        while True:
+            now = time.monotonic()
+
+            for key in _pop_requests(watch_dir):
+                pending[key] = now
+
+            if watch_results:
+                new_signatures = _results_signatures(signatures)
+                for key, (_stamp, sig) in new_signatures.items():
+                    # (only the signature of the result directories, the stamp also changes with the etl results)
+                    if key not in signatures or signatures[key][1] != sig:
+                        pending[key] = now
+                signatures = new_signatures
+
+            ready = [key for key, t in pending.items() if now - t >= debounce]
+            if ready and etl_cache.code_fingerprint(etl_base._etl_steps_paths()) != code_key:
+                # the step registry in memory is outdated
+                #  -> restart the service (the pending suites are requested again)
+                print("the ETL code changed -> restarting the watch service")
+                for suite, suite_id in pending:
+                    notify(suite, suite_id)
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+
+            for suite, suite_id in ready:
+                del pending[(suite, suite_id)]
+                _run_suite(
+                    suite=suite,
+                    suite_id=suite_id,
+                    etl_from_design=etl_from_design,
+                    n_workers=n_workers,
+                    n_pipeline_workers=n_pipeline_workers,
+                    use_cache=use_cache,
+                )
+
+            time.sleep(poll_interval)
+
+    except KeyboardInterrupt:
+        print("stopped the watch service")
+    finally:
+        stop_heartbeat.set()
+        if os.path.isfile(service_path):
+            os.remove(service_path)
+
+
+def _heartbeat(service_path: str, stop: threading.Event):
+    # updates the modification time of the service file well within the timeout
+    while not stop.wait(SERVICE_TIMEOUT_S / 6):
+        try:
+            os.utime(service_path)
+        except FileNotFoundError:
+            # (the service stopped)
+            return
+
+
+def _run_suite(suite: str, suite_id: str, **kwargs):
+
+    print(f"==> run etl: suite={suite} id={suite_id}")
+    start = time.time()
+
+    extract_stats = {}
+    try:
+        etl_base.run_all_suites(suite_runs=[{"suite": suite, "suite_id": suite_id}], extract_stats=extract_stats, **kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        print(error)
+        error_path = os.path.join(util.get_suite_results_dir(suite=suite, id=suite_id), "ETL_ERROR.log")
+        with open(error_path, "w") as f:
+            f.write(error)
+        print(f"<== etl failed: suite={suite} id={suite_id}  (error details: {error_path})")
+        return
+
+    print(f"<== etl done: suite={suite} id={suite_id}  ({time.time() - start:.1f}s, {len(extract_stats)} experiments extracted)")
+
+
+def _pop_requests(watch_dir: str) -> Set[Tuple[str, str]]:
+    """Returns the suite runs requested via drop files (and removes the files)."""
+
+    requests = set()
+    for entry in os.scandir(watch_dir):
+        if entry.name.endswith(REQUEST_SUFFIX):
+            os.remove(entry.path)
+            requests.add(util.from_folder(entry.name[: -len(REQUEST_SUFFIX)]))
+    return requests
+
+
+def _results_signatures(previous: Dict) -> Dict[Tuple[str, str], Tuple]:
+    """Computes a signature per suite run from the modification times of the result directories
+    down to the rep level (i.e., a newly collected job changes the signature, but not the etl results).
+
+    Only suites with a changed stamp (see `_suite_stamp`) are listed again,
+    for the others the signature in `previous` is reused.
+
+    Returns:
+        Dict: (suite, suite_id) -> (stamp, signature)
+    """
+
+    signatures = {}
+    for x in util.get_does_results():
+        key = (x["suite"], x["suite_id"])
+        suite_dir = util.get_suite_results_dir(suite=x["suite"], id=x["suite_id"])
+
+        stamp = _suite_stamp(suite_dir)
+        if stamp is not None and key in previous and previous[key][0] == stamp:
+            signatures[key] = previous[key]
+            continue
+
+        try:
+            experiments = util.get_does_result_experiments(suite=x["suite"], suite_id=x["suite_id"])
+        except FileNotFoundError:
+            # e.g., the suite design is not (yet) available
+            continue
+        signatures[key] = (stamp, [(exp, _dir_mtimes(os.path.join(suite_dir, exp), depth=1)) for exp in sorted(experiments)])
+    return signatures
+
+
+def _suite_stamp(suite_dir: str):
+    """The modification time of the suite dir and of its results manifest:
+    collecting the results of a job appends to the manifest (a new run or rep does not change the suite dir).
+
+    Returns None for a suite without a manifest (i.e., the result directories must be listed).
+    """
+
+    try:
+        manifest_stat = os.stat(os.path.join(suite_dir, util.RESULTS_MANIFEST_FILE))
+        return [os.stat(suite_dir).st_mtime_ns, manifest_stat.st_mtime_ns, manifest_stat.st_size]
+    except FileNotFoundError:
+        return None
+
+
+def _dir_mtimes(path: str, depth: int) -> List:
+    """Lists the modification times of `path` and of its result directories (run_i/rep_j)."""
+
+    try:
+        mtimes = [os.stat(path).st_mtime_ns]
+        entries = sorted(os.scandir(path), key=lambda e: e.name)
+    except FileNotFoundError:
+        return []
+
+    if depth < 3:
+        for entry in entries:
+            if entry.is_dir() and util._is_results_dir(entry.name, depth + 1):
+                mtimes.append((entry.name, _dir_mtimes(entry.path, depth + 1)))
+    return mtimes
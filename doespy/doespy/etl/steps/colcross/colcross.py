@@ -19,8 +19,6 @@ from doespy.etl.steps.colcross.components import (
 )
 from doespy.etl.steps.colcross.subplots.bar import GroupedStackedBarChart
 from doespy.etl.steps.colcross.subplots.box import GroupedBoxplotChart
-from matplotlib import pyplot as plt
-from matplotlib.ticker import FuncFormatter
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Literal, NamedTuple, Tuple, Union, Optional
@@ -1,5 +1,5 @@
 from doespy.etl.steps.colcross.base import BaseSubplotConfig, is_match
-from matplotlib import pyplot as plt
+from doespy.etl.etl_util import to_numeric
 
 from enum import Enum
 from doespy.design.etl_design import MyETLBaseModel
@@ -64,6 +64,8 @@ class SubplotGrid(MyETLBaseModel):
         subplot_size: WidthHeight = None,
     ):
         """:meta private:"""
+        from matplotlib import pyplot as plt
+
         # NOTE: also assumes correctly sorted df
 
         def dict_to_tuple(d):
@@ -217,7 +219,7 @@ class Metric(MyETLBaseModel):
         # NOTE: If a column is both a metric and a group column, then it will not remain numeric
         # TODO [nku] could add a check for this
         metric_cols = list(metric_cols)
-        df[metric_cols] = df[metric_cols].apply(pd.to_numeric)
+        df = to_numeric(df, metric_cols)
 
         for metric_name, metric in metrics.items():
 
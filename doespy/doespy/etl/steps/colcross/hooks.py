@@ -7,10 +7,11 @@ import numpy as np
 import pandas as pd
 from enum import Enum
 
-from matplotlib import pyplot as plt
+# matplotlib is only imported when a plot is created (i.e., not when the ETL steps are loaded)
+if typing.TYPE_CHECKING:
+    from matplotlib import pyplot as plt
 
 from gossip import Blueprint
-from matplotlib.ticker import FuncFormatter
 
 
 default_hooks = Blueprint()
@@ -62,8 +63,8 @@ def demo(df_plot: pd.DataFrame, plot_id: Dict[str, typing.Any], loader):
 
 @default_hooks.register(CcpHooks.FigPreGroup)
 def demo(
-    fig: plt.Figure,
-    axs: List[List[plt.Axes]],
+    fig: "plt.Figure",
+    axs: "List[List[plt.Axes]]",
     df_plot: pd.DataFrame,
     plot_id: Dict[str, typing.Any],
     plot_config,
@@ -88,7 +89,7 @@ def demo(
 
 @default_hooks.register(CcpHooks.SubplotPreChart)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     plot_config,
@@ -101,7 +102,7 @@ def demo(
 
 @default_hooks.register(CcpHooks.SubplotPostChart)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     plot_config,
@@ -114,8 +115,8 @@ def demo(
 
 @default_hooks.register(CcpHooks.FigPost)
 def demo(
-    fig: plt.Figure,
-    axs: List[List[plt.Axes]],
+    fig: "plt.Figure",
+    axs: "List[List[plt.Axes]]",
     df_plot: pd.DataFrame,
     plot_id: Dict[str, typing.Any],
     plot_config,
@@ -159,6 +160,8 @@ def ax_legend(ax, df_subplot, subplot_id, plot_config, subplot_config, loader):
 @default_hooks.register(CcpHooks.SubplotPostChart)
 def axis(ax, df_subplot, subplot_id, plot_config, subplot_config, loader):
 
+    from matplotlib.ticker import FuncFormatter
+
     xcfg = AxisConfig() if subplot_config.xaxis is None else subplot_config.xaxis
     ycfg = AxisConfig() if subplot_config.yaxis is None else subplot_config.yaxis
 
@@ -4,9 +4,11 @@ from doespy.etl.steps.colcross.components import (
     Metric,
 )
 from doespy.etl.steps.colcross.subplots.bar_hooks import BarHooks
-from matplotlib import pyplot as plt
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib import pyplot as plt
 
 from doespy.design.etl_design import MyETLBaseModel
 from dataclasses import dataclass
@@ -93,7 +95,7 @@ class GroupedStackedBarChart(MyETLBaseModel):
 
     def plot(
         self,
-        ax: plt.Axes,
+        ax: "plt.Axes",
         df1: pd.DataFrame,
         data_id: Dict[str, str],
         metric: Metric,
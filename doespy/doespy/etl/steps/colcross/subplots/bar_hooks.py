@@ -8,7 +8,8 @@ import numpy as np
 import pandas as pd
 from enum import Enum
 
-from matplotlib import pyplot as plt
+if typing.TYPE_CHECKING:
+    from matplotlib import pyplot as plt
 
 
 class BarHooks(str, Enum):
@@ -28,7 +29,7 @@ class BarHooks(str, Enum):
 # TODO [nku] for each can write a docstring to explain the arguments
 @default_hooks.register(BarHooks.SubplotPre)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
@@ -42,7 +43,7 @@ def demo(
 
 @default_hooks.register(BarHooks.ArtistPre)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     part_value: float,
     part_error: Optional[float],
     position,
@@ -59,7 +60,7 @@ def demo(
 
 @default_hooks.register(BarHooks.ArtistPost)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     part_value: float,
     part_error: Optional[float],
     position,
@@ -76,7 +77,7 @@ def demo(
 
 @default_hooks.register(BarHooks.SubplotPost)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
@@ -95,7 +96,7 @@ def demo(
 
 @default_hooks.register(BarHooks.SubplotPost)
 def group_bar_ticks(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
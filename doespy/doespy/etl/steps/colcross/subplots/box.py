@@ -5,9 +5,11 @@ from doespy.etl.steps.colcross.components import (
 )
 from doespy.etl.steps.colcross.subplots.bar import calc_positions
 from doespy.etl.steps.colcross.subplots.box_hooks import BoxHooks
-from matplotlib import pyplot as plt
 import pandas as pd
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib import pyplot as plt
 
 from doespy.design.etl_design import MyETLBaseModel
 from dataclasses import dataclass
@@ -89,7 +91,7 @@ class GroupedBoxplotChart(MyETLBaseModel):
 
     def plot(
         self,
-        ax: plt.Axes,
+        ax: "plt.Axes",
         df1: pd.DataFrame,
         data_id: Dict[str, str],
         metric: Metric,
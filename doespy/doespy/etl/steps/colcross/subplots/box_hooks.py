@@ -8,7 +8,8 @@ import numpy as np
 import pandas as pd
 from enum import Enum
 
-from matplotlib import pyplot as plt
+if typing.TYPE_CHECKING:
+    from matplotlib import pyplot as plt
 
 
 class BoxHooks(str, Enum):
@@ -28,7 +29,7 @@ class BoxHooks(str, Enum):
 # TODO [nku] for each can write a docstring to explain the arguments
 @default_hooks.register(BoxHooks.SubplotPre)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
@@ -42,7 +43,7 @@ def demo(
 
 @default_hooks.register(BoxHooks.ArtistPre)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     part_values: List[float],
     position,
     box_id: Dict[str, typing.Any],
@@ -58,7 +59,7 @@ def demo(
 
 @default_hooks.register(BoxHooks.ArtistPost)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     part_values: List[float],
     position,
     box_id: Dict[str, typing.Any],
@@ -74,7 +75,7 @@ def demo(
 
 @default_hooks.register(BoxHooks.SubplotPost)
 def demo(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
@@ -93,7 +94,7 @@ def demo(
 
 @default_hooks.register(BoxHooks.SubplotPost)
 def group_box_ticks(
-    ax: plt.Axes,
+    ax: "plt.Axes",
     df_subplot: pd.DataFrame,
     subplot_id: Dict[str, typing.Any],
     metric: Metric,
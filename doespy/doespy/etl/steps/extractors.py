@@ -1,15 +1,72 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Union
+from typing import ClassVar, Iterator, List, Dict, Literal, Optional, Union
 
 import warnings
 import ruamel.yaml
 import json
 import csv
+import gzip
+import itertools
+import lzma
+import mmap
+import os
+import re
+
+import numpy as np
+import pandas as pd
+from tqdm import tqdm
+
+try:
+    # optional: faster json parser
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # optional: reading zstd compressed result files
+    import zstandard
+except ImportError:
+    zstandard = None
 
 import sys
 import inspect
 
-from pydantic import ConfigDict, BaseModel, field_validator
+from pydantic import ConfigDict, BaseModel, Field, field_validator
+
+
+# result files with these suffixes are decompressed transparently
+#   (a file `out.csv.gz` is matched as `out.csv` if no extractor matches the full name)
+COMPRESSION_SUFFIXES = (".gz", ".zst", ".xz")
+
+
+def strip_compression_suffix(file: str) -> str:
+    """Removes the compression suffix of a result file name (e.g., `out.csv.gz` -> `out.csv`)."""
+    for suffix in COMPRESSION_SUFFIXES:
+        if file.endswith(suffix):
+            return file[: -len(suffix)]
+    return file
+
+
+def open_result_file(path: str, mode: str = "r"):
+    """Opens a result file for reading (text or binary `mode`),
+    and transparently decompresses `.gz`, `.zst`, and `.xz` files.
+
+    A compressed result file (e.g., `out.csv.gz`) is passed to the extractor that matches the original name (`out.csv`),
+    i.e., custom extractors should use this function instead of `open` to read the decompressed content.
+    """
+
+    text_mode = "b" not in mode
+
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt" if text_mode else "rb")
+    elif path.endswith(".xz"):
+        return lzma.open(path, "rt" if text_mode else "rb")
+    elif path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError(f"reading a zstd compressed result file requires the zstandard package: {path}")
+        return zstandard.open(path, "rt" if text_mode else "rb")
+
+    return open(path, mode)
 
 
 class Extractor(BaseModel, ABC):
@@ -17,6 +74,23 @@ class Extractor(BaseModel, ABC):
     file_regex: Union[str, List[str]] = None
     model_config = ConfigDict(extra="forbid")
 
+    result_schema: Optional[Dict[str, str]] = Field(None, alias="schema")
+    """Optional dtypes of the extracted columns, e.g., ``schema: {lat: float32, op: category, ts: timestamp}``.
+    The dtypes (any pandas dtype or `timestamp`) are applied while the extracted columns are assembled
+    s.t., the df and later steps operate on compact, native dtypes (the categories of a `category` column cover all experiments and chunks)."""
+
+    @field_validator("result_schema")
+    @classmethod
+    def check_schema(cls, value):
+        if value is not None:
+            for col, dtype in value.items():
+                if dtype != "timestamp":
+                    try:
+                        pd.api.types.pandas_dtype(dtype)
+                    except TypeError:
+                        raise ValueError(f"schema: unknown dtype={dtype} for column={col}")
+        return value
+
     @classmethod
     def default_file_regex(cls):
         pass
@@ -48,6 +122,26 @@ class Extractor(BaseModel, ABC):
 
         pass
 
+    def extract_frame(self, path: str, options: Dict) -> pd.DataFrame:
+        """Optional columnar alternative to `extract`:
+            Reads the file defined by `path`, and converts it into a table with a column per result field
+            (avoids creating a dict per result for large files).
+            If overridden, the ETL uses `extract_frame` instead of `extract`
+            (which can then be implemented as ``self.extract_frame(path, options).to_dict("records")``).
+        Args:
+            path (str): absolute path of file to extract
+            options (Dict): extractor options as provided in the ETL definition
+        Returns:
+            pd.DataFrame: results found in the file (a `pyarrow.Table` is also supported),
+                the default implementation returns None (not columnar, see `is_columnar`)
+        """
+        return None
+
+    @classmethod
+    def is_columnar(cls) -> bool:
+        """Indicates whether the extractor overrides `extract_frame`."""
+        return cls.extract_frame is not Extractor.extract_frame
+
 
 class YamlExtractor(Extractor):
 
@@ -72,7 +166,7 @@ class YamlExtractor(Extractor):
 
     def extract(self, path: str, options: Dict) -> List[Dict]:
         # load file as yaml: if top level element is object -> return one element list
-        with open(path, "r") as f:
+        with open_result_file(path, "r") as f:
             data = ruamel.yaml.safe_load(f)
         if not isinstance(data, list):
             data = [data]
@@ -101,7 +195,7 @@ class JsonExtractor(Extractor):
 
     def extract(self, path: str, options: Dict) -> List[Dict]:
         # load file as json: if top level element is object -> return one element list
-        with open(path, "r") as f:
+        with open_result_file(path, "r") as f:
             data = json.load(f)
 
         if not isinstance(data, list):
@@ -110,6 +204,87 @@ class JsonExtractor(Extractor):
         return data
 
 
+class JsonLinesExtractor(Extractor):
+    """
+    The `JsonLinesExtractor` reads result files in the JSON Lines format (newline-delimited JSON),
+    i.e., each line is a JSON object (result).
+
+    The file is parsed in batches of lines (with `orjson` if installed) into columns,
+    i.e., without keeping a dict per line.
+    With ``columns``, only the selected keys are extracted
+    (nested keys are separated by a dot, e.g., ``stats.lat``).
+
+    .. code-block:: yaml
+        :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                JsonLinesExtractor: {}         # with default file_regex
+                JsonLinesExtractor:            # with custom file_regex and projection
+                    file_regex: [trace.jsonl]
+                    columns: [op, stats.lat]
+    """
+
+    file_regex: Union[str, List[str]] = [r".*\.jsonl$", r".*\.ndjson$"]
+    """The regex list to match result files."""
+
+    columns: Optional[List[str]] = None
+    """The keys to extract (by default, all keys)."""
+
+    batch_size: int = 10000
+    """The number of lines parsed at once."""
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict) -> pd.DataFrame:
+
+        if self.columns is None:
+            dfs = []
+        else:
+            paths = {col: col.split(".") for col in self.columns}
+            data = {col: [] for col in self.columns}
+
+        with open_result_file(path, "rb") as f:
+            while True:
+                batch_lines = list(itertools.islice(f, self.batch_size))
+                if len(batch_lines) == 0:
+                    # end of file
+                    break
+
+                lines = [line for line in batch_lines if line.strip()]
+                if len(lines) == 0:
+                    # (a batch of only blank lines)
+                    continue
+
+                # parse the batch with a single call
+                batch = b"[" + b",".join(lines) + b"]"
+                objs = json.loads(batch) if orjson is None else orjson.loads(batch)
+
+                if self.columns is None:
+                    # (nested objects are flattened as in the other extractors)
+                    dfs.append(pd.json_normalize(objs))
+                else:
+                    for col, keys in paths.items():
+                        data[col].extend(_get_nested(obj, keys) for obj in objs)
+
+        if self.columns is not None:
+            return pd.DataFrame(data)
+
+        if len(dfs) == 0:
+            return pd.DataFrame()
+
+        return pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+
+
+def _get_nested(obj: Dict, keys: List[str]):
+    for k in keys:
+        if not isinstance(obj, dict) or k not in obj:
+            return np.nan
+        obj = obj[k]
+    return obj
+
+
 class CsvExtractor(Extractor):
     """
     The `CsvExtractor` reads result files as CSV.
@@ -148,7 +323,7 @@ class CsvExtractor(Extractor):
 
         data = []
 
-        with open(path, "r") as f:
+        with open_result_file(path, "r") as f:
 
             if self.has_header or self.fieldnames is not None:
                 reader = csv.DictReader(f, delimiter=self.delimiter, fieldnames=self.fieldnames)
@@ -160,6 +335,288 @@ class CsvExtractor(Extractor):
         return data
 
 
+class FastCsvExtractor(CsvExtractor):
+    """
+    The `FastCsvExtractor` reads result files as CSV with the native CSV reader of pandas
+    (C engine or pyarrow) and returns typed columns instead of a dict of strings per row.
+    It supports the same options as the `CsvExtractor` and is suited for large CSV files.
+
+    .. code-block:: yaml
+       :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                FastCsvExtractor: {}         # with default params
+                FastCsvExtractor:            # with custom params
+                    file_regex: [out.csv]
+                    delimiter: ;
+                    has_header: False
+                    fieldnames: [col1, col2, col3]
+                    engine: pyarrow
+    """
+
+    engine: Literal["c", "pyarrow"] = "c"
+    """The CSV parser of pandas (`pyarrow` requires the pyarrow package)."""
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict) -> pd.DataFrame:
+
+        # as in the CsvExtractor (csv.DictReader): with fieldnames, the first row is a result (also with has_header)
+        header = 0 if self.has_header and self.fieldnames is None else None
+
+        try:
+            return pd.read_csv(
+                path,
+                sep=self.delimiter,
+                header=header,
+                names=self.fieldnames,
+                engine=self.engine,
+            )
+        except pd.errors.EmptyDataError:
+            # (consistent with the CsvExtractor: an empty file has no results)
+            return pd.DataFrame()
+
+
+class ParquetExtractor(Extractor):
+    """
+    The `ParquetExtractor` reads result files in the Parquet format (requires `pyarrow`).
+    Each row is a result and the columns are read memory-mapped without conversion to python objects.
+
+    .. code-block:: yaml
+       :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                ParquetExtractor: {}         # with default file_regex
+                ParquetExtractor:            # with custom file_regex and projection
+                    file_regex: [out.parquet]
+                    columns: [op, lat]
+    """
+
+    file_regex: Union[str, List[str]] = [r".*\.parquet$"]
+    """The regex list to match result files."""
+
+    columns: Optional[List[str]] = None
+    """The columns to extract (by default, all columns)."""
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_pandas().to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=self.columns, memory_map=True)
+
+
+class FeatherExtractor(Extractor):
+    """
+    The `FeatherExtractor` reads result files in the Feather / Arrow IPC format (requires `pyarrow`).
+    Each row is a result and the columns are read memory-mapped without conversion to python objects.
+
+    .. code-block:: yaml
+       :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                FeatherExtractor: {}         # with default file_regex
+                FeatherExtractor:            # with custom file_regex and projection
+                    file_regex: [out.arrow]
+                    columns: [op, lat]
+    """
+
+    file_regex: Union[str, List[str]] = [r".*\.feather$", r".*\.arrow$"]
+    """The regex list to match result files."""
+
+    columns: Optional[List[str]] = None
+    """The columns to extract (by default, all columns)."""
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_pandas().to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict):
+        import pyarrow.feather as feather
+
+        return feather.read_table(path, columns=self.columns, memory_map=True)
+
+
+class NumpyExtractor(Extractor):
+    """
+    The `NumpyExtractor` reads result files with NumPy arrays (``.npy`` or ``.npz``).
+
+    - ``.npy``: The array is memory-mapped.
+      A structured array results in a column per field,
+      a 2-D array in a column per array column, and a 1-D array in a single column.
+    - ``.npz``: Each (1-D) array of the archive results in a column named after the array.
+
+    .. code-block:: yaml
+       :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                NumpyExtractor: {}         # with default params
+                NumpyExtractor:            # with custom params
+                    file_regex: [lat.npy]
+                    fieldnames: [lat]
+    """
+
+    file_regex: Union[str, List[str]] = [r".*\.npy$", r".*\.npz$"]
+    """The regex list to match result files."""
+
+    fieldnames: List[str] = None
+    """The names of the columns of a 1-D or 2-D array (default: ``value`` for 1-D and the column index for 2-D)."""
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict) -> pd.DataFrame:
+
+        if path.endswith(".npz"):
+            with np.load(path) as npz:
+                return pd.DataFrame({k: npz[k] for k in npz.files})
+
+        arr = np.load(path, mmap_mode="r")
+
+        if arr.dtype.names is not None:
+            # structured array
+            return pd.DataFrame({k: arr[k] for k in arr.dtype.names})
+
+        if arr.ndim == 1:
+            name = "value" if self.fieldnames is None else self.fieldnames[0]
+            return pd.DataFrame({name: arr})
+
+        if arr.ndim == 2:
+            return pd.DataFrame(arr, columns=self.fieldnames)
+
+        raise ValueError(f"NumpyExtractor: unsupported array with shape={arr.shape}  (path={path})")
+
+
+class RegexLogExtractor(Extractor):
+    r"""
+    The `RegexLogExtractor` extracts results from (large) human-readable log files, e.g., stdout.log,
+    with regex patterns.
+    The file is memory-mapped and scanned line by line without loading it into memory
+    (a compressed file is decompressed in blocks of lines).
+    The named groups of the patterns become the columns of the results.
+
+    With ``match: all``, each match is a result (in the order of the file).
+    With ``match: first`` or ``match: last``, the file results in a single result
+    with the named groups of the first (last) match of each pattern.
+
+    .. code-block:: yaml
+       :caption: Example ETL Pipeline Design
+
+        $ETL$:
+            extractors:
+                RegexLogExtractor:
+                    file_regex: [^stdout.log$]
+                    patterns:
+                      - 'throughput: (?P<tput>[\d.]+) ops/s'
+                      - '^latency p99: (?P<lat_p99>[\d.]+)ms$'
+                    match: last
+    """
+
+    file_regex: Union[str, List[str]]
+    """The regex list to match result files."""
+
+    patterns: List[str]
+    """The regex patterns (with named groups) applied to each line of the file."""
+
+    match: Literal["first", "last", "all"] = "all"
+    """Keep the first, the last, or all matches of each pattern."""
+
+    # show the progress of files larger than this
+    _progress_min_bytes: ClassVar[int] = 64 * 1024**2
+
+    # the size of the blocks of lines of a compressed file
+    _block_bytes: ClassVar[int] = 4 * 1024**2
+
+    @field_validator("patterns")
+    @classmethod
+    def check_patterns(cls, value):
+        for pattern in value:
+            if re.compile(pattern).groupindex == {}:
+                raise ValueError(f"pattern without a named group: {pattern}")
+        return value
+
+    def extract(self, path: str, options: Dict) -> List[Dict]:
+        return self.extract_frame(path, options).to_dict("records")
+
+    def extract_frame(self, path: str, options: Dict) -> pd.DataFrame:
+
+        # (MULTILINE s.t. ^ and $ match at the start and end of each line)
+        regexes = [re.compile(p.encode(), flags=re.MULTILINE) for p in self.patterns]
+
+        if path.endswith(COMPRESSION_SUFFIXES):
+            # (a compressed file cannot be memory-mapped -> decompressed as a stream of blocks of lines)
+            with open_result_file(path, "rb") as f:
+                blocks = iter(lambda: b"".join(f.readlines(self._block_bytes)), b"")
+                return self._scan(blocks, regexes, path, size=None)
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # (an empty file cannot be memory-mapped)
+                return pd.DataFrame()
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._scan([mm], regexes, path, size=size)
+
+    def _scan(self, blocks: Iterator, regexes: List, path: str, size: Optional[int]) -> pd.DataFrame:
+        # scans the blocks of the file in order (each block ends at a line break)
+
+        first = [None] * len(regexes)
+        last = [None] * len(regexes)
+        matches = []
+
+        with tqdm(total=size, unit="B", unit_scale=True, leave=False, desc=f"scanning {os.path.basename(path)}",
+                  disable=os.path.getsize(path) < self._progress_min_bytes) as progress:
+
+            offset = 0
+            for buf in blocks:
+                for i, regex in enumerate(regexes):
+                    if self.match == "first":
+                        if first[i] is None:
+                            m = regex.search(buf)
+                            first[i] = None if m is None else _decode_groups(m)
+                    elif self.match == "last":
+                        m = None
+                        for m in regex.finditer(buf):
+                            pass
+                        if m is not None:
+                            last[i] = _decode_groups(m)
+                    else:
+                        matches.extend((offset + m.start(), _decode_groups(m)) for m in regex.finditer(buf))
+
+                offset += len(buf)
+                progress.update(len(buf))
+
+                if self.match == "first" and all(row is not None for row in first):
+                    # (no need to read the rest of the file)
+                    break
+
+        if self.match == "all":
+            # all matches of all patterns in the order of the file
+            matches.sort(key=lambda x: x[0])
+            return pd.DataFrame([row for _, row in matches])
+
+        row = {}
+        for groups in first if self.match == "first" else last:
+            if groups is not None:
+                row.update(groups)
+        return pd.DataFrame([row] if row else [])
+
+
+def _decode_groups(m) -> Dict[str, str]:
+    return {k: None if v is None else v.decode(errors="replace") for k, v in m.groupdict().items()}
+
+
+# prefix of the warning for a non-empty error file
+#   (the ETL aggregates these warnings into a report in the etl results instead of printing them)
+ERROR_FILE_WARNING = "found error file: "
+
+
 class ErrorExtractor(Extractor):
     """
     The `ErrorExtractor` provides a mechanism to detect potential errors in an experiment job.
@@ -167,6 +624,9 @@ class ErrorExtractor(Extractor):
     because there are many output folders and files e.g., the stderr.log of each job.
 
     The `ErrorExtractor` raises a warning if matching files are not empty.
+    Empty files are detected without reading them, and of other files, only the first and last ``sample_bytes`` are read.
+    The ETL aggregates the warnings of an experiment into a report in the etl results (``error_report_<EXP>.json``)
+    with the number of error files, the distinct error messages, and the paths of the first error files.
 
     .. code-block:: yaml
        :caption: Example ETL Pipeline Design
@@ -182,20 +642,45 @@ class ErrorExtractor(Extractor):
     file_regex: Union[str, List[str]] = ["^stderr.log$"]
     """The regex list to match result files."""
 
+    sample_bytes: int = 2048
+    """The number of bytes read from the start and from the end of a non-empty error file."""
+
 
     def extract(self, path: str, options: Dict) -> List[Dict]:
+
+        if not path.endswith(COMPRESSION_SUFFIXES) and os.stat(path).st_size == 0:
+            # fast path: empty error file
+            return []
+
         # if the file is present and not empty, then throws a warning
-        with open(path, "r") as f:
-            content = f.read().replace("\n", " ")
+        sample = self._read_sample(path)
 
-        if (
-            content.strip() and not content.strip().isspace()
-        ):  # ignore empty error files
+        if sample.strip():  # ignore empty error files
             # TODO [nku] should we not raise an error in the etl pipeline?
-            warnings.warn(f"found error file: {path}")
-            warnings.warn(f"   {content}")
+            warnings.warn(f"{ERROR_FILE_WARNING}{path}\n{sample}")
         return []
 
+    def _read_sample(self, path: str) -> str:
+        # reads the start and the end of the file (the middle of a large file is omitted)
+        n = self.sample_bytes
+        with open_result_file(path, "rb") as f:
+            head = f.read(n)
+            if path.endswith(COMPRESSION_SUFFIXES):
+                # (no random access -> stream to the end of the file with bounded memory)
+                tail, n_omitted = b"", 0
+                for block in iter(lambda: f.read(n), b""):
+                    tail += block
+                    n_omitted += max(0, len(tail) - n)
+                    tail = tail[-n:]
+            else:
+                size = os.fstat(f.fileno()).st_size
+                f.seek(max(n, size - n))
+                tail = f.read(n)
+                n_omitted = max(0, size - 2 * n)
+
+        sep = f"\n[... {n_omitted} bytes omitted ...]\n".encode() if n_omitted > 0 else b""
+        return (head + sep + tail).decode(errors="replace")
+
 
 class IgnoreExtractor(Extractor):
     """
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, TYPE_CHECKING
 
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
 import inspect
 import sys
 from typing import Optional
 
+if TYPE_CHECKING:
+    # (matplotlib is only imported when a plot is created -> fast startup of the etl)
+    import matplotlib.pyplot as plt
+
 from pydantic import ConfigDict, BaseModel
 
 class Loader(BaseModel, ABC):
@@ -50,7 +53,7 @@ class PlotLoader(Loader):
 
     def save_plot(
         self,
-        fig: plt.Figure,
+        fig: "plt.Figure",
         filename: str,
         output_dir: str,
         use_tight_layout: bool = True,
@@ -76,6 +79,8 @@ class PlotLoader(Loader):
 
     def default_fig(self):
         """:meta private:"""
+        import matplotlib.pyplot as plt
+
         scale_factor = 2.4
         figsize = [
             scale_factor * 1.618,
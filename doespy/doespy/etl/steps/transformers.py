@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import ClassVar, Dict, Any, Iterator, List
 
+import numpy as np
 import pandas as pd
 import inspect
 import sys
@@ -9,7 +10,7 @@ from pydantic import ConfigDict, BaseModel, field_validator
 
 import pandas as pd
 
-from doespy.etl.etl_util import expand_factors
+from doespy.etl.etl_util import concat_frames, expand_factors, to_numeric
 
 
 class Transformer(BaseModel, ABC):
@@ -22,6 +23,10 @@ class Transformer(BaseModel, ABC):
     def set_name(cls, value):
         return cls.__name__
 
+    chunk_safe: ClassVar[bool] = False
+    """Row-wise transformers (e.g., filters) can be applied to each chunk of the df separately
+    in the streaming execution of a pipeline (see ``memory_budget``)."""
+
     @abstractmethod
     def transform(self, df: pd.DataFrame, options: Dict) -> pd.DataFrame:
 
@@ -29,6 +34,14 @@ class Transformer(BaseModel, ABC):
 
         pass
 
+    def transform_chunks(self, chunks: Iterator[pd.DataFrame], options: Dict) -> pd.DataFrame:
+        """Reduces the chunks of the df in the streaming execution of a pipeline (see ``memory_budget``).
+
+        Transformers that can compute partial results per chunk (e.g., aggregates) override this method.
+        Returns None if the transformer requires the complete df.
+        """
+        return None
+
 
 class DfTransformer(Transformer):
 
@@ -96,6 +109,8 @@ class ConditionalTransformer(Transformer):
         the value is the replacement used in the ``dest`` column."""
 
 
+    chunk_safe: ClassVar[bool] = True
+
     def transform(self, df: pd.DataFrame, options: Dict) -> pd.DataFrame:
 
         col = self.col
@@ -185,7 +200,7 @@ class RepAggTransformer(Transformer):
             )
 
         # ensure that all data_columns are numbers
-        df[data_columns] = df[data_columns].apply(pd.to_numeric)
+        df = to_numeric(df, data_columns)
 
         # we need to convert each column into a hashable type
         # (list and dict are converted to string)
@@ -205,7 +220,7 @@ class RepAggTransformer(Transformer):
             if col not in data_columns and col != "rep" and col not in ignore_columns
         ]
         agg_d = {data_col: agg_functions for data_col in data_columns}
-        df = df.groupby(group_by_cols).agg(agg_d).reset_index()
+        df = df.groupby(group_by_cols, observed=True).agg(agg_d).reset_index()
 
         # flatten columns
         df.columns = ["_".join(v) if v[1] else v[0] for v in df.columns.values]
@@ -313,7 +328,7 @@ class GroupByAggTransformer(Transformer):
             )
 
         # ensure that all data_columns are numbers
-        df[data_columns] = df[data_columns].apply(pd.to_numeric)
+        df = to_numeric(df, data_columns)
 
         # we need to convert each column into a hashable type
         # (list and dict are converted to string)
@@ -329,13 +344,153 @@ class GroupByAggTransformer(Transformer):
         # group_by all except `rep` and `data_columns`
         group_by_cols = groupby_columns
         agg_d = {data_col: agg_functions for data_col in data_columns}
-        df = df.groupby(group_by_cols, dropna=False).agg(agg_d).reset_index()
+        df = df.groupby(group_by_cols, dropna=False, observed=True).agg(agg_d).reset_index()
 
         # flatten columns
         df.columns = ["_".join(v) if v[1] else v[0] for v in df.columns.values]
 
         return df
 
+    # aggregate functions that can be computed from per chunk partial aggregates
+    _partial_agg_functions: ClassVar[List[str]] = ["mean", "min", "max", "std", "var", "count", "sum"]
+
+    # combine the partial aggregates once there are more than this many
+    _max_partials: ClassVar[int] = 64
+
+    def transform_chunks(self, chunks: Iterator[pd.DataFrame], options: Dict) -> pd.DataFrame:
+
+        if not set(self.agg_functions).issubset(self._partial_agg_functions):
+            # e.g., median or custom_tail require the complete df
+            return None
+
+        data_columns = self.data_columns
+
+        partials = []
+        factors = set()
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+
+            # $FACTORS$ expands to the union of the factors of all chunks
+            # (expand_factors replaces the magic entry in place -> pass a copy)
+            groupby_columns = expand_factors(chunk, self.groupby_columns.copy())
+            if "$FACTORS$" in self.groupby_columns:
+                factors.update(col for col in groupby_columns if col not in self.groupby_columns)
+
+            if not set(data_columns).issubset(chunk.columns.values):
+                raise ValueError(
+                    f"GroupByAggTransformer: data_columns={data_columns} "
+                    f"must be in each chunk of the df (chunk_columns={chunk.columns.values})"
+                )
+
+            partials.append(self._partial_agg(chunk, groupby_columns))
+
+            if len(partials) > self._max_partials:
+                partials = [self._combine_partials(partials, self._partial_groupby_columns(partials))]
+
+        if len(partials) == 0:
+            return pd.DataFrame()
+
+        groupby_columns = self.groupby_columns.copy()
+        if "$FACTORS$" in groupby_columns:
+            i = groupby_columns.index("$FACTORS$")
+            groupby_columns[i: i + 1] = list(factors)
+
+        df = concat_frames(partials, ignore_index=True)
+
+        # groups that are absent in some chunks are filled with NaN
+        #  -> convert to the same hashable types as in `transform`
+        for col in groupby_columns:
+            if col not in df.columns:
+                df[col] = np.nan
+            elif df[col].dtype == "object":
+                df[col] = df[col].astype("str")
+
+        df = self._combine_partials([df], groupby_columns)
+
+        out = df[groupby_columns].copy()
+        for col in data_columns:
+            n = df[f"{col}$count"]
+            for fun in self.agg_functions:
+                if fun in ["count", "sum", "min", "max"]:
+                    out[f"{col}_{fun}"] = df[f"{col}${fun}"]
+                elif fun == "mean":
+                    out[f"{col}_mean"] = df[f"{col}$mean"]
+                else:
+                    # sample variance (ddof=1)
+                    var = (df[f"{col}$m2"] / (n - 1)).where(n > 1)
+                    out[f"{col}_{fun}"] = var if fun == "var" else np.sqrt(var)
+        return out
+
+    def _partial_agg(self, df: pd.DataFrame, groupby_columns: List[str]) -> pd.DataFrame:
+
+        if not set(groupby_columns).issubset(df.columns.values):
+            raise ValueError(
+                f"GroupByAggTransformer: groupby_columns={groupby_columns} "
+                f"must be in df_columns={df.columns.values}"
+            )
+
+        df = df[groupby_columns + [col for col in self.data_columns if col not in groupby_columns]].copy()
+
+        # ensure that all data_columns are numbers
+        df = to_numeric(df, self.data_columns)
+
+        # same hashable types as in `transform`
+        hashable_types = {col: "str" for col in groupby_columns if df[col].dtype == "object"}
+        df = df.astype(hashable_types)
+
+        agg_d = {}
+        for col in self.data_columns:
+            agg_d[f"{col}$sum"] = (col, "sum")
+            agg_d[f"{col}$min"] = (col, "min")
+            agg_d[f"{col}$max"] = (col, "max")
+            agg_d[f"{col}$count"] = (col, "count")
+            agg_d[f"{col}$mean"] = (col, "mean")
+            agg_d[f"{col}$m2"] = (col, "var")
+
+        df = df.groupby(groupby_columns, dropna=False, observed=True).agg(**agg_d).reset_index()
+
+        for col in self.data_columns:
+            # sum of squared deviations from the mean (the variance is undefined for a single value)
+            df[f"{col}$m2"] = (df[f"{col}$m2"] * (df[f"{col}$count"] - 1)).where(df[f"{col}$count"] > 1, 0.0)
+        return df
+
+    def _partial_groupby_columns(self, partials: List[pd.DataFrame]) -> List[str]:
+        cols = []
+        for partial in partials:
+            cols += [col for col in partial.columns if "$" not in col and col not in cols]
+        return cols
+
+    def _combine_partials(self, partials: List[pd.DataFrame], groupby_columns: List[str]) -> pd.DataFrame:
+        df = concat_frames(partials, ignore_index=True) if len(partials) > 1 else partials[0]
+        for col in groupby_columns:
+            if col not in df.columns:
+                df[col] = np.nan
+
+        groups = df.groupby(groupby_columns, dropna=False, observed=True)
+        group_ids = groups.ngroup()
+
+        # merges the (count, mean, m2) of the partials of a group (Chan et al.):
+        #   mean = ref + sum(n_i * (mean_i - ref)) / n  and  m2 = sum(m2_i + n_i * (mean_i - mean)^2)
+        # (relative to the mean of a partial, i.e., without the cancellation of a sum of squares)
+        merged = {}
+        for col in self.data_columns:
+            count, mean = df[f"{col}$count"], df[f"{col}$mean"]
+            ref = groups[f"{col}$mean"].transform("first")
+            n = count.groupby(group_ids).transform("sum")
+            group_mean = ref + (count * (mean - ref)).groupby(group_ids).transform("sum") / n
+            merged[f"{col}$mean"] = group_mean
+            merged[f"{col}$m2"] = df[f"{col}$m2"] + count * (mean - group_mean) ** 2
+        df = df.assign(**merged)
+
+        agg_d = {}
+        for col in self.data_columns:
+            for fun in ["sum", "min", "max", "count", "m2"]:
+                agg_d[f"{col}${fun}"] = fun if fun in ["min", "max"] else "sum"
+            # (the same for all partials of a group)
+            agg_d[f"{col}$mean"] = "first"
+        return df.groupby(groupby_columns, dropna=False, observed=True).agg(agg_d).reset_index()
+
 
 class FilterColumnTransformer(Transformer):
 
@@ -1,5 +1,5 @@
 import argparse
-from doespy.etl import etl_base
+from doespy.etl import etl_base, etl_stats
 from doespy import util
 
 
@@ -31,6 +31,33 @@ def main():
     )
 
 
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Parse all result files again instead of reusing the extraction cache of unchanged files",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to extract the results (default: 1, i.e., no parallelism)",
+    )
+
+    parser.add_argument(
+        "--pipeline_jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes that run the pipelines concurrently (default: 1, i.e., one pipeline after another); the --jobs are split across them",
+    )
+
+    parser.add_argument(
+        "--stats_json",
+        type=str,
+        required=False,
+        help="Write the time, bytes, files, and rows per extractor and experiment to this json file (the summary is always printed)",
+    )
+
     parser.add_argument(
         "--pipelines",
         nargs="+",
@@ -59,6 +86,8 @@ def main():
 
     args = parser.parse_args()
 
+    extract_stats = {}
+
     etl_base.run_multi_suite(
         super_etl=args.config,
         etl_output_dir=args.output_path,
@@ -68,8 +97,16 @@ def main():
         pipeline_filter=args.pipelines,
         overwrite_suite_id_map=args.suite_id,
         return_df=False,
+        n_workers=args.jobs,
+        n_pipeline_workers=args.pipeline_jobs,
+        use_cache=not args.no_cache,
+        extract_stats=extract_stats,
     )
 
+    print(etl_stats.summary(extract_stats))
+    if args.stats_json is not None:
+        etl_stats.dump_json(extract_stats, args.stats_json)
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,4 @@
 import os
-import ruamel.yaml
 import argparse
 
 from doespy import util
@@ -31,13 +30,14 @@ def get_suite_status(dir):
         etl_error = None
     suite_status = {}
 
-    for exp in os.listdir(dir):
-        state_file = os.path.join(dir, exp, "state.yml")
-        if not os.path.exists(state_file):
+    # (read-only: the status does not write the persisted index of the etl, e.g., for shared result dirs)
+    index = util.get_suite_results_index(dir, persist=False)
+
+    for exp, exp_node in index["dirs"].items():
+        if "state.yml" not in exp_node["files"]:
             continue
 
-        with open(state_file) as file:
-            state = ruamel.yaml.safe_load(file)
+        state = util.load_config_yaml(os.path.join(dir, exp), file="state.yml")
         suite_status[exp] = {}
         suite_status[exp]["n_jobs"] = len(state["exp_job_ids"])
         suite_status[exp]["n_jobs_unfinished"] = len(state["exp_job_ids_unfinished"])
@@ -1,10 +1,20 @@
 import os
+import copy
+import json
+import time
 import ruamel.yaml
 import jinja2
 import jmespath
 from glob import glob
+from functools import lru_cache
 import importlib.util
 
+try:
+    # optional: faster json parser
+    import orjson
+except ImportError:
+    orjson = None
+
 def get_project_dir():
     if "DOES_PROJECT_DIR" not in os.environ:
         raise ValueError("env variable: DOES_PROJECT_DIR not set")
@@ -35,10 +45,24 @@ def get_project_id():
 
 
 def get_suite_design(suite, folder=None):
+    """Loads the (rendered) suite design.
+
+    The design is memoized per process as long as the design file is unchanged
+    (e.g., the validation of a design with etl includes loads the designs of other suites repeatedly),
+    the caller always receives its own copy.
+    """
 
     if folder is None:
         folder = get_suite_design_dir()
 
+    st = os.stat(os.path.join(folder, f"{suite}.yml"))
+    suite_design = _load_suite_design(folder, suite, st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(suite_design)
+
+
+@lru_cache(maxsize=256)
+def _load_suite_design(folder, suite, mtime_ns, size):
+    # mtime_ns and size are part of the cache key -> a changed design is loaded again
     env = jinja2_env(
         loader=jinja2.FileSystemLoader(folder), undefined=DebugChainableUndefined
     )
@@ -47,8 +71,7 @@ def get_suite_design(suite, folder=None):
     template_vars = {}
     suite_design = template.render(**template_vars)
 
-    suite_design = ruamel.yaml.safe_load(suite_design)
-    return suite_design
+    return _yaml_safe.load(suite_design)
 
 
 def get_suite_design_path(suite):
@@ -165,6 +188,9 @@ def get_does_results(ignore_expected=True):
 
 
     for suite_run_id in os.listdir(results_dir):
+        if suite_run_id.startswith("."):
+            # not a suite run (e.g., the .etl_watch dir of the etl watch service)
+            continue
         if os.path.isdir(os.path.join(results_dir, suite_run_id)):
             suite, suite_id = from_folder(name=suite_run_id)
 
@@ -278,8 +304,7 @@ def jinja2_env(loader, undefined, variable_start_string="{{", variable_end_strin
 
     env.filters["json_query"] = json_query
 
-    from distutils.util import strtobool
-    env.filters["bool"] = strtobool
+    env.filters["bool"] = _strtobool
 
     from math import ceil, floor
     env.filters["ceil"] = ceil
@@ -310,6 +335,17 @@ def jinja2_env(loader, undefined, variable_start_string="{{", variable_end_strin
     return env
 
 
+def _strtobool(val):
+    """Converts a string representation of truth to 1 or 0 (as `distutils.util.strtobool`, without importing distutils)."""
+    val = val.lower()
+    if val in ("y", "yes", "t", "true", "on", "1"):
+        return 1
+    elif val in ("n", "no", "f", "false", "off", "0"):
+        return 0
+    else:
+        raise ValueError(f"invalid truth value {val!r}")
+
+
 def get_suite_design_etl_template_dir():
     return os.path.join(get_suite_design_dir(), "etl_templates")
 
@@ -328,19 +364,232 @@ def get_setup_roles():
 
 
 def _list_dir_only(path):
-    lst = [f for f in os.listdir(path) if os.path.isdir(os.path.join(path, f))]
+    # scandir provides the file type from the directory listing (no extra stat per entry)
+    with os.scandir(path) as it:
+        lst = [entry.name for entry in it if entry.is_dir()]
     return lst
 
 def _list_files_only(path):
-    def _is_file(path, f):
-        return not os.path.isdir(os.path.join(path, f))
-
-    lst = [f for f in os.listdir(path) if _is_file(path, f)]
+    with os.scandir(path) as it:
+        lst = [entry.name for entry in it if not entry.is_dir()]
     return lst
 
+
+ETL_CACHE_DIR = ".etl_cache"
+
+RESULTS_INDEX_FILE = "results_index.json"
+
+# written by the `collect_results` module of the experiment-job role (one json line per fetched host)
+RESULTS_MANIFEST_FILE = ".manifest.jsonl"
+
+# results are organized in: <suite>_<id>/<exp>/run_<i>/rep_<j>/<host_type>/host_<k>/<file>
+_RESULTS_INDEX_DEPTH = 5
+
+# the mtime has a coarse granularity on some file systems (e.g., 2s on FAT)
+_MTIME_GRANULARITY_NS = 2 * 10**9
+
+
+def get_suite_results_index(suite_dir, persist=True):
+    """Builds an index of the directory tree with the results of a suite.
+
+    With `persist`, the index is persisted in the `.etl_cache` of the suite and
+    on later calls, only directories with a changed modification time are listed again.
+    Without `persist`, the directories are listed and nothing is written (e.g., for read-only result dirs).
+
+    Returns:
+        Dict: tree of nodes {"mtime_ns": .., "dirs": {name: node}, "files": [name]}
+            starting at the `suite_dir`
+    """
+
+    index_path = os.path.join(suite_dir, ETL_CACHE_DIR, RESULTS_INDEX_FILE)
+
+    old_index = None
+    if persist and os.path.isfile(index_path):
+        try:
+            with open(index_path, "r") as f:
+                old_index = json.load(f)
+        except ValueError:
+            old_index = None
+
+    index = _scan_results_dir(suite_dir, old_index, depth=0, now_ns=time.time_ns())
+
+    if persist and index != old_index:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, index_path)
+
+    return index
+
+
+def get_suite_results_manifest_index(suite_dir):
+    """Builds the index of the results of a suite (see `get_suite_results_index`)
+    from the manifest that is written while collecting the results.
+
+    Returns:
+        Dict: index of the results or None if the manifest cannot be used,
+            i.e., it does not exist, does not cover all results of the suite,
+            or a directory of the results (experiment, run, rep, host type, or host)
+            is missing or its listing differs from the manifest.
+    """
+
+    manifest_path = os.path.join(suite_dir, RESULTS_MANIFEST_FILE)
+
+    try:
+        manifest_mtime_ns = os.stat(manifest_path).st_mtime_ns
+        with open(manifest_path, "r") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return None
+
+    hosts = {}
+    for i, line in enumerate(lines):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # (the last line can be partial if the collection was interrupted)
+            return None
+        if i == 0:
+            if not entry.get("complete", False):
+                return None
+            continue
+        # the same host can be fetched multiple times -> later entries win
+        key = (entry["exp_name"], entry["run"], entry["rep"], entry["host_type"], entry["host"])
+        hosts[key] = entry
+
+    index = {"mtime_ns": None, "dirs": {}, "files": []}
+    for (exp, run, rep, host_type, host), entry in hosts.items():
+        node = index
+        for name in [exp, run, rep, host_type]:
+            node = node["dirs"].setdefault(name, {"mtime_ns": None, "dirs": {}, "files": []})
+        node["dirs"][host] = {"mtime_ns": None, "dirs": {}, "files": [x["name"] for x in entry["files"]]}
+
+    # a deleted or manually added directory or file changes the parent directory
+    #   -> fallback to scanning the directories
+    if not _matches_manifest(suite_dir, index, manifest_mtime_ns, depth=0):
+        return None
+
+    return index
+
+
+def _matches_manifest(path, node, manifest_mtime_ns, depth):
+    # checks that the directories of the index (below `path`) exist and contain the results of the manifest
+    for name, child in node["dirs"].items():
+        child_path = os.path.join(path, name)
+        try:
+            mtime_ns = os.stat(child_path).st_mtime_ns
+        except FileNotFoundError:
+            return False
+
+        # a directory that is older than the manifest (with the margin of the mtime granularity) is unchanged,
+        #   otherwise, its listing is compared with the manifest
+        #   (only the results: e.g., the playbook updates the state.yml in the experiment dir after collecting a job)
+        if mtime_ns >= manifest_mtime_ns - _MTIME_GRANULARITY_NS:
+            files, subdirs = set(), set()
+            with os.scandir(child_path) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        files.add(entry.name)
+                    elif _is_results_dir(entry.name, depth + 2):
+                        subdirs.add(entry.name)
+            if subdirs != child["dirs"].keys():
+                return False
+            if depth + 1 == _RESULTS_INDEX_DEPTH and files != set(child["files"]):
+                return False
+
+        if not _matches_manifest(child_path, child, manifest_mtime_ns, depth + 1):
+            return False
+    return True
+
+
+def _scan_results_dir(path, old_node, depth, now_ns):
+
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    if old_node is not None and old_node["mtime_ns"] == mtime_ns:
+        # the listing of the directory is unchanged (but the subdirectories can change)
+        files = old_node["files"]
+        subdirs = list(old_node["dirs"].keys())
+    else:
+        files, subdirs = [], []
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    files.append(entry.name)
+                elif _is_results_dir(entry.name, depth + 1):
+                    subdirs.append(entry.name)
+
+    dirs = {}
+    if depth < _RESULTS_INDEX_DEPTH:
+        old_dirs = {} if old_node is None else old_node["dirs"]
+        for name in subdirs:
+            dirs[name] = _scan_results_dir(os.path.join(path, name), old_dirs.get(name), depth + 1, now_ns)
+
+    # the mtime has a coarse granularity on some file systems
+    #   -> a recently modified directory could still change within the same mtime
+    if now_ns - mtime_ns < _MTIME_GRANULARITY_NS:
+        mtime_ns = None
+
+    return {"mtime_ns": mtime_ns, "dirs": dirs, "files": files}
+
+
+def _is_results_dir(name, depth):
+    if name.startswith("."):
+        # e.g., .etl_cache or .inventory
+        return False
+    if depth == 2:
+        return name.startswith("run_")
+    return depth <= _RESULTS_INDEX_DEPTH
+
+
+def walk_suite_results(index, experiments=None):
+    """Iterates over the result files in the index of a suite (see `get_suite_results_index`).
+
+    Yields:
+        Tuple: (exp, run, rep, host_type, host_idx, host, file) for every file in a host directory
+    """
+    for exp, exp_node in index["dirs"].items():
+        if experiments is not None and exp not in experiments:
+            continue
+        for run, run_node in exp_node["dirs"].items():
+            for rep, rep_node in run_node["dirs"].items():
+                for host_type, host_type_node in rep_node["dirs"].items():
+                    # the host_idx is the position in the hosts of the type (host_0, host_1, .., host_10)
+                    #   independent of the order of the directory listing or the manifest
+                    hosts = sorted(host_type_node["dirs"].keys(), key=_host_sort_key)
+                    for host_idx, host in enumerate(hosts):
+                        for file in host_type_node["dirs"][host]["files"]:
+                            yield exp, run, rep, host_type, host_idx, host, file
+
+
+def _host_sort_key(host):
+    # natural order of host_<k> (host_2 < host_10)
+    prefix, _, k = host.rpartition("_")
+    return (prefix, int(k), host) if k.isdigit() else (host, -1, host)
+
 def load_config_yaml(path, file="config.json"):
-    #yaml = ruamel.yaml.YAML(typ='safe', pure=True)
-    with open(os.path.join(path, file)) as file:
-        #config = yaml.load(file)
-        config = ruamel.yaml.safe_load(file)
+    """Loads a json or yaml file (e.g., config.json, suite_design.yml, state.yml).
+
+    The parsed content is memoized per process as long as the file is unchanged,
+    the caller always receives its own copy.
+    """
+    path = os.path.join(path, file)
+    st = os.stat(path)
+    config = _load_config_file(path, st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(config)
+
+
+# uses the C-based loader if ruamel.yaml.clib is available
+_yaml_safe = ruamel.yaml.YAML(typ="safe")
+
+
+@lru_cache(maxsize=4096)
+def _load_config_file(path, mtime_ns, size):
+    # mtime_ns and size are part of the cache key -> a changed file is loaded again
+    with open(path, "rb") as f:
+        if path.endswith(".json"):
+            config = json.load(f) if orjson is None else orjson.loads(f.read())
+        else:
+            config = _yaml_safe.load(f)
     return config
\ No newline at end of file
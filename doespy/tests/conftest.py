@@ -1,6 +1,64 @@
+import json
+import os
+
+import pytest
 
 
 def pytest_addoption(parser):
     parser.addoption("--suite", action="store")
     parser.addoption("--id", action="store", default="last")
     parser.addoption("--idref", action="store", default="expected")
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    """An empty results dir (`DOES_RESULTS_DIR`) for the results of synthetic suites.
+
+    The project dir (for the custom etl steps) defaults to the demo project of the repository.
+    """
+
+    demo_project_dir = os.path.join(os.path.dirname(__file__), "..", "..", "demo_project")
+    monkeypatch.setenv("DOES_PROJECT_DIR", os.environ.get("DOES_PROJECT_DIR", os.path.abspath(demo_project_dir)))
+
+    path = tmp_path / "doe-suite-results"
+    path.mkdir()
+    monkeypatch.setenv("DOES_RESULTS_DIR", str(path))
+    return str(path)
+
+
+@pytest.fixture
+def make_suite(results_dir):
+    """Creates the results of a suite run in the results dir.
+
+    The results are given as ``{exp: {(run, rep): {"<host_type>/<host>/<file>": content}}}``
+    (content is `str` or `bytes`), each rep has a ``config.json`` with ``{"run": run}``.
+
+    Returns:
+        Callable: (suite, suite_id, results) -> suite results dir
+    """
+
+    def _make_suite(suite, suite_id, results):
+        suite_dir = os.path.join(results_dir, f"{suite}_{suite_id}")
+        os.makedirs(suite_dir, exist_ok=True)
+
+        design = {exp: {"base_experiment": {"run": "$FACTOR$"}} for exp in results}
+        with open(os.path.join(suite_dir, "suite_design.yml"), "w") as f:
+            json.dump(design, f)  # (json is valid yaml)
+
+        for exp, reps in results.items():
+            for (run, rep), files in reps.items():
+                rep_dir = os.path.join(suite_dir, exp, f"run_{run}", f"rep_{rep}")
+                os.makedirs(rep_dir, exist_ok=True)
+                with open(os.path.join(rep_dir, "config.json"), "w") as f:
+                    json.dump({"run": run}, f)
+
+                for file, content in files.items():
+                    path = os.path.join(rep_dir, file)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "wb" if isinstance(content, bytes) else "w") as f:
+                        f.write(content)
+
+        return suite_dir
+
+    return _make_suite
+
@@ -29,7 +29,7 @@ def test_suite_result(suite, suite_id, suite_idref="$expected"):
 
     print(f"Comparing folders:\n   {d1}\nwith:\n   {d2}")
     is_same = dircomp.compare_dir(d1, d2, ignore_infiles=[suite_id, suite_idref, path_pattern, code_path_pattern, job_finished_order, netcat_internal_hostname, server_dns_yaml, server_dns_config, aws_ec2_host_ids],
-                                          ignore_files=["stdout.log", "manual.yml", "aws_ec2.yml", "docker.yml"])
+                                          ignore_files=["stdout.log", "manual.yml", "aws_ec2.yml", "docker.yml", ".etl_cache", ".manifest.jsonl", ".cache", ".etl_stamp.json"])
     assert is_same
 
 
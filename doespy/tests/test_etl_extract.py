@@ -0,0 +1,535 @@
+import copy
+import gzip
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from doespy.etl import etl_base, etl_cache, etl_stats, etl_util
+from doespy.etl.steps.transformers import GroupByAggTransformer
+
+
+SUITE = "synthetic"
+SUITE_ID = "1700000000"
+
+
+def extract(extractors_sel, n_workers=1, **kwargs):
+    """Extracts the results of all experiments of the synthetic suite (see the `make_suite` fixture)."""
+
+    # (the ETL adds the config to the options of an extractor -> copy)
+    extractors, _, _ = etl_base.load_selected_processes(copy.deepcopy(extractors_sel), [], {})
+    experiments = os.listdir(os.path.join(os.environ["DOES_RESULTS_DIR"], f"{SUITE}_{SUITE_ID}"))
+    experiments = [exp for exp in experiments if not exp.startswith(".") and exp not in ["suite_design.yml", "etl_results"]]
+    base_experiments = {exp: {"base_experiment": {"run": "$FACTOR$"}} for exp in experiments}
+
+    if n_workers > 1:
+        with ProcessPoolExecutor(n_workers) as executor:
+            return etl_base.extract(SUITE, SUITE_ID, experiments, base_experiments, extractors, executor=executor, **kwargs)
+    return etl_base.extract(SUITE, SUITE_ID, experiments, base_experiments, extractors, **kwargs)
+
+
+def test_columnar_cache_changed_file_parallel(make_suite):
+    # the cached results of a columnar extractor are data frames
+    #  -> a changed file must not require comparing them
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},1\n"} for run in range(4)},
+    })
+
+    df = extract({"FastCsvExtractor": {}}, n_workers=2)
+    assert sorted(df["a"]) == [0, 1, 2, 3]
+
+    with open(os.path.join(suite_dir, "exp", "run_1", "rep_0", "small", "host_0", "out.csv"), "w") as f:
+        f.write("a,b\n10,1\n11,1\n")
+
+    df = extract({"FastCsvExtractor": {}}, n_workers=2)
+    assert sorted(df["a"]) == [0, 2, 3, 10, 11]
+
+    # unchanged (from the cache)
+    df = extract({"FastCsvExtractor": {}}, n_workers=2)
+    assert sorted(df["a"]) == [0, 2, 3, 10, 11]
+
+
+def test_column_builder_matches_rows():
+    # rows with different keys, frames, and nested builders -> as pd.DataFrame of the merged rows
+    const = {"run": 0, "x": "c"}
+    rows_a = [{"a": 1}, {"a": 2, "b": "y"}]
+    rows_b = [{"c": 3.5, "x": "override"}]
+    df = pd.DataFrame({"a": np.arange(3), "d": np.arange(3.0)})
+
+    builder = etl_base._ColumnBuilder()
+    builder.add_rows(const, rows_a)
+    nested = etl_base._ColumnBuilder()
+    nested.add_frame(const, df)
+    nested.add_rows(const, rows_b)
+    builder.extend(nested)
+    builder.add_rows({}, [{"e": True}])
+
+    expected = pd.DataFrame(
+        [{**const, **row} for row in rows_a]
+        + [{**const, **row} for row in df.to_dict("records")]
+        + [{**const, **row} for row in rows_b]
+        + [{"e": True}]
+    )
+
+    assert builder.n_rows == len(expected)
+    assert all(n == builder.n_rows for n in builder.lengths.values())
+    pd.testing.assert_frame_equal(builder.to_df(), expected, check_dtype=False)
+
+
+def test_error_report_merged_across_pipelines(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.csv": "a\n1\n",
+            "small/host_0/stderr.log": f"Traceback\nValueError: run {run}\n" if run < 2 else "",
+            "small/host_0/error.log": "OSError: disk full\n" if run == 3 else "",
+        } for run in range(4)},
+    })
+    report_path = os.path.join(suite_dir, "etl_results", "error_report_exp.json")
+
+    def load_report():
+        with open(report_path, "r") as f:
+            return json.load(f)
+
+    stderr_pipeline = {"CsvExtractor": {}, "ErrorExtractor": {}, "IgnoreExtractor": {"file_regex": ["error.log"]}}
+    error_log_pipeline = {"CsvExtractor": {}, "ErrorExtractor": {"file_regex": ["error.log"]}, "IgnoreExtractor": {"file_regex": ["stderr.log"]}}
+    no_error_pipeline = {"CsvExtractor": {}, "IgnoreExtractor": {"file_regex": ["stderr.log", "error.log"]}}
+
+    with pytest.warns(UserWarning, match="found 2 error files in exp=exp with 1 distinct messages"):
+        extract(stderr_pipeline, pipeline="p_stderr")
+    report = load_report()
+    assert report["n_error_files"] == 2
+    assert report["signatures"][0]["signature"] == "ValueError: run #"
+
+    # a pipeline without an ErrorExtractor keeps the report
+    extract(no_error_pipeline, pipeline="p_none")
+    assert load_report() == report
+
+    extract(error_log_pipeline, pipeline="p_error_log")
+    report = load_report()
+    assert report["n_error_files"] == 3
+    assert sorted(report["paths"]) == [
+        os.path.join("run_0", "rep_0", "small", "host_0", "stderr.log"),
+        os.path.join("run_1", "rep_0", "small", "host_0", "stderr.log"),
+        os.path.join("run_3", "rep_0", "small", "host_0", "error.log"),
+    ]
+
+    # a pipeline only replaces its own error files
+    for run in range(2):
+        open(os.path.join(suite_dir, "exp", f"run_{run}", "rep_0", "small", "host_0", "stderr.log"), "w").close()
+    extract(stderr_pipeline, pipeline="p_stderr")
+    report = load_report()
+    assert report["n_error_files"] == 1
+    assert report["signatures"][0]["signature"] == "OSError: disk full"
+
+    os.remove(os.path.join(suite_dir, "exp", "run_3", "rep_0", "small", "host_0", "error.log"))
+    extract(error_log_pipeline, pipeline="p_error_log")
+    assert not os.path.exists(report_path)
+
+
+def _exp_stats(extract_stats, extractor):
+    return extract_stats[f"{SUITE}_{SUITE_ID}/exp"][extractor]
+
+
+def test_file_cache_invalidation(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},x\n"} for run in range(3)},
+    })
+
+    extract_stats = {}
+    df = extract({"CsvExtractor": {}}, extract_stats=extract_stats)
+    assert sorted(df["a"]) == ["0", "1", "2"]
+    stats = _exp_stats(extract_stats, "CsvExtractor")
+    assert (stats["files"], stats["cached_files"], stats["rows"]) == (3, 0, 3)
+    assert stats["bytes"] == sum(os.path.getsize(os.path.join(suite_dir, "exp", f"run_{run}", "rep_0", "small", "host_0", "out.csv")) for run in range(3))
+
+    # unchanged -> the df of the experiment is loaded from the frame cache
+    extract_stats = {}
+    assert extract({"CsvExtractor": {}}, extract_stats=extract_stats).equals(df)
+    assert list(extract_stats[f"{SUITE}_{SUITE_ID}/exp"].keys()) == [etl_stats.FRAME_CACHE]
+
+    # a changed and a deleted file -> only the changed file is parsed again
+    with open(os.path.join(suite_dir, "exp", "run_0", "rep_0", "small", "host_0", "out.csv"), "w") as f:
+        f.write("a,b\n10,x\n11,y\n")
+    os.remove(os.path.join(suite_dir, "exp", "run_2", "rep_0", "small", "host_0", "out.csv"))
+
+    extract_stats = {}
+    df = extract({"CsvExtractor": {}}, extract_stats=extract_stats)
+    assert sorted(df["a"]) == ["1", "10", "11"]
+    stats = _exp_stats(extract_stats, "CsvExtractor")
+    assert (stats["files"], stats["cached_files"], stats["rows"]) == (1, 1, 3)
+
+    # a changed extractor invalidates the cache
+    extract_stats = {}
+    df = extract({"CsvExtractor": {"delimiter": ";"}}, extract_stats=extract_stats)
+    assert list(df.columns[-1:]) == ["a,b"]
+    assert _exp_stats(extract_stats, "CsvExtractor")["cached_files"] == 0
+
+    # without the cache, all files are parsed
+    extract_stats = {}
+    extract({"CsvExtractor": {}}, extract_stats=extract_stats, use_cache=False)
+    assert _exp_stats(extract_stats, "CsvExtractor")["files"] == 2
+
+
+def test_chunks_match_extract(make_suite):
+    # results with different columns (row-based and columnar extractors)
+    make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, rep): {
+            "small/host_0/out.csv": f"a,b\n{run},{rep}\n{run},{rep + 1}\n",
+            **({"small/host_1/trace.jsonl": '{"lat": 1.5, "op": "get"}\n{"lat": 2.5}\n'} if run % 2 == 0 else {}),
+        } for run in range(3) for rep in range(2)},
+    })
+    extractors_sel = {"CsvExtractor": {}, "JsonLinesExtractor": {}}
+
+    expected = extract(extractors_sel, use_cache=False)
+
+    extractors, _, _ = etl_base.load_selected_processes(copy.deepcopy(extractors_sel), [], {})
+    base_experiments = {"exp": {"base_experiment": {"run": "$FACTOR$"}}}
+    chunks = list(etl_base.extract_chunks(SUITE, SUITE_ID, ["exp"], base_experiments, extractors, use_cache=False, chunk_bytes=1))
+
+    # (a chunk per rep)
+    assert len(chunks) == 6
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+
+def test_compressed_results_match_plain(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.csv": f"a,b\n{run},x\n",
+            "small/host_0/trace.jsonl": '{"lat": 1.5}\n' * (run + 1),
+        } for run in range(3)},
+    })
+    extractors_sel = {"CsvExtractor": {}, "JsonLinesExtractor": {}}
+    expected = extract(extractors_sel)
+
+    for dirpath, _, files in os.walk(os.path.join(suite_dir, "exp")):
+        for file in files:
+            if file != "config.json":
+                path = os.path.join(dirpath, file)
+                with open(path, "rb") as f_in, gzip.open(f"{path}.gz", "wb") as f_out:
+                    f_out.write(f_in.read())
+                os.remove(path)
+
+    actual = extract(extractors_sel)
+    assert set(actual["source_file"]) == {"out.csv.gz", "trace.jsonl.gz"}
+    pd.testing.assert_frame_equal(actual.drop(columns="source_file"), expected.drop(columns="source_file"))
+
+
+def test_parallel_pipelines_share_extraction(make_suite, tmp_path):
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},x\n"} for run in range(4)},
+        "other": {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},y\n"} for run in range(2)},
+    })
+    design = {
+        "$SUITE_ID$": {SUITE: SUITE_ID},
+        "$ETL$": {
+            # p1 and p2 extract exp with the same extractors
+            name: {"experiments": {SUITE: exps}, "extractors": {"CsvExtractor": {}}, "transformers": [], "loaders": {"CsvSummaryLoader": {}}}
+            for name, exps in [("p1", ["exp"]), ("p2", ["exp"]), ("p3", ["exp", "other"])]
+        },
+    }
+
+    def run(out, **kwargs):
+        extract_stats = {}
+        etl_base.run_etl(
+            config_name=SUITE,
+            pipeline_design=copy.deepcopy(design),
+            etl_output_dir=str(tmp_path / out),
+            etl_output_pipeline_name=True,
+            use_cache=False,
+            extract_stats=extract_stats,
+            **kwargs,
+        )
+        return extract_stats
+
+    serial_stats = run("serial")
+    parallel_stats = run("parallel", n_pipeline_workers=3, n_workers=4)
+
+    # exp is extracted once for p1, p2, and p3
+    for stats in [serial_stats, parallel_stats]:
+        assert stats[f"{SUITE}_{SUITE_ID}/exp"]["CsvExtractor"]["files"] == 4
+        assert stats[f"{SUITE}_{SUITE_ID}/other"]["CsvExtractor"]["files"] == 2
+
+    for pipeline in ["p1", "p2", "p3"]:
+        pd.testing.assert_frame_equal(
+            pd.read_csv(tmp_path / "parallel" / pipeline / f"{pipeline}.csv"),
+            pd.read_csv(tmp_path / "serial" / pipeline / f"{pipeline}.csv"),
+        )
+
+
+def test_compressed_twin_skipped(make_suite):
+    # a retried fetch left both the uncompressed and the compressed result file
+    make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.csv": f"a,b\n{run},x\n",
+            **({"small/host_0/out.csv.gz": gzip.compress(f"a,b\n{run},x\n".encode())} if run == 1 else {}),
+        } for run in range(3)},
+    })
+
+    with pytest.warns(UserWarning, match="SKIP COMPRESSED FILE=out.csv.gz"):
+        df = extract({"CsvExtractor": {}})
+    assert sorted(df["a"]) == ["0", "1", "2"]
+    assert set(df["source_file"]) == {"out.csv"}
+
+    # an extractor for the compressed file
+    df = extract({"CsvExtractor": {}, "IgnoreExtractor": {"file_regex": [r".*\.gz$"]}})
+    assert sorted(df["a"]) == ["0", "1", "2"]
+
+
+def test_schema_applied_while_building(make_suite, monkeypatch):
+    # small typed blocks -> the values are converted while the columns are assembled
+    monkeypatch.setattr(etl_base._ColumnBuilder, "_TYPED_BLOCK_VALUES", 4)
+    make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, rep): {
+            "small/host_0/out.csv": "op,lat,n\n" + "".join(f"{op},{run + 0.5},{rep}\n" for op in (["get", "put"] if run < 2 else ["scan"])),
+            # (a file without the column n)
+            "small/host_1/out.csv": f"op,lat\nget,{run}\n",
+        } for run in range(4) for rep in range(3)},
+    })
+    extractors_sel = {"CsvExtractor": {"schema": {"op": "category", "lat": "float32", "n": "int32"}}}
+
+    builders = []
+    extend = etl_base._ColumnBuilder.extend
+
+    def record_extend(self, other):
+        extend(self, other)
+        builders.append(self)
+
+    monkeypatch.setattr(etl_base._ColumnBuilder, "extend", record_extend)
+    df = extract(extractors_sel, use_cache=False)
+
+    # the columns of the schema never hold more python objects than a typed block
+    for col in ["op", "lat", "n"]:
+        assert all(len(values) < 4 for values in builders[-1].columns[col] if isinstance(values, list))
+
+    assert df["op"].dtype == pd.CategoricalDtype(["get", "put", "scan"])
+    assert df["lat"].dtype == "float32"
+    assert df["n"].dtype == "Int32"  # (missing values)
+
+    # the chunks have different categories (e.g., scan only in the later runs)
+    extractors, _, _ = etl_base.load_selected_processes(copy.deepcopy(extractors_sel), [], {})
+    base_experiments = {"exp": {"base_experiment": {"run": "$FACTOR$"}}}
+    chunks = list(etl_base.extract_chunks(SUITE, SUITE_ID, ["exp"], base_experiments, extractors, use_cache=False, chunk_bytes=1))
+    assert len({tuple(chunk["op"].cat.categories) for chunk in chunks}) > 1
+    pd.testing.assert_frame_equal(etl_util.concat_frames(chunks), df)
+
+    transformer = GroupByAggTransformer(name="GroupByAggTransformer", data_columns=["lat"], groupby_columns=["op"], agg_functions=["mean", "count"])
+    expected = transformer.transform(df, options={})
+    actual = transformer.transform_chunks(iter(chunks), options={})
+    pd.testing.assert_frame_equal(actual.sort_values("op").reset_index(drop=True), expected.sort_values("op").reset_index(drop=True), check_dtype=False)
+    assert actual["op"].dtype == df["op"].dtype
+
+
+def test_parallel_extraction_matches_serial(make_suite):
+    # row-based and columnar extractors, reps with different files and columns
+    make_suite(SUITE, SUITE_ID, {
+        exp: {(run, rep): {
+            "small/host_0/out.csv": f"a,b\n{run},{rep}\n{run},{rep + 1}\n",
+            **({"small/host_1/trace.jsonl": '{"lat": 1.5}\n' * (rep + 1)} if (run + rep) % 2 == 0 else {}),
+            **({"small/host_0/extra.yaml": f"c: {exp}\n"} if run == 2 else {}),
+        } for run in range(5) for rep in range(3)}
+        for exp in ["exp_a", "exp_b"]
+    })
+    extractors_sel = {"CsvExtractor": {}, "JsonLinesExtractor": {}, "YamlExtractor": {}}
+
+    expected = extract(extractors_sel, use_cache=False)
+    assert len(expected) == 2 * (5 * 3 * 2 + sum(rep + 1 for run in range(5) for rep in range(3) if (run + rep) % 2 == 0) + 3)
+
+    # the partial results of the workers are merged in the order of the serial extraction
+    pd.testing.assert_frame_equal(extract(extractors_sel, n_workers=3, use_cache=False), expected)
+
+
+def _reference_dispatch(file, extractors):
+    # the dispatch without the compiled patterns and the memo: each pattern of each extractor is evaluated
+    matched = []
+    for extractor_d in extractors:
+        patterns = extractor_d["extractor"].file_regex
+        for p in patterns if isinstance(patterns, list) else [patterns]:
+            if re.match(p, file):
+                matched.append(type(extractor_d["extractor"]).__name__)
+    if len(matched) == 0:
+        return "no extractor"
+    if len(matched) > 1:
+        return "multiple extractors"
+    return matched[0]
+
+
+@pytest.mark.parametrize("extractors_sel", [
+    {"CsvExtractor": {}, "JsonExtractor": {}, "ErrorExtractor": {}, "IgnoreExtractor": {}},
+    # a file that matches two patterns of the same extractor
+    {"CsvExtractor": {"file_regex": [r".*\.csv$", r"out.*"]}, "IgnoreExtractor": {"file_regex": [r".*\.log$"]}},
+    # overlapping extractors
+    {"CsvExtractor": {}, "IgnoreExtractor": {"file_regex": [r"out.*"]}},
+])
+def test_extractor_dispatch_matches_reference(extractors_sel):
+    extractors, _, _ = etl_base.load_selected_processes(copy.deepcopy(extractors_sel), [], {})
+    files = ["out.csv", "results.json", "stderr.log", "stdout.log", "out.txt", "other.bin", "out.csv"]
+
+    for _ in range(2):  # (the second round uses the memo)
+        for file in files:
+            expected = _reference_dispatch(file, extractors)
+            if expected in ["no extractor", "multiple extractors"]:
+                with pytest.raises(ValueError, match=f"file={re.escape(file)} matches {expected}"):
+                    etl_base._find_extractor("host_0", file, extractors)
+            else:
+                assert type(etl_base._find_extractor("host_0", file, extractors)["extractor"]).__name__ == expected
+
+    # the matches are memoized per file name
+    assert extractors[0]["n_matches"].keys() == set(files)
+
+
+def test_frame_cache_per_experiment(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        exp: {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},x\n"} for run in range(2)} for exp in ["exp_a", "exp_b"]
+    })
+    frame_cache_dir = etl_cache.get_frame_cache_dir(suite=SUITE, suite_id=SUITE_ID)
+    ext = "arrow" if etl_cache.pa is not None else "pkl"
+
+    def extracted_exps():
+        extract_stats = {}
+        df = extract({"CsvExtractor": {}}, extract_stats=extract_stats)
+        exps = sorted(key.split("/")[-1] for key, exp_stats in extract_stats.items() if etl_stats.FRAME_CACHE not in exp_stats)
+        return df.sort_values(["exp_name", "run"], ignore_index=True), exps
+
+    df, exps = extracted_exps()
+    assert exps == ["exp_a", "exp_b"]
+    for exp in exps:
+        assert [file.rsplit(".", 1)[1] for file in os.listdir(os.path.join(frame_cache_dir, exp))] == [ext]
+
+    # unchanged -> from the cache (with the same dtypes)
+    cached_df, exps = extracted_exps()
+    assert exps == []
+    pd.testing.assert_frame_equal(cached_df, df)
+
+    # a changed config of a rep -> only the experiment of the rep is extracted again
+    with open(os.path.join(suite_dir, "exp_a", "run_1", "rep_0", "config.json"), "w") as f:
+        json.dump({"run": 10}, f)
+    df, exps = extracted_exps()
+    assert exps == ["exp_a"]
+    assert list(df["run"]) == [0, 10, 0, 1]
+
+    # a new rep
+    rep_dir = os.path.join(suite_dir, "exp_b", "run_2", "rep_0")
+    os.makedirs(os.path.join(rep_dir, "small", "host_0"))
+    with open(os.path.join(rep_dir, "config.json"), "w") as f:
+        json.dump({"run": 2}, f)
+    with open(os.path.join(rep_dir, "small", "host_0", "out.csv"), "w") as f:
+        f.write("a,b\n2,x\n")
+    df, exps = extracted_exps()
+    assert exps == ["exp_b"]
+    assert list(df["a"]) == ["0", "1", "0", "1", "2"]
+
+    # an unreadable cache is ignored
+    with open(os.path.join(frame_cache_dir, "exp_a", os.listdir(os.path.join(frame_cache_dir, "exp_a"))[0]), "wb") as f:
+        f.write(b"invalid")
+    with pytest.warns(UserWarning, match="ignoring unreadable etl cache of exp=exp_a"):
+        cached_df, exps = extracted_exps()
+    assert exps == ["exp_a"]
+    pd.testing.assert_frame_equal(cached_df, df)
+
+
+def test_frame_cache_pickle_fallback(tmp_path):
+    # columns that do not survive the round trip through arrow (e.g., dicts) are stored as pickle
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", np.nan], "c": [{"k": 1}, None]})
+    etl_cache.save_frame_cache(str(tmp_path), "exp", "key", "fp", df, warning_msgs=["msg"])
+    assert os.listdir(tmp_path / "exp") == ["frame_key.pkl"]
+
+    cached_df, warning_msgs = etl_cache.load_frame_cache(str(tmp_path), "exp", "key", "fp")
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert warning_msgs == ["msg"]
+
+    # another fingerprint of the results
+    assert etl_cache.load_frame_cache(str(tmp_path), "exp", "key", "other") is None
+
+    # arrow (replaces the pickle)
+    if etl_cache.pa is not None:
+        df = df.drop(columns="c")
+        etl_cache.save_frame_cache(str(tmp_path), "exp", "key", "fp", df, warning_msgs=[])
+        assert os.listdir(tmp_path / "exp") == ["frame_key.arrow"]
+        pd.testing.assert_frame_equal(etl_cache.load_frame_cache(str(tmp_path), "exp", "key", "fp")[0], df)
+
+
+def _to_bytes(write):
+    buf = io.BytesIO()
+    write(buf)
+    return buf.getvalue()
+
+
+def test_binary_extractors(make_suite):
+    pytest.importorskip("pyarrow")
+    make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.parquet": _to_bytes(pd.DataFrame({"op": ["get", "put"], "lat": [run + 0.5, run + 1.5]}).to_parquet),
+            "small/host_0/trace.arrow": _to_bytes(pd.DataFrame({"op": ["scan"], "n": [run]}).to_feather),
+            "small/host_1/lat.npy": _to_bytes(lambda f: np.save(f, np.array([run * 10.0]))),
+        } for run in range(2)},
+    })
+    extractors_sel = {"ParquetExtractor": {"columns": ["lat"]}, "FeatherExtractor": {}, "NumpyExtractor": {"fieldnames": ["lat"]}}
+
+    df = extract(extractors_sel, use_cache=False)
+    df = df.sort_values(["run", "host_type", "host_idx", "source_file"], ignore_index=True)
+    expected = pd.DataFrame({
+        "run": [0, 0, 0, 0, 1, 1, 1, 1],
+        "source_file": ["out.parquet", "out.parquet", "trace.arrow", "lat.npy"] * 2,
+        "lat": [0.5, 1.5, np.nan, 0.0, 1.5, 2.5, np.nan, 10.0],
+        "op": [np.nan, np.nan, "scan", np.nan] * 2,
+        "n": [np.nan, np.nan, 0, np.nan, np.nan, np.nan, 1, np.nan],
+    })
+    pd.testing.assert_frame_equal(df[expected.columns], expected, check_dtype=False)
+
+    # the same df with the cache (cold and warm) and with worker processes
+    for kwargs in [{}, {}, {"n_workers": 2, "use_cache": False}]:
+        pd.testing.assert_frame_equal(extract(extractors_sel, **kwargs).sort_values(["run", "host_type", "host_idx", "source_file"], ignore_index=True), df)
+
+
+def test_error_report_paths(make_suite, monkeypatch):
+    monkeypatch.setattr(etl_base, "_ERROR_REPORT_MAX_PATHS", 2)
+    suite_dir = make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.csv": "a\n1\n",
+            "small/host_0/stderr.log": f"Traceback\nValueError: run {run}\n" if run < 3 else "OSError: disk full\n",
+        } for run in range(4)},
+    })
+
+    with pytest.warns(UserWarning, match="found 4 error files in exp=exp with 2 distinct messages \\(most frequent: 'ValueError: run #' in 3 files\\)"):
+        extract({"CsvExtractor": {}, "ErrorExtractor": {}})
+
+    with open(os.path.join(suite_dir, "etl_results", "error_report_exp.json"), "r") as f:
+        report = json.load(f)
+
+    # the number of files is complete, the paths are bounded
+    assert (report["n_error_files"], report["n_signatures"], len(report["paths"])) == (4, 2, 2)
+    assert [(d["signature"], d["n_files"], len(d["paths"])) for d in report["signatures"]] == [("ValueError: run #", 3, 2), ("OSError: disk full", 1, 1)]
+    assert report["signatures"][1]["paths"] == [os.path.join("run_3", "rep_0", "small", "host_0", "stderr.log")]
+    assert report["signatures"][1]["sample"] == "OSError: disk full\n"
+
+
+def test_extract_stats_workers(make_suite):
+    make_suite(SUITE, SUITE_ID, {
+        "exp": {(run, 0): {
+            "small/host_0/out.csv": f"a,b\n{run},x\n{run},y\n",
+            "small/host_0/trace.jsonl": '{"lat": 1.5}\n',
+            "small/host_0/stderr.log": "",
+        } for run in range(4)},
+    })
+    extractors_sel = {"CsvExtractor": {}, "JsonLinesExtractor": {}, "ErrorExtractor": {}}
+
+    def counters(extract_stats):
+        # (without the time)
+        return {extractor: {c: v for c, v in d.items() if c != "time_s"} for extractor, d in extract_stats[f"{SUITE}_{SUITE_ID}/exp"].items()}
+
+    serial_stats = {}
+    extract(extractors_sel, use_cache=False, extract_stats=serial_stats)
+    assert counters(serial_stats)["CsvExtractor"] == {"files": 4, "cached_files": 0, "bytes": 4 * len("a,b\n0,x\n0,y\n"), "rows": 8}
+    assert counters(serial_stats)["JsonLinesExtractor"]["rows"] == 4
+    assert counters(serial_stats)["ErrorExtractor"] == {"files": 4, "cached_files": 0, "bytes": 0, "rows": 0}
+    assert all(d["time_s"] >= 0 for d in serial_stats[f"{SUITE}_{SUITE_ID}/exp"].values())
+
+    # the stats of the worker processes are merged
+    parallel_stats = {}
+    extract(extractors_sel, n_workers=2, use_cache=False, extract_stats=parallel_stats)
+    assert counters(parallel_stats) == counters(serial_stats)
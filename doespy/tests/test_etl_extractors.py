@@ -0,0 +1,181 @@
+import gzip
+import lzma
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from doespy.etl.steps import extractors
+from doespy.etl.steps.extractors import (
+    CsvExtractor,
+    ErrorExtractor,
+    FastCsvExtractor,
+    FeatherExtractor,
+    JsonLinesExtractor,
+    NumpyExtractor,
+    ParquetExtractor,
+    RegexLogExtractor,
+)
+
+
+LOG = "".join(
+    f"[{i}] op=get latency: {i * 0.5}ms\n" + (f"throughput: {i * 10} ops/s\n" if i % 3 == 0 else "")
+    for i in range(200)
+)
+
+
+@pytest.mark.parametrize("match", ["first", "last", "all"])
+@pytest.mark.parametrize("compression", ["gz", "xz"])
+def test_regex_log_compressed_matches_plain(tmp_path, monkeypatch, match, compression):
+    # small blocks -> the compressed file is scanned in many blocks of lines
+    monkeypatch.setattr(RegexLogExtractor, "_block_bytes", 100)
+
+    plain_path = tmp_path / "stdout.log"
+    plain_path.write_text(LOG)
+    compressed_path = tmp_path / f"stdout.log.{compression}"
+    with (gzip.open if compression == "gz" else lzma.open)(compressed_path, "wt") as f:
+        f.write(LOG)
+
+    extractor = RegexLogExtractor(
+        file_regex=["stdout.log"],
+        patterns=[r"latency: (?P<lat>[\d.]+)ms$", r"^throughput: (?P<tput>\d+) ops/s"],
+        match=match,
+    )
+
+    expected = extractor.extract_frame(str(plain_path), options={})
+    actual = extractor.extract_frame(str(compressed_path), options={})
+    pd.testing.assert_frame_equal(actual, expected)
+
+    if match == "all":
+        assert len(expected) == 200 + 67
+        assert list(expected["tput"].dropna()[:2]) == ["0", "30"]
+    else:
+        assert len(expected) == 1
+        assert expected.iloc[0].to_dict() == ({"lat": "0.0", "tput": "0"} if match == "first" else {"lat": "99.5", "tput": "1980"})
+
+
+def test_extractors_no_invalid_escape_sequence():
+    # e.g., a regex in a docstring (must be a raw string)
+    with open(extractors.__file__, "r") as f:
+        source = f.read()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        compile(source, os.path.basename(extractors.__file__), "exec")
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"has_header": False, "fieldnames": ["x", "y"]},
+    {"has_header": True, "fieldnames": ["x", "y"]},
+    {"delimiter": ";"},
+])
+def test_fast_csv_matches_csv(tmp_path, options):
+    delimiter = options.get("delimiter", ",")
+    path = tmp_path / "out.csv"
+    path.write_text(f"a{delimiter}b\n1{delimiter}2.5\n3{delimiter}4.5\n")
+
+    expected = CsvExtractor(**options).extract(str(path), options={})
+    actual = FastCsvExtractor(**options).extract(str(path), options={})
+
+    # (the FastCsvExtractor returns typed values instead of strings)
+    assert [{k: str(v) for k, v in row.items()} for row in actual] == expected
+
+
+def test_json_lines_blank_batch(tmp_path):
+    # a batch of only blank lines in the middle of the file
+    path = tmp_path / "out.jsonl"
+    path.write_text('{"a": 1, "b": {"c": 2}}\n\n\n\n{"a": 3, "b": {"c": 4}}\n\n')
+
+    df = JsonLinesExtractor(batch_size=2).extract_frame(str(path), options={})
+    assert df.to_dict("records") == [{"a": 1, "b.c": 2}, {"a": 3, "b.c": 4}]
+
+    df = JsonLinesExtractor(batch_size=2, columns=["b.c"]).extract_frame(str(path), options={})
+    assert list(df["b.c"]) == [2, 4]
+
+
+def test_extract_frame_default():
+    # an extractor without extract_frame is not columnar (the ETL uses extract)
+    extractor = CsvExtractor()
+    assert not CsvExtractor.is_columnar()
+    assert extractor.extract_frame("out.csv", options={}) is None
+
+    assert FastCsvExtractor.is_columnar()
+
+
+def test_numpy_extractor(tmp_path):
+    structured = np.array([(1, 0.5), (2, 1.5)], dtype=[("op", "i4"), ("lat", "f8")])
+    np.save(tmp_path / "structured.npy", structured)
+    np.save(tmp_path / "values.npy", np.arange(3.0))
+    np.save(tmp_path / "matrix.npy", np.arange(6).reshape(3, 2))
+    np.savez(tmp_path / "arrays.npz", op=np.arange(2), lat=np.array([0.5, 1.5]))
+
+    df = NumpyExtractor().extract_frame(str(tmp_path / "structured.npy"), options={})
+    assert df.to_dict("list") == {"op": [1, 2], "lat": [0.5, 1.5]}
+
+    df = NumpyExtractor().extract_frame(str(tmp_path / "values.npy"), options={})
+    assert df.to_dict("list") == {"value": [0.0, 1.0, 2.0]}
+
+    df = NumpyExtractor(fieldnames=["x", "y"]).extract_frame(str(tmp_path / "matrix.npy"), options={})
+    assert df.to_dict("list") == {"x": [0, 2, 4], "y": [1, 3, 5]}
+
+    df = NumpyExtractor().extract_frame(str(tmp_path / "arrays.npz"), options={})
+    assert df.to_dict("list") == {"op": [0, 1], "lat": [0.5, 1.5]}
+
+    assert NumpyExtractor().extract(str(tmp_path / "values.npy"), options={}) == [{"value": 0.0}, {"value": 1.0}, {"value": 2.0}]
+
+
+def test_arrow_extractors(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"op": ["get", "put"], "lat": [0.5, 1.5]})
+    df.to_parquet(tmp_path / "out.parquet")
+    df.to_feather(tmp_path / "out.arrow")
+
+    for extractor, file in [(ParquetExtractor, "out.parquet"), (FeatherExtractor, "out.arrow")]:
+        table = extractor().extract_frame(str(tmp_path / file), options={})
+        pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+        # projection
+        assert extractor(columns=["lat"]).extract(str(tmp_path / file), options={}) == [{"lat": 0.5}, {"lat": 1.5}]
+
+
+def test_error_extractor_empty_file(tmp_path, monkeypatch):
+    (tmp_path / "stderr.log").write_text("")
+    (tmp_path / "blank.log").write_text("\n  \n")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # (blank files are read but do not raise a warning)
+        assert ErrorExtractor().extract(str(tmp_path / "blank.log"), options={}) == []
+
+        # an empty file is not opened
+        def no_open(*args, **kwargs):
+            raise AssertionError("unexpected open")
+        monkeypatch.setattr(extractors, "open_result_file", no_open)
+        assert ErrorExtractor().extract(str(tmp_path / "stderr.log"), options={}) == []
+
+
+@pytest.mark.parametrize("compression", [None, "gz"])
+def test_error_extractor_sample(tmp_path, compression):
+    content = "Traceback (most recent call last):\n" + "x" * 10000 + "\nValueError: boom\n"
+    path = tmp_path / "stderr.log"
+    if compression is None:
+        path.write_text(content)
+    else:
+        path = tmp_path / "stderr.log.gz"
+        with gzip.open(path, "wt") as f:
+            f.write(content)
+
+    with pytest.warns(UserWarning) as record:
+        assert ErrorExtractor(sample_bytes=20).extract(str(path), options={}) == []
+    msg = str(record[0].message)
+
+    # only the start and the end of the file are in the warning
+    assert msg == f"{extractors.ERROR_FILE_WARNING}{path}\nTraceback (most rece\n[... {len(content) - 40} bytes omitted ...]\nxx\nValueError: boom\n"
+
+    # a small file is complete
+    small = tmp_path / "small.log"
+    small.write_text("ValueError: boom\n")
+    with pytest.warns(UserWarning, match="found error file: .*small.log\nValueError: boom\n$"):
+        ErrorExtractor(sample_bytes=20).extract(str(small), options={})
@@ -0,0 +1,92 @@
+import json
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from doespy import util
+from doespy.etl import etl_base, etl_stats
+
+
+DEMO_RESULTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "demo_project", "doe-suite-results")
+
+# the results of the demo project
+#   (test_etl_pipeline only checks new suite runs, i.e., skips these)
+SUITES = sorted(name[: -len("_$expected")] for name in os.listdir(DEMO_RESULTS_DIR) if name.endswith("_$expected"))
+
+SUITE_ID = "$expected"
+
+
+@pytest.fixture
+def demo_results(results_dir):
+    """Copies the results of the demo project into the (temporary) results dir."""
+
+    for suite in SUITES:
+        name = util.get_folder(suite=suite, suite_id=SUITE_ID)
+        # (without the etl results and caches of the demo project)
+        shutil.copytree(os.path.join(DEMO_RESULTS_DIR, name), os.path.join(results_dir, name), ignore=shutil.ignore_patterns("etl_results", ".etl_cache"))
+    return results_dir
+
+
+def run_etl(suite, etl_output_dir, **kwargs):
+    return etl_base.run_single_suite(suite=suite, suite_id=SUITE_ID, return_df=True, etl_output_dir=etl_output_dir, **kwargs)
+
+
+def assert_same_dfs(actual, expected):
+    assert (actual is None) == (expected is None)
+    if expected is None:
+        # (no pipeline with results)
+        return
+    assert actual.keys() == expected.keys()
+    for pipeline, df in expected.items():
+        pd.testing.assert_frame_equal(actual[pipeline].reset_index(drop=True), df.reset_index(drop=True), obj=pipeline)
+
+
+def set_memory_budget(suite, memory_budget):
+    """Sets the memory budget of all pipelines in the suite design of the results (-> streaming execution)."""
+
+    res_dir = util.get_suite_results_dir(suite=suite, id=SUITE_ID)
+    design = util.load_config_yaml(res_dir, file="suite_design.yml")
+    for pipeline in design.get("$ETL$", {}).values():
+        pipeline["memory_budget"] = memory_budget
+    with open(os.path.join(res_dir, "suite_design.yml"), "w") as f:
+        json.dump(design, f)  # (json is valid yaml)
+
+
+@pytest.mark.parametrize("suite", SUITES)
+def test_etl_modes_match(demo_results, tmp_path, monkeypatch, suite):
+    """The cache, the worker processes, and the streaming execution do not change the results of the ETL."""
+
+    expected = run_etl(suite, str(tmp_path / "no_cache"), use_cache=False)
+
+    # cold cache
+    assert_same_dfs(run_etl(suite, str(tmp_path / "cache"), use_cache=True), expected)
+
+    # warm cache: the frame cache (or the cached df of a transformer step) replaces the extraction
+    extract_stats = {}
+    assert_same_dfs(run_etl(suite, str(tmp_path / "cache"), use_cache=True, extract_stats=extract_stats), expected)
+    for exp_stats in extract_stats.values():
+        assert list(exp_stats.keys()) == [etl_stats.FRAME_CACHE]
+
+    # worker processes
+    assert_same_dfs(run_etl(suite, str(tmp_path / "workers"), use_cache=False, n_workers=2), expected)
+
+    # streaming execution: a chunk per rep (the budget is large enough for the complete df)
+    monkeypatch.setattr(etl_base, "_CHUNKS_PER_BUDGET", 2**20)
+    set_memory_budget(suite, 64 * 2**20)
+    assert_same_dfs(run_etl(suite, str(tmp_path / "streaming"), use_cache=False), expected)
+
+
+def test_etl_step_cache(demo_results, tmp_path, monkeypatch):
+    # all pipelines of the suite have transformers
+    suite = "example07-etl"
+
+    expected = run_etl(suite, str(tmp_path / "out"), use_cache=True)
+
+    # unchanged results -> each pipeline resumes from the cached df after its last transformer step
+    def no_extract(*args, **kwargs):
+        raise AssertionError("unexpected extraction")
+
+    monkeypatch.setattr(etl_base, "extract", no_extract)
+    assert_same_dfs(run_etl(suite, str(tmp_path / "out"), use_cache=True), expected)
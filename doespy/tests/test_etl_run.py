@@ -0,0 +1,245 @@
+import copy
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from doespy import util
+from doespy.etl import etl_base, etl_cache
+
+
+SUITE = "synthetic"
+SUITE_ID = "1700000000"
+
+
+def run_etl(pipelines, etl_output_dir, experiments=("exp",), **kwargs):
+    """Runs the pipelines ``{name: {"extractors": ..., "transformers": ..., ...}}`` on the experiments of the synthetic suite
+    (see the `make_suite` fixture)."""
+
+    etl_config = {}
+    for name, pipeline in pipelines.items():
+        etl_config[name] = {"experiments": {SUITE: list(experiments)}, "loaders": {}, **copy.deepcopy(pipeline)}
+    pipeline_design = {"$SUITE_ID$": {SUITE: SUITE_ID}, "$ETL$": etl_config}
+    return etl_base.run_etl(config_name=SUITE, pipeline_design=pipeline_design, etl_output_dir=etl_output_dir, **kwargs)
+
+
+def latency_results(n_runs, n_reps):
+    return {
+        "exp": {(run, rep): {
+            "small/host_0/out.csv": "op,lat\n" + "".join(f"{op},{run + rep * 0.5 + i}\n" for i in range(20) for op in ["get", "put", "scan"]),
+        } for run in range(n_runs) for rep in range(n_reps)},
+    }
+
+
+STREAMING_TRANSFORMERS = [
+    {"df.query": {"expr": "op != 'scan'"}},
+    {"df.astype": {"dtype": {"lat": "float64"}}},
+    {"name": "GroupByAggTransformer", "groupby_columns": ["run", "op"], "data_columns": ["lat"], "agg_functions": ["mean", "count"]},
+    {"df.sort_values": {"by": ["run", "op"], "ignore_index": True}},
+]
+
+
+def test_streaming_matches_complete_df(make_suite, tmp_path, monkeypatch):
+    make_suite(SUITE, SUITE_ID, latency_results(n_runs=4, n_reps=3))
+    pipeline = {"extractors": {"CsvExtractor": {}}, "transformers": STREAMING_TRANSFORMERS}
+
+    expected = run_etl({"p": pipeline}, str(tmp_path / "out"), return_df=True, use_cache=False)["p"]
+    assert len(expected) == 4 * 2
+
+    # small chunks (a chunk per rep): the budget is smaller than the complete df
+    #   -> the chunks are reduced by the GroupByAggTransformer
+    monkeypatch.setattr(etl_base, "_CHUNKS_PER_BUDGET", 2**20)
+    budget = "64KB"
+    complete_df = run_etl({"p": {**pipeline, "transformers": []}}, str(tmp_path / "out"), return_df=True, use_cache=False)["p"]
+    assert complete_df.memory_usage(deep=True).sum() > etl_base._parse_memory_budget(budget)
+
+    for use_cache in [False, True, True]:
+        actual = run_etl({"p": {**pipeline, "memory_budget": budget}}, str(tmp_path / "out"), return_df=True, use_cache=use_cache)["p"]
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_streaming_exceeds_budget(make_suite, tmp_path, monkeypatch):
+    make_suite(SUITE, SUITE_ID, latency_results(n_runs=4, n_reps=3))
+    monkeypatch.setattr(etl_base, "_CHUNKS_PER_BUDGET", 2**20)
+
+    # no transformer reduces the chunks -> the loaders require the complete df
+    pipeline = {"extractors": {"CsvExtractor": {}}, "transformers": [{"df.query": {"expr": "op != 'scan'"}}], "memory_budget": "16KB"}
+    with pytest.raises(ValueError, match="exceeds the memory_budget"):
+        run_etl({"p": pipeline}, str(tmp_path / "out"), return_df=True, use_cache=False)
+
+    # a transformer that is not chunk-safe requires the complete df
+    pipeline["transformers"].append({"df.sort_values": {"by": ["lat"]}})
+    with pytest.raises(ValueError, match="transformer=df.sort_values requires the complete df"):
+        run_etl({"p": pipeline}, str(tmp_path / "out"), return_df=True, use_cache=False)
+
+
+@pytest.mark.parametrize("memory_budget, expected", [(None, None), (1024, 1024), ("512MB", 512 * 2**20), ("4 GiB", 4 * 2**30), ("1.5K", 1536)])
+def test_parse_memory_budget(memory_budget, expected):
+    assert etl_base._parse_memory_budget(memory_budget) == expected
+
+    with pytest.raises(ValueError, match="invalid memory_budget"):
+        etl_base._parse_memory_budget("a lot")
+
+
+def test_pipelines_share_extraction(make_suite, tmp_path, monkeypatch):
+    make_suite(SUITE, SUITE_ID, {
+        exp: {(run, 0): {"small/host_0/out.csv": f"a,b\n{run},x\n"} for run in range(2)} for exp in ["exp_a", "exp_b"]
+    })
+
+    extracted = []
+    extract = etl_base.extract
+
+    def counting_extract(**kwargs):
+        extracted.append((kwargs["pipeline"], *kwargs["experiments"]))
+        return extract(**kwargs)
+
+    monkeypatch.setattr(etl_base, "extract", counting_extract)
+
+    pipelines = {
+        # modifies the extracted df in place
+        "first": {"extractors": {"CsvExtractor": {}}, "transformers": [{"name": "ConditionalTransformer", "col": "a", "dest": "a", "value": {"0": "changed"}}]},
+        "second": {"extractors": {"CsvExtractor": {}}, "transformers": []},
+        # other extractors -> a separate extraction
+        "other": {"extractors": {"CsvExtractor": {"delimiter": ";"}}, "transformers": []},
+        # only exp_b
+        "last": {"extractors": {"CsvExtractor": {}}, "transformers": [], "experiments": {SUITE: ["exp_b"]}},
+    }
+    dfs = run_etl(pipelines, str(tmp_path / "out"), experiments=["exp_a", "exp_b"], return_df=True, use_cache=False)
+
+    # each experiment is extracted once per set of extractors
+    assert sorted(extracted) == [("first", "exp_a"), ("first", "exp_b"), ("other", "exp_a"), ("other", "exp_b")]
+
+    assert list(dfs["first"]["a"]) == ["changed", "1", "changed", "1"]
+    assert list(dfs["second"]["a"]) == ["0", "1", "0", "1"]
+    assert list(dfs["last"]["a"]) == ["0", "1"]
+    assert list(dfs["other"]["a,b"]) == ["0,x", "1,x", "0,x", "1,x"]
+
+    # the same result as a separate run_etl per pipeline
+    for name, pipeline in pipelines.items():
+        expected = run_etl({name: pipeline}, str(tmp_path / "out"), experiments=["exp_a", "exp_b"], return_df=True, use_cache=False)[name]
+        pd.testing.assert_frame_equal(dfs[name], expected)
+
+
+def make_etl_suite(make_suite, suite, extractors, content="a\n1\n"):
+    """Creates the results of a suite with an etl pipeline in its suite design."""
+
+    suite_dir = make_suite(suite, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": content}}})
+    design = util.load_config_yaml(suite_dir, file="suite_design.yml")
+    design["$ETL$"] = {"p": {"experiments": ["exp"], "extractors": extractors, "transformers": [], "loaders": {"CsvSummaryLoader": {}}}}
+    with open(os.path.join(suite_dir, "suite_design.yml"), "w") as f:
+        json.dump(design, f)  # (json is valid yaml)
+    return suite_dir
+
+
+def test_run_all_suites_skips_unchanged(make_suite, tmp_path, monkeypatch):
+    suite_dirs = {suite: make_etl_suite(make_suite, suite, {"CsvExtractor": {}}) for suite in ["s_a", "s_b"]}
+
+    processed = []
+    run_single_suite = etl_base.run_single_suite
+
+    def recording_run_single_suite(suite, **kwargs):
+        processed.append(suite)
+        return run_single_suite(suite=suite, **kwargs)
+
+    monkeypatch.setattr(etl_base, "run_single_suite", recording_run_single_suite)
+
+    def run_all(**kwargs):
+        processed.clear()
+        etl_base.run_all_suites(**kwargs)
+        return sorted(processed)
+
+    assert run_all() == ["s_a", "s_b"]
+    for suite_dir in suite_dirs.values():
+        assert os.path.isfile(os.path.join(suite_dir, "etl_results", etl_cache.STAMP_FILE))
+
+    # unchanged
+    assert run_all() == []
+
+    # a changed result file
+    with open(os.path.join(suite_dirs["s_a"], "exp", "run_0", "rep_0", "small", "host_0", "out.csv"), "w") as f:
+        f.write("a\n10\n")
+    assert run_all() == ["s_a"]
+
+    # a changed suite design
+    make_etl_suite(make_suite, "s_b", {"CsvExtractor": {"delimiter": ";"}})
+    assert run_all() == ["s_b"]
+    assert run_all() == []
+
+    # another output dir, or without the cache
+    assert run_all(etl_output_dir=str(tmp_path / "etl_other")) == ["s_a", "s_b"]
+    assert run_all(use_cache=False) == ["s_a", "s_b"]
+
+
+def test_run_all_suites_failing_suite(make_suite, capsys):
+    ok_dir = make_etl_suite(make_suite, "s_ok", {"CsvExtractor": {}})
+    failing_dir = make_etl_suite(make_suite, "s_failing", {"MissingExtractor": {}})
+
+    with pytest.raises(RuntimeError, match=r"1 of 2 suites failed: \['s_failing_1700000000'\]"):
+        etl_base.run_all_suites(n_suite_workers=2)
+
+    out = capsys.readouterr().out
+    assert f"========== suite=s_failing id={SUITE_ID} (FAILED) ==========" in out
+    assert "ValueError: extractor not found: MissingExtractor" in out
+
+    # the other suite is processed
+    assert os.path.isfile(os.path.join(ok_dir, "etl_results", etl_cache.STAMP_FILE))
+    assert not os.path.isfile(os.path.join(failing_dir, "etl_results", etl_cache.STAMP_FILE))
+
+    # the next run skips the processed suite (-> the failing suite runs in this process)
+    with pytest.raises(ValueError, match="extractor not found: MissingExtractor"):
+        etl_base.run_all_suites(n_suite_workers=2)
+    assert f"skip suite=s_ok id={SUITE_ID}" in capsys.readouterr().out
+
+
+def test_step_cache(make_suite, tmp_path, monkeypatch):
+    suite_dir = make_suite(SUITE, SUITE_ID, latency_results(n_runs=2, n_reps=2))
+    etl_output_dir = str(tmp_path / "out")
+
+    calls = []
+    extract = etl_base.extract
+    apply_df_transformer = etl_base._apply_pandas_df_transformer
+
+    def counting_extract(**kwargs):
+        calls.append("extract")
+        return extract(**kwargs)
+
+    def counting_apply_df_transformer(df, func_name, args):
+        calls.append(f"df.{func_name}")
+        return apply_df_transformer(df, func_name, args)
+
+    monkeypatch.setattr(etl_base, "extract", counting_extract)
+    monkeypatch.setattr(etl_base, "_apply_pandas_df_transformer", counting_apply_df_transformer)
+
+    def run(pipeline, **kwargs):
+        calls.clear()
+        return run_etl({"p": pipeline}, etl_output_dir, return_df=True, **kwargs)["p"]
+
+    pipeline = {"extractors": {"CsvExtractor": {}}, "transformers": copy.deepcopy(STREAMING_TRANSFORMERS)}
+    expected = run(pipeline)
+    assert calls == ["extract", "df.query", "df.astype", "df.sort_values"]
+
+    # unchanged -> the df after the last step
+    pd.testing.assert_frame_equal(run(pipeline), expected)
+    assert calls == []
+
+    # a loader only uses the df after the last step
+    run_etl({"p": {**pipeline, "loaders": {"CsvSummaryLoader": {}}}}, etl_output_dir)
+    assert os.path.isfile(os.path.join(etl_output_dir, "p.csv"))
+
+    # a changed last step -> resumes from the df after the previous step
+    pipeline["transformers"][-1] = {"df.sort_values": {"by": ["run", "op"], "ascending": False, "ignore_index": True}}
+    expected = run(pipeline, use_cache=False)
+    pd.testing.assert_frame_equal(run(pipeline), expected)
+    assert calls == ["df.sort_values"]
+
+    # (only the dfs of the current steps are kept)
+    step_cache_dir = os.path.join(etl_cache.get_step_cache_dir(etl_output_dir), "p")
+    assert len(os.listdir(step_cache_dir)) == len(pipeline["transformers"])
+
+    # changed results -> all steps
+    with open(os.path.join(suite_dir, "exp", "run_0", "rep_0", "small", "host_0", "out.csv"), "w") as f:
+        f.write("op,lat\nget,100\n")
+    df = run(pipeline)
+    assert calls == ["extract", "df.query", "df.astype", "df.sort_values"]
+    assert df.loc[df["run"] == 0, "lat_count"].tolist() == [20, 21]
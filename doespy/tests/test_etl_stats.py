@@ -0,0 +1,61 @@
+import json
+
+from doespy.etl import etl_stats
+
+
+def test_record_and_merge():
+    rep_a, rep_b = {}, {}
+    etl_stats.record(rep_a, "CsvExtractor", files=1, bytes=100, rows=10, time_s=0.5)
+    etl_stats.record(rep_a, "CsvExtractor", files=1, cached_files=1, rows=5)
+    etl_stats.record(rep_b, "CsvExtractor", files=1, bytes=50, rows=1, time_s=0.25)
+    etl_stats.record(rep_b, "ErrorExtractor", files=2, bytes=0)
+
+    exp = {}
+    etl_stats.merge(exp, rep_a)
+    etl_stats.merge(exp, rep_b)
+    assert exp == {
+        "CsvExtractor": {"files": 3, "cached_files": 1, "bytes": 150, "rows": 16, "time_s": 0.75},
+        "ErrorExtractor": {"files": 2, "cached_files": 0, "bytes": 0, "rows": 0, "time_s": 0},
+    }
+
+    # e.g., the stats of a worker process
+    extract_stats = {"s_1/exp_a": {"CsvExtractor": dict(exp["CsvExtractor"])}}
+    etl_stats.merge_exps(extract_stats, {"s_1/exp_a": exp, "s_1/exp_b": rep_b})
+    assert extract_stats["s_1/exp_a"]["CsvExtractor"]["files"] == 6
+    assert extract_stats["s_1/exp_a"]["ErrorExtractor"]["files"] == 2
+    assert extract_stats["s_1/exp_b"] == rep_b
+
+
+def test_summary(tmp_path):
+    assert etl_stats.summary({}) == "no results extracted"
+
+    extract_stats = {
+        "s_1/exp_a": {
+            "CsvExtractor": {"files": 2, "cached_files": 0, "bytes": 2 * 1024**2, "rows": 20, "time_s": 1.0},
+            "ErrorExtractor": {"files": 2, "cached_files": 0, "bytes": 0, "rows": 0, "time_s": 0},
+        },
+        "s_1/exp_b": {
+            etl_stats.FRAME_CACHE: {"files": 0, "cached_files": 0, "bytes": 0, "rows": 20, "time_s": 0.01},
+            "CsvExtractor": {"files": 1, "cached_files": 1, "bytes": 1024**2, "rows": 10, "time_s": 3.0},
+        },
+    }
+
+    df = etl_stats.to_df(extract_stats)
+    assert list(df.columns) == ["experiment", "extractor", "files", "cached_files", "bytes", "rows", "time_s"]
+    assert len(df) == 4
+
+    lines = etl_stats.summary(extract_stats).split("\n")
+    assert lines[0] == "ETL extraction stats per extractor:"
+    assert lines[1].split() == ["extractor", "files", "cached_files", "rows", "time_s", "MB", "MB/s"]
+    # (sorted by time, the throughput of an extractor without time is NaN)
+    assert lines[2].split() == ["CsvExtractor", "3", "1", "30", "4.00", "3.00", "0.75"]
+    assert lines[4].split() == ["ErrorExtractor", "2", "0", "0", "0.00", "0.00", "NaN"]
+
+    i = lines.index("ETL extraction stats per experiment (top 10 by time):")
+    assert lines[i + 2].split()[:2] == ["s_1/exp_b", "CsvExtractor"]
+    assert len(lines) == i + 2 + 4
+
+    path = tmp_path / "stats" / "etl_stats.json"
+    etl_stats.dump_json(extract_stats, str(path))
+    with open(path, "r") as f:
+        assert json.load(f) == extract_stats
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from doespy.etl.steps.transformers import GroupByAggTransformer
+
+
+def _chunks(df, n_chunks):
+    return (df.iloc[i::n_chunks] for i in range(n_chunks))
+
+
+@pytest.mark.parametrize("offset", [0, 1e9])
+@pytest.mark.parametrize("n_chunks", [7, 150])  # (150 -> the partials are combined in between)
+def test_groupby_agg_chunks_match_transform(offset, n_chunks):
+    rng = np.random.default_rng(0)
+    n = 3000
+    df = pd.DataFrame({
+        "run": rng.integers(0, 4, n),
+        "host_type": rng.choice(["client", "server"], n),
+        "lat": offset + rng.normal(0, 1e-3, n),
+    })
+    # a group with a single value and a group without values
+    df = pd.concat([df, pd.DataFrame({"run": [10, 11, 11], "host_type": ["client"] * 3, "lat": [offset, np.nan, np.nan]})], ignore_index=True)
+
+    agg_functions = ["mean", "min", "max", "std", "var", "count", "sum"]
+    transformer = GroupByAggTransformer(name="GroupByAggTransformer", data_columns=["lat"], groupby_columns=["run", "host_type"], agg_functions=agg_functions)
+
+    expected = transformer.transform(df, options={})
+    actual = transformer.transform_chunks(_chunks(df, n_chunks), options={})
+
+    expected = expected.sort_values(["run", "host_type"]).reset_index(drop=True)
+    actual = actual.sort_values(["run", "host_type"]).reset_index(drop=True)[expected.columns]
+    # (with the offset, the values themselves are only accurate to ~1e-7)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, rtol=1e-4)
+
+    # the std is ~1e-3 independent of the offset
+    assert actual["lat_std"].iloc[0] == pytest.approx(1e-3, rel=0.1)
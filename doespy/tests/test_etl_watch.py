@@ -0,0 +1,169 @@
+import json
+import os
+import signal
+import time
+
+from doespy import util
+from doespy.etl import etl_base, etl_watch
+
+
+SUITE = "synthetic"
+SUITE_ID = "1700000000"
+
+
+def test_watch_heartbeat_during_etl(results_dir, monkeypatch):
+    # the ETL run takes longer than the timeout of the heartbeat
+    monkeypatch.setattr(etl_watch, "SERVICE_TIMEOUT_S", 0.3)
+    service_path = os.path.join(results_dir, etl_watch.WATCH_DIR, etl_watch.SERVICE_FILE)
+
+    runs = []
+    mtimes = []
+
+    def long_etl(suite, suite_id, **kwargs):
+        runs.append((suite, suite_id))
+        with open(service_path, "r") as f:
+            assert json.load(f)["timeout_s"] == 0.3
+        for _ in range(10):
+            time.sleep(0.1)
+            mtimes.append(os.stat(service_path).st_mtime_ns)
+        raise KeyboardInterrupt()  # (stops the service)
+
+    monkeypatch.setattr(etl_watch, "_run_suite", long_etl)
+
+    etl_watch.notify(SUITE, SUITE_ID)
+
+    handler = signal.getsignal(signal.SIGTERM)
+    try:
+        etl_watch.watch(poll_interval=0.01, debounce=0, watch_results=False)
+    finally:
+        signal.signal(signal.SIGTERM, handler)
+
+    assert runs == [(SUITE, SUITE_ID)]
+    # heartbeats every 0.05s during the 1s run
+    assert len(set(mtimes)) >= 5
+    assert not os.path.exists(service_path)
+
+
+def test_results_signatures_only_list_changed_suites(make_suite, monkeypatch):
+    suite_dir = make_suite(SUITE, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": "a\n1\n"}}})
+    manifest_path = os.path.join(suite_dir, util.RESULTS_MANIFEST_FILE)
+    with open(manifest_path, "w") as f:
+        f.write(json.dumps({"manifest_version": 1, "complete": True}) + "\n")
+
+    # (the suite design is only loaded to list the directories of the suite)
+    listed = []
+    get_experiments = util.get_does_result_experiments
+    monkeypatch.setattr(util, "get_does_result_experiments", lambda suite, suite_id: listed.append(suite) or get_experiments(suite, suite_id))
+
+    signatures = etl_watch._results_signatures({})
+    assert len(listed) == 1
+
+    # unchanged -> the previous signature is reused
+    assert etl_watch._results_signatures(signatures) == signatures
+    assert len(listed) == 1
+
+    # a collected job: new rep dir + manifest entry
+    os.makedirs(os.path.join(suite_dir, "exp", "run_0", "rep_1", "small", "host_0"))
+    with open(manifest_path, "a") as f:
+        f.write(json.dumps({"exp_name": "exp", "run": "run_0", "rep": "rep_1"}) + "\n")
+
+    new_signatures = etl_watch._results_signatures(signatures)
+    assert len(listed) == 2
+    assert new_signatures[(SUITE, SUITE_ID)][1] != signatures[(SUITE, SUITE_ID)][1]
+
+
+def test_run_all_suites_with_watch_dir(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": "a\n1\n"}}})
+    design = util.load_config_yaml(suite_dir, file="suite_design.yml")
+    design["$ETL$"] = {"p": {"experiments": ["exp"], "extractors": {"CsvExtractor": {}}, "transformers": [], "loaders": {}}}
+    with open(os.path.join(suite_dir, "suite_design.yml"), "w") as f:
+        json.dump(design, f)
+
+    # the drop file of a request creates the watch dir in the results dir
+    etl_watch.notify(SUITE, SUITE_ID)
+    assert os.path.isdir(etl_watch.get_watch_dir())
+
+    assert util.get_does_results() == [{"suite": SUITE, "suite_id": SUITE_ID}]
+
+    for use_cache in [False, True]:
+        etl_base.run_all_suites(use_cache=use_cache)
+
+
+def test_results_signatures_without_manifest(make_suite, monkeypatch):
+    suite_dir = make_suite(SUITE, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": "a\n1\n"}}})
+
+    signatures = etl_watch._results_signatures({})
+    stamp, sig = signatures[(SUITE, SUITE_ID)]
+    assert stamp is None
+    assert etl_watch._results_signatures(signatures) == signatures
+
+    # a new rep (the dirs are listed: no manifest)
+    os.makedirs(os.path.join(suite_dir, "exp", "run_0", "rep_1"))
+    assert etl_watch._results_signatures(signatures)[(SUITE, SUITE_ID)][1] != sig
+
+    # a changed result file (or etl results) does not change the signature
+    signatures = etl_watch._results_signatures(signatures)
+    with open(os.path.join(suite_dir, "exp", "run_0", "rep_0", "small", "host_0", "out.csv"), "w") as f:
+        f.write("a\n2\n")
+    os.makedirs(os.path.join(suite_dir, "etl_results"))
+    assert etl_watch._results_signatures(signatures) == signatures
+
+
+class _Clock:
+    """Replaces the time module in the watch service: each poll advances the time by 1s and runs the `events` of that time."""
+
+    def __init__(self, events, stop):
+        self.now = 0
+        self.events = events
+        self.stop = stop
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, _seconds):
+        self.now += 1
+        if self.now >= self.stop:
+            raise KeyboardInterrupt()
+        if self.now in self.events:
+            self.events[self.now]()
+
+
+def test_watch_debounce(make_suite, monkeypatch):
+    suite_dirs = {suite: make_suite(suite, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": "a\n1\n"}}}) for suite in ["s_a", "s_b"]}
+
+    clock = _Clock(events={
+        # a new rep of s_b (without a request)
+        2: lambda: os.makedirs(os.path.join(suite_dirs["s_b"], "exp", "run_0", "rep_1")),
+        # another request for s_a restarts the debounce
+        3: lambda: etl_watch.notify("s_a", SUITE_ID),
+    }, stop=12)
+    monkeypatch.setattr(etl_watch, "time", clock)
+
+    runs = []
+    monkeypatch.setattr(etl_watch, "_run_suite", lambda suite, suite_id, **kwargs: runs.append((suite, clock.now)))
+
+    etl_watch.notify("s_a", SUITE_ID)
+
+    handler = signal.getsignal(signal.SIGTERM)
+    try:
+        etl_watch.watch(poll_interval=1, debounce=5)
+    finally:
+        signal.signal(signal.SIGTERM, handler)
+
+    # each suite once, 5s after its last event
+    assert runs == [("s_b", 7), ("s_a", 8)]
+    assert os.listdir(etl_watch.get_watch_dir()) == []
+
+
+def test_watch_run_suite_failure(make_suite, capsys):
+    # no etl pipelines in the suite design
+    suite_dir = make_suite(SUITE, SUITE_ID, {"exp": {(0, 0): {"small/host_0/out.csv": "a\n1\n"}}})
+
+    etl_watch._run_suite(SUITE, SUITE_ID, use_cache=False)
+
+    assert f"<== etl failed: suite={SUITE} id={SUITE_ID}" in capsys.readouterr().out
+    with open(os.path.join(suite_dir, "ETL_ERROR.log"), "r") as f:
+        assert "KeyError: '$ETL$'" in f.read()
@@ -0,0 +1,145 @@
+import json
+import os
+import shutil
+import time
+
+from doespy import status, util
+
+
+SUITE = "synthetic"
+SUITE_ID = "1700000000"
+
+# 12 hosts of the same type: host_10 and host_11 are listed before host_2 in lexicographic order
+RESULTS = {
+    "exp": {(run, rep): {f"server/host_{k}/out.csv": "a\n1\n" for k in range(12)} for run in range(2) for rep in range(2)},
+}
+
+
+def write_manifest(suite_dir):
+    """Writes the manifest of the results as the `collect_results` module of the experiment-job role
+    (the result directories are older than the manifest)."""
+
+    entries = [{"manifest_version": 1, "complete": True}]
+    for exp, reps in RESULTS.items():
+        for (run, rep), files in reps.items():
+            for file in files:
+                host_type, host, name = file.split("/")
+                entries.append({
+                    "exp_name": exp,
+                    "run": f"run_{run}",
+                    "rep": f"rep_{rep}",
+                    "host_type": host_type,
+                    "host": host,
+                    "host_idx": int(host.split("_")[-1]),
+                    "files": [{"name": name, "size": 4}],
+                })
+
+    # in reverse order (i.e., not in the order of the directory listing)
+    path = os.path.join(suite_dir, util.RESULTS_MANIFEST_FILE)
+    with open(path, "w") as f:
+        f.writelines(json.dumps(entry) + "\n" for entry in entries[:1] + entries[:0:-1])
+
+    # (the mtime of a directory that is modified later is newer, independent of the mtime granularity)
+    past_ns = time.time_ns() - 10 * 10**9
+    for dirpath, _, _ in os.walk(suite_dir):
+        os.utime(dirpath, ns=(past_ns, past_ns))
+    os.utime(path, ns=(past_ns + 10**9, past_ns + 10**9))
+
+
+def test_manifest_index_matches_scandir(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    write_manifest(suite_dir)
+
+    manifest_index = util.get_suite_results_manifest_index(suite_dir)
+    assert manifest_index is not None
+
+    scandir_index = util.get_suite_results_index(suite_dir, persist=False)
+
+    walk = sorted(util.walk_suite_results(scandir_index))
+    assert sorted(util.walk_suite_results(manifest_index)) == walk
+    assert len(walk) == 4 * 12
+
+    # host_idx is the index of the host (not its position in the lexicographic order)
+    assert all(host == f"host_{host_idx}" for _, _, _, _, host_idx, host, _ in walk)
+
+
+def test_manifest_index_deleted_rep(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    write_manifest(suite_dir)
+
+    shutil.rmtree(os.path.join(suite_dir, "exp", "run_1", "rep_0"))
+
+    # -> fallback to the scandir index
+    assert util.get_suite_results_manifest_index(suite_dir) is None
+
+
+def test_manifest_index_added_file(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    write_manifest(suite_dir)
+
+    with open(os.path.join(suite_dir, "exp", "run_0", "rep_1", "server", "host_3", "extra.csv"), "w") as f:
+        f.write("a\n2\n")
+
+    assert util.get_suite_results_manifest_index(suite_dir) is None
+
+    index = util.get_suite_results_index(suite_dir, persist=False)
+    assert ("exp", "run_0", "rep_1", "server", 3, "host_3", "extra.csv") in util.walk_suite_results(index)
+
+
+def test_scandir_index_incremental(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    # (the persisted index reuses the listing of directories with an unchanged mtime)
+    past_ns = time.time_ns() - 10 * 10**9
+    for dirpath, _, _ in os.walk(suite_dir):
+        os.utime(dirpath, ns=(past_ns, past_ns))
+
+    index = util.get_suite_results_index(suite_dir)
+    assert len(list(util.walk_suite_results(index))) == 4 * 12
+
+    os.remove(os.path.join(suite_dir, "exp", "run_0", "rep_0", "server", "host_0", "out.csv"))
+    shutil.rmtree(os.path.join(suite_dir, "exp", "run_1"))
+
+    index = util.get_suite_results_index(suite_dir)
+    files = list(util.walk_suite_results(index))
+    assert len(files) == 2 * 12 - 1
+    assert not any(run == "run_1" for _, run, *_ in files)
+
+
+def test_manifest_index_same_mtime(make_suite):
+    # a file system with a coarse mtime granularity:
+    #   a file is added to a host dir within the same mtime as the last manifest entry
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    write_manifest(suite_dir)
+
+    manifest_mtime_ns = os.stat(os.path.join(suite_dir, util.RESULTS_MANIFEST_FILE)).st_mtime_ns
+    host_dir = os.path.join(suite_dir, "exp", "run_1", "rep_1", "server", "host_10")
+    with open(os.path.join(host_dir, "late.csv"), "w") as f:
+        f.write("a\n3\n")
+    os.utime(host_dir, ns=(manifest_mtime_ns, manifest_mtime_ns))
+
+    assert util.get_suite_results_manifest_index(suite_dir) is None
+
+
+def test_manifest_index_state_file(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    write_manifest(suite_dir)
+
+    # the playbook updates the state of the experiment after collecting the results
+    with open(os.path.join(suite_dir, "exp", "state.yml"), "w") as f:
+        f.write("jobs_finished: []\n")
+
+    index = util.get_suite_results_manifest_index(suite_dir)
+    assert index is not None
+    assert len(list(util.walk_suite_results(index))) == 4 * 12
+
+
+def test_status_does_not_write(make_suite):
+    suite_dir = make_suite(SUITE, SUITE_ID, RESULTS)
+    with open(os.path.join(suite_dir, "exp", "state.yml"), "w") as f:
+        f.write("exp_job_ids: [1, 2]\nexp_job_ids_unfinished: [2]\nexp_job_ids_finished: [1]\n")
+
+    suite_status, etl_error = status.get_suite_status(suite_dir)
+    assert suite_status == {"exp": {"n_jobs": 2, "n_jobs_unfinished": 1, "n_jobs_finished": 1, "is_complete": False}}
+    assert etl_error is None
+
+    assert not os.path.exists(os.path.join(suite_dir, util.ETL_CACHE_DIR))
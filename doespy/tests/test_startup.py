@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# the modules that the CLIs must not import at startup
+#  (matplotlib is only imported when a plot is created, ansible only runs the playbook)
+DEFERRED_MODULES = ["matplotlib", "ansible", "pyfiglet", "requests", "distutils"]
+
+# module of the CLI -> additionally deferred modules
+CLI_MODULES = {
+    "doespy.status": ["pandas", "pydantic"],  # make status
+    "doespy.info": ["pandas"],  # make info
+    "doespy.design.validate_extend": ["pandas"],  # make design
+    "doespy.etl.etl": [],  # make etl
+    "doespy.etl.super_etl": [],  # make etl-super
+}
+
+
+def measure_import(module):
+    """Imports the `module` in a new interpreter (python -X importtime).
+
+    Returns:
+        Tuple[float, set]: the cumulative import time of the module in seconds and the names of all imported modules
+    """
+
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONWARNINGS": "ignore"},
+    ).stderr
+
+    imported = set()
+    import_time_s = None
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if cumulative_us.strip() == "cumulative":
+            continue  # header
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            import_time_s = int(cumulative_us) / 10**6
+
+    return import_time_s, imported
+
+
+@pytest.mark.parametrize("module", list(CLI_MODULES.keys()))
+def test_startup_imports(module):
+    deferred = CLI_MODULES[module]
+
+    import_time_s, imported = measure_import(module)
+    # (the import time depends on the machine -> only reported, see `make test-startup`)
+    print(f"{module}: {import_time_s:.3f}s")
+
+    eager = sorted({m.split(".")[0] for m in imported} & set(DEFERRED_MODULES + deferred))
+    assert not eager, f"{module} imports {eager} at startup (import them where they are needed)"
@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+import ruamel.yaml
+
+from doespy import util
+
+
+CONFIG = {"run": 1, "nested": {"a": [1, 2.5, "x"], "flag": True, "none": None}}
+
+
+@pytest.mark.parametrize("file", ["config.json", "suite_design.yml"])
+def test_load_config_yaml_matches_ruamel(tmp_path, file):
+    path = tmp_path / file
+    with open(path, "w") as f:
+        if file.endswith(".json"):
+            json.dump(CONFIG, f)
+        else:
+            ruamel.yaml.YAML().dump(CONFIG, f)
+
+    with open(path, "r") as f:
+        expected = ruamel.yaml.YAML(typ="safe", pure=True).load(f)
+
+    assert util.load_config_yaml(str(tmp_path), file=file) == expected == CONFIG
+
+
+def test_load_config_yaml_memo(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG))
+
+    config = util.load_config_yaml(str(tmp_path))
+    # the caller receives its own copy (e.g., the etl removes keys from the config)
+    config["nested"]["a"].append(3)
+    del config["run"]
+    assert util.load_config_yaml(str(tmp_path)) == CONFIG
+
+    # a changed file is loaded again
+    path.write_text(json.dumps({"run": 2}))
+    os.utime(path, ns=(0, 0))
+    assert util.load_config_yaml(str(tmp_path)) == {"run": 2}
+
+    with pytest.raises(FileNotFoundError):
+        util.load_config_yaml(str(tmp_path), file="missing.json")
@@ -3,7 +3,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import os, json, subprocess, warnings
+import os, json, shlex, subprocess, warnings, time
 
 
 DOCUMENTATION = r'''
@@ -37,6 +37,76 @@ def jobid2workingdir(job_id, base):
     return exp_working_dir
 
 
+# the manifest lists all collected result files of a suite  (s.t. the etl does not need to list all directories)
+MANIFEST_FILE = ".manifest.jsonl"
+
+
+def init_manifest(suite_dir):
+
+    """
+    Creates the results manifest of the suite (if it does not exist yet).
+
+    The manifest is only complete if no results were collected before the manifest was created
+    (e.g., a suite that started with an older version of the doe-suite).
+
+    return: path to the manifest
+    """
+
+    manifest_path = os.path.join(suite_dir, MANIFEST_FILE)
+
+    if not os.path.isfile(manifest_path):
+        has_results = os.path.isdir(suite_dir) and any(
+            x.startswith("run_")
+            for exp in os.listdir(suite_dir) if os.path.isdir(os.path.join(suite_dir, exp))
+            for x in os.listdir(os.path.join(suite_dir, exp))
+        )
+        append_manifest(manifest_path, {"manifest_version": 1, "complete": not has_results})
+
+    return manifest_path
+
+
+def append_manifest(manifest_path, entry):
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    # a single write of a complete line in append mode -> concurrent writers do not interleave
+    with open(manifest_path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+# compression commands available on the remote host  (the etl decompresses the result files transparently)
+COMPRESS_CMDS = {
+    "gz": "gzip -f",
+    "xz": "xz -f -T0",
+    "zst": "zstd -q -f --rm",
+}
+
+# result files that are not compressed:
+#   compressed formats (little gain) and binary formats that the etl reads memory-mapped (without decompression)
+SKIP_COMPRESS_SUFFIXES = [
+    *COMPRESS_CMDS.keys(), "bz2", "lz4", "zip", "7z", "tgz",
+    "npy", "npz", "parquet", "arrow", "feather", "pkl", "pickle",
+    "png", "jpg", "jpeg", "pdf",
+]
+
+
+def compress_remote_results(host, ssh_port_args, remote_results_dir, compression, min_size):
+
+    """
+    Compresses the result files (larger than `min_size` bytes) of a job on the remote host before they are fetched.
+
+    Files that are already compressed (e.g., by an earlier attempt to collect the results) and binary formats are skipped
+    (see `SKIP_COMPRESS_SUFFIXES`).
+    """
+
+    skip_suffixes = " ".join(f"! -iname '*.{suffix}'" for suffix in SKIP_COMPRESS_SUFFIXES)
+    cmd = f"find {shlex.quote(remote_results_dir)} -type f -size +{min_size}c {skip_suffixes} -exec {COMPRESS_CMDS[compression]} {{}} +"
+
+    try:
+        subprocess.run(["ssh"] + ssh_port_args + [host, cmd], check=True)
+    except subprocess.CalledProcessError as e:
+        # the results are still fetched (uncompressed)
+        warnings.warn(f"Failed to compress results on the remote host with return code {e.returncode}   dir={remote_results_dir}")
+
+
 def run_module():
     # define available arguments/parameters a user can pass to the module
     module_args = dict(
@@ -44,6 +114,8 @@ def run_module():
         exp_host_lst=dict(type='list', required=True),
         local_result_dir=dict(type='str', required=True),
         remote_result_dir=dict(type='str', required=True),
+        compress_results=dict(type='str', required=False, default='none', choices=['none'] + list(COMPRESS_CMDS.keys())),
+        compress_min_size=dict(type='int', required=False, default=64 * 1024),
     )
 
     result = dict(
@@ -66,6 +138,8 @@ def run_module():
 
     for job_id in module.params["job_ids_ready_to_collect_results"]:
 
+        suite_dir = os.path.join(module.params["local_result_dir"], f"{job_id['suite']}_{job_id['suite_id']}")
+        manifest_path = init_manifest(suite_dir)
 
         local_results_dir_base = jobid2workingdir(job_id, module.params["local_result_dir"])
         remote_results_dir = os.path.join(jobid2workingdir(job_id, module.params["remote_result_dir"]), "results")
@@ -81,6 +155,14 @@ def run_module():
             # fetch results
             server_port = my_host.get('public_port', 22)
             nonstandard_port = ['-e', f'ssh -p {server_port}'] if server_port != 22 else []
+
+            if module.params["compress_results"] != "none":
+                compress_remote_results(host=my_host['public_dns_name'],
+                                        ssh_port_args=['-p', str(server_port)] if server_port != 22 else [],
+                                        remote_results_dir=remote_results_dir,
+                                        compression=module.params["compress_results"],
+                                        min_size=module.params["compress_min_size"])
+
             src_path = f"{my_host['public_dns_name']}:{remote_results_dir}/*"
             try:
                 # -L is needed to follow symlinks
@@ -89,8 +171,8 @@ def run_module():
                 warnings.warn(f"Rsync command failed to fetch results with return code {e.returncode}   dir={local_results_dir}")
                 raise e
 
-
             # fetch config.json from first host
+            #   (before the manifest entry: the rep dir must not change after the entry, see `util.get_suite_results_manifest_index`)
             if i == 0:
                 src_path = f"{my_host['public_dns_name']}:{remote_config_file}"
                 try:
@@ -99,6 +181,26 @@ def run_module():
                     warnings.warn(f"Rsync command failed to fetch config.json with return code {e.returncode}")
                     raise e
 
+            # record the fetched result files in the manifest
+            files = []
+            with os.scandir(local_results_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        files.append({"name": entry.name, "size": entry.stat().st_size})
+
+            append_manifest(manifest_path, {
+                "job_id": job_id,
+                "exp_name": job_id["exp_name"],
+                "run": f"run_{job_id['exp_run']}",
+                "rep": f"rep_{job_id['exp_run_rep']}",
+                "host_type": my_host["host_type"],
+                "host": f"host_{my_host['exp_host_type_idx']}",
+                "host_idx": my_host["exp_host_type_idx"],
+                "files": files,
+                "fetched_at": time.time(),
+            })
+
+
         changed = True
 
 